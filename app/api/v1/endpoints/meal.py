@@ -1,21 +1,36 @@
-from fastapi import APIRouter, HTTPException, Query, Depends, BackgroundTasks
-from datetime import date, datetime
+from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from datetime import date, datetime, timedelta
 from typing import Optional, List
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.schemas.meal import (
     RestaurantDetailInfo, MealInDB, FlexibleMealResponse, RestaurantMeals,
     RestaurantsDetailResponse
 )
-from app.services.meal_service import meal_service
+from app.services.meal_service import meal_service, get_upstream_status
 from app.services.meal_fetcher import meal_fetcher
+from app.services.ingestion_jobs import ingestion_job_runner
+from app.services.db_lease import meal_fetch_lease
+from app.services.leader_election import scheduler_leader
+from app.services.fetch_queue import fetch_queue_worker
+from app.services.live_parse_service import live_parse_service
+from app.services.fetch_planner import fetch_planner
+from app.services.parse_result_cache import parse_result_cache
+from app.services.meal_response_cache import meal_response_cache
 from app.db.session import get_db
 from app.crud import meal as crud_meal
 from app.core.config import settings
 from app.api.dependencies import AdminAuth
+from app.utils.resilience import CircuitOpenError, RateLimitWaitTimeout
 
 router = APIRouter()
 
+# 응답에서 제외할 내부 컬럼 (중복 판별용 해시)
+MEAL_RESPONSE_EXCLUDE = {"content_hash"}
+
 
 @router.get("/", summary="급식 정보 조회")
 async def get_meals_flexible(
@@ -58,6 +73,8 @@ async def get_meals_flexible(
     - `/api/v1/meals?meal_types=2,3` - 오늘의 모든 식당의 중식과 석식만 (숫자 사용)
     - `/api/v1/meals?restaurant_codes=re11&meal_types=중식` - 오늘의 교직원식당 중식만
     - `/api/v1/meals?restaurant_codes=re11&meal_types=2` - 오늘의 교직원식당 중식만 (숫자 사용)
+    
+    응답은 (날짜, 식당 코드, 식사 종류)별로 캐시되며, 수집이나 평점 변경으로 해당 날짜의 데이터가 바뀌면 무효화됩니다.
     """
     # 날짜가 지정되지 않은 경우 오늘 날짜 사용
     today = datetime.now()
@@ -108,6 +125,13 @@ async def get_meals_flexible(
                 detail=f"잘못된 식당 코드입니다: {invalid_codes}. 사용 가능한 코드: {list(settings.RESTAURANT_CODES.keys())}"
             )
     
+    # 캐시된 응답 (직렬화된 JSON)
+    cache_key = meal_response_cache.make_key(target_date, restaurant_codes_list, meal_types_list)
+    cached_body = meal_response_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+    generation = meal_response_cache.generation
+    
     try:
         # DB에서 급식 정보 조회
         meals = crud_meal.get_meals_flexible(db, target_date, restaurant_codes_list, meal_types_list)
@@ -131,8 +155,10 @@ async def get_meals_flexible(
             if not day_of_week and meal.day_of_week:
                 day_of_week = meal.day_of_week
             
-            # 식사 종류별로 분류
-            restaurants_data[restaurant_code][meal.meal_type].append(meal)
+            # 식사 종류별로 분류 (내부 컬럼 제외)
+            restaurants_data[restaurant_code][meal.meal_type].append(
+                jsonable_encoder(meal, exclude=MEAL_RESPONSE_EXCLUDE)
+            )
         
         # 응답 데이터 구성
         restaurants_list = []
@@ -170,11 +196,14 @@ async def get_meals_flexible(
                     restaurant_meal_data[meal_type] = []
                 restaurants_list.append(restaurant_meal_data)
         
-        return {
+        # 세션이 열려 있는 동안 직렬화해서 캐시
+        response = JSONResponse(content=jsonable_encoder({
             "date": target_date.strftime("%Y. %m. %d"),
             "day_of_week": day_of_week,
             "restaurants": restaurants_list
-        }
+        }))
+        meal_response_cache.put(cache_key, response.body, generation)
+        return response
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
@@ -268,40 +297,34 @@ async def parse_meal_from_web(
     restaurant_code: str,
     year: int = Query(..., description="년도"),
     month: int = Query(..., description="월"),
-    day: int = Query(..., description="일"),
-    db: Session = Depends(get_db)
+    day: int = Query(..., description="일")
 ):
     """
     한양대 웹사이트에서 직접 급식 정보를 파싱하여 반환합니다.
     DB에 저장하지 않고 실시간으로 파싱합니다.
     
+    같은 식당/날짜에 대한 동시 요청은 한양대 서버 요청 하나를 공유하며,
+    결과는 잠시 캐시됩니다. 한양대 서버 오류 시에는 직전 결과를 반환합니다.
+    요청과 파싱은 이벤트 루프를 막지 않으므로 다른 API 응답 속도에 영향을 주지 않습니다.
+    
     - restaurant_code: 식당 코드 (re11, re12, re13, re15)
     - year, month, day: 조회할 날짜
     """
-    # 식당 코드 유효성 검사
-    restaurant = crud_meal.get_restaurant_by_code(db, restaurant_code)
-    if not restaurant:
+    # 식당 코드 유효성 검사 (DB 조회 없이 설정 기준)
+    restaurant_name = settings.RESTAURANT_CODES.get(restaurant_code)
+    if not restaurant_name:
         raise HTTPException(status_code=404, detail="잘못된 식당 코드입니다.")
     
     try:
-        # 웹에서 직접 파싱
-        from app.services.meal_service import meal_service
-        from app.services.html_parser import HTMLParser
-        
-        html_parser = HTMLParser()
+        # 웹에서 직접 파싱 (동시 요청 공유 + 짧은 TTL 캐시)
+        parsed_data = await live_parse_service.get_parsed_meals(restaurant_code, year, month, day)
         
-        # 한양대 서버에서 HTML 가져오기
-        html_content = meal_service.get_meal_html(restaurant_code, year, month, day)
-        
-        if not html_content:
+        if not parsed_data:
             raise HTTPException(status_code=404, detail="급식 정보를 찾을 수 없습니다.")
         
-        # HTML 파싱
-        parsed_data = html_parser.parse_meal_html(html_content)
-        
         # 응답 형식으로 변환
         response_data = {
-            "restaurant": restaurant.name,
+            "restaurant": restaurant_name,
             "date": parsed_data.get("date", f"{year}. {month:02d}. {day:02d}"),
             "day_of_week": parsed_data.get("day_of_week", ""),
             "조식": [],
@@ -325,28 +348,165 @@ async def parse_meal_from_web(
         
         return response_data
         
+    except HTTPException:
+        raise
+    except CircuitOpenError as e:
+        raise HTTPException(status_code=503, detail=f"한양대 서버가 일시적으로 응답하지 않습니다: {str(e)}")
+    except RateLimitWaitTimeout as e:
+        raise HTTPException(status_code=503, detail=f"요청이 많아 잠시 후 다시 시도해주세요: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"급식 정보 파싱 중 오류가 발생했습니다: {str(e)}")
 
 
-@router.post("/fetch", summary="급식 정보 수집 (관리자용)")
+@router.post("/fetch", summary="급식 정보 수집 (관리자용)", status_code=202)
 async def fetch_meals(
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    force: bool = Query(False, description="변경 여부와 관계없이 모두 다시 파싱/저장"),
     api_key: str = AdminAuth
 ):
     """
     급식 정보를 수동으로 수집합니다. (관리자용)
     
     현재 날짜부터 설정된 기간(기본 14일)의 급식 정보를 한양대 서버에서 가져와 DB에 저장합니다.
-    백그라운드에서 실행되므로 즉시 응답을 받습니다.
+    수집 작업으로 등록되어 즉시 응답을 받으며, 반환된 `job_id`로 `/meals/jobs/{job_id}`에서
+    진행률과 식당별 결과를 확인할 수 있습니다.
+    
+    이전 수집 이후 내용이 바뀌지 않은 날짜(304 응답 또는 동일한 HTML 해시)는
+    파싱/저장을 건너뜁니다. 파서 수정 후 전체를 다시 반영하려면 `force=true`를 사용하세요.
+    
+    **인증 필요**: X-API-Key 헤더에 관리자 API 키를 포함해야 합니다.
+    """
+    job = ingestion_job_runner.submit("fetch", meal_fetcher.default_targets(), force)
+    return {
+        "message": "급식 정보 수집 작업이 등록되었습니다.",
+        "job_id": job.id,
+        "status_url": f"{settings.API_V1_STR}/meals/jobs/{job.id}",
+        "days_ahead": settings.MEAL_FETCH_DAYS_AHEAD,
+        "force": force
+    }
+
+
+@router.post("/refetch", summary="지정 식당/날짜 급식 정보 수집 (관리자용)", status_code=202)
+async def refetch_meals(
+    start_date: date = Query(..., description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD, 생략시 시작 날짜 하루)"),
+    restaurant_codes: Optional[str] = Query(None, description="식당 코드 (콤마로 구분, 생략시 전체)"),
+    force: bool = Query(True, description="변경 여부와 관계없이 모두 다시 파싱/저장"),
+    api_key: str = AdminAuth
+):
+    """
+    지정한 식당과 날짜의 급식 정보만 다시 수집합니다. (관리자용)
+    
+    전체 수집 기간을 다시 돌리지 않고 특정 식당/기간만 갱신할 때 사용합니다.
+    기본값은 `force=true`로, 내용이 바뀌지 않았어도 다시 파싱/저장합니다.
+    기간은 최대 `INGESTION_REFETCH_MAX_DAYS`일(기본 62일)입니다.
+    
+    **인증 필요**: X-API-Key 헤더에 관리자 API 키를 포함해야 합니다.
+    """
+    end_date = end_date or start_date
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="종료 날짜가 시작 날짜보다 빠릅니다.")
+    
+    days = (end_date - start_date).days + 1
+    if days > settings.INGESTION_REFETCH_MAX_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"기간이 너무 깁니다: {days}일 (최대 {settings.INGESTION_REFETCH_MAX_DAYS}일)"
+        )
+    
+    codes = list(settings.RESTAURANT_CODES.keys())
+    if restaurant_codes:
+        codes = [code.strip() for code in restaurant_codes.split(",") if code.strip()]
+        invalid_codes = [code for code in codes if code not in settings.RESTAURANT_CODES]
+        if invalid_codes:
+            raise HTTPException(
+                status_code=400,
+                detail=f"잘못된 식당 코드입니다: {invalid_codes}. 사용 가능한 코드: {list(settings.RESTAURANT_CODES.keys())}"
+            )
+    
+    targets = [
+        (code, start_date + timedelta(days=offset))
+        for code in codes
+        for offset in range(days)
+    ]
+    job = ingestion_job_runner.submit("refetch", targets, force)
+    return {
+        "message": "급식 정보 지정 수집 작업이 등록되었습니다.",
+        "job_id": job.id,
+        "status_url": f"{settings.API_V1_STR}/meals/jobs/{job.id}",
+        "targets": len(targets),
+        "force": force
+    }
+
+
+@router.get("/jobs", summary="급식 수집 작업 목록 (관리자용)")
+async def list_ingestion_jobs(
+    api_key: str = AdminAuth
+):
+    """
+    최근 급식 수집 작업 목록을 조회합니다. (관리자용, 최근 순)
+    
+    식당별 결과를 제외한 상태와 진행률만 반환합니다. 상세 결과는 `/meals/jobs/{job_id}`를 사용하세요.
+    
+    **인증 필요**: X-API-Key 헤더에 관리자 API 키를 포함해야 합니다.
+    """
+    jobs = []
+    for job in ingestion_job_runner.recent():
+        info = job.to_dict()
+        info.pop("result")
+        jobs.append(info)
+    return {"jobs": jobs}
+
+
+@router.get("/jobs/{job_id}", summary="급식 수집 작업 조회 (관리자용)")
+async def get_ingestion_job(
+    job_id: str,
+    api_key: str = AdminAuth
+):
+    """
+    급식 수집 작업의 상태, 진행률, 결과를 조회합니다. (관리자용)
+    
+    - **status**: queued / running / succeeded / failed
+    - **progress**: 처리한 페이지 수 / 전체 페이지 수
+    - **result**: 전체 집계(생성/갱신/변경 없음/삭제 메뉴 수, 수집/건너뜀/실패 일수, 단계별 소요 시간)와
+      `restaurants`의 식당별 같은 집계
+    
+    **인증 필요**: X-API-Key 헤더에 관리자 API 키를 포함해야 합니다.
+    """
+    job = ingestion_job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="수집 작업을 찾을 수 없습니다. (서버 재시작 시 기록이 사라집니다)")
+    return job.to_dict()
+
+
+@router.get("/upstream-status", summary="한양대 서버 요청 상태 조회 (관리자용)")
+async def get_upstream_request_status(
+    api_key: str = AdminAuth
+):
+    """
+    한양대 서버 요청 보호 장치의 상태를 조회합니다. (관리자용)
+    
+    - **circuit**: 서킷 브레이커 상태 (closed / open / half_open), 연속 실패 수, 재시도까지 남은 시간
+    - **rate_limiter**: 현재 초당 요청 한도 (서버 오류 시 자동으로 줄어들고 성공 시 회복)
+    - **transport**: 공용 커넥션 풀 통계 (요청 수, 새 연결 수, keep-alive 재사용 비율)
+    - **parse_cache**: 실시간 파싱 캐시 통계 (적중, 만료 후 반환, 요청 공유 횟수)
+    - **parse_results**: HTML 해시별 파싱 결과 캐시 통계 (모든 수집/파싱 경로 공유, 적중/미스)
+    - **fetch_schedule**: 자동 수집 일일 요청 예산 사용량과 마지막 수집 계획
+    - **fetch_lease**: 수집 락(모든 워커/서버/스크립트 공용)의 현재 보유자와 만료 시간
+    - **scheduler**: 이 프로세스의 스케줄러 리더 여부와 클러스터의 현재 리더
+    - **fetch_queue**: 분산 수집 작업 큐의 상태별 작업 수와 이 프로세스 워커의 처리 수
+    - **meal_responses**: 급식 조회 응답 캐시(이 프로세스) 적중률과 무효화 횟수
     
     **인증 필요**: X-API-Key 헤더에 관리자 API 키를 포함해야 합니다.
     """
-    background_tasks.add_task(meal_fetcher.fetch_and_store_meals, db)
     return {
-        "message": "급식 정보 수집이 백그라운드에서 시작되었습니다.",
-        "days_ahead": settings.MEAL_FETCH_DAYS_AHEAD
+        **get_upstream_status(),
+        "parse_cache": live_parse_service.cache.stats(),
+        "parse_results": parse_result_cache.stats(),
+        "fetch_schedule": fetch_planner.snapshot(),
+        "fetch_lease": meal_fetch_lease.status(),
+        "scheduler": scheduler_leader.status(),
+        "fetch_queue": fetch_queue_worker.stats(),
+        "meal_responses": meal_response_cache.stats()
     }
 
 
@@ -376,68 +536,64 @@ async def fetch_meals(
 
 @router.post("/remove-duplicates", summary="중복 급식 데이터 제거 (관리자용)")
 async def remove_duplicate_meals(
+    dry_run: bool = Query(False, description="삭제하지 않고 중복 수와 미리보기만 반환"),
+    preview_limit: int = Query(20, ge=0, le=500, description="미리보기로 반환할 중복 메뉴 수"),
+    chunk_size: int = Query(1000, ge=1, le=10000, description="한 번에 삭제(커밋)할 행 수"),
     db: Session = Depends(get_db),
     api_key: str = AdminAuth
 ):
     """
     중복된 급식 데이터를 제거합니다. (관리자용)
     
-    동일한 restaurant_id, date, meal_type, korean_name을 가진 중복 데이터를 찾아서
+    동일한 restaurant_id, date, meal_type, content_hash(메뉴명 + 태그)를 가진 중복 데이터를 찾아서
     가장 최신에 생성된 것만 남기고 나머지는 삭제합니다.
+    중복 판별과 삭제 대상 조회는 DB에서 인덱스로 처리하고, chunk_size개씩 나누어 삭제/커밋합니다.
+    
+    migrate_meal_content_hash.py로 unique_meal_content 인덱스를 만든 DB에서는 중복이 생길 수 없어
+    항상 0건입니다. 마이그레이션 전(content_hash는 채웠지만 인덱스가 없는 DB)의 정리용입니다.
     
     **인증 필요**: X-API-Key 헤더에 관리자 API 키를 포함해야 합니다.
     
     **응답**:
     - total_meals_before: 중복 제거 전 총 급식 데이터 수
-    - deleted_count: 삭제된 중복 데이터 수
-    - total_meals_after: 중복 제거 후 총 급식 데이터 수
+    - duplicate_groups: 중복이 있는 메뉴 수
+    - deleted_count: 삭제된 중복 데이터 수 (dry_run이면 삭제될 수)
+    - total_meals_after: 중복 제거 후 총 급식 데이터 수 (dry_run이면 예상 수)
+    - preview: 중복 메뉴 미리보기 (남길 keep_id, 삭제할 delete_ids)
     """
     from app.models.meal import Meal
     
     try:
         # 중복 제거 전 데이터 개수
-        total_before = db.query(Meal).count()
-        
-        # 중복 데이터 찾기 및 제거
-        all_meals = db.query(Meal).order_by(Meal.restaurant_id, Meal.date, Meal.meal_type).all()
-        
-        seen = {}
-        duplicates_to_delete = []
-        
-        for meal in all_meals:
-            # 고유 키 생성
-            key = (
-                meal.restaurant_id,
-                meal.date,
-                meal.meal_type,
-                str(meal.korean_name)  # JSON을 문자열로 변환
-            )
-            
-            if key in seen:
-                # 중복 발견 - 이전 것을 삭제 대상으로 표시
-                duplicates_to_delete.append(seen[key])
-                # 현재 것을 최신으로 갱신
-                seen[key] = meal
-            else:
-                # 처음 본 조합
-                seen[key] = meal
+        total_before = db.query(func.count(Meal.id)).scalar()
+        duplicates = crud_meal.count_duplicate_meals(db)
+        preview = crud_meal.get_duplicate_meal_groups(db, limit=preview_limit) if preview_limit else []
         
-        # 중복 데이터 삭제
-        deleted_count = 0
-        for meal_to_delete in duplicates_to_delete:
-            db.delete(meal_to_delete)
-            deleted_count += 1
+        if dry_run:
+            return {
+                "message": "중복 급식 데이터 미리보기 (삭제하지 않음)",
+                "dry_run": True,
+                "total_meals_before": total_before,
+                "duplicate_groups": duplicates["groups"],
+                "deleted_count": duplicates["duplicates"],
+                "total_meals_after": total_before - duplicates["duplicates"],
+                "preview": preview
+            }
         
-        db.commit()
+        # 중복 데이터 삭제 (청크마다 커밋)
+        deleted_count = crud_meal.delete_duplicate_meals(db, chunk_size=chunk_size) if duplicates["duplicates"] else 0
         
         # 중복 제거 후 데이터 개수
-        total_after = db.query(Meal).count()
+        total_after = db.query(func.count(Meal.id)).scalar()
         
         return {
             "message": "중복 급식 데이터 제거 완료",
+            "dry_run": False,
             "total_meals_before": total_before,
+            "duplicate_groups": duplicates["groups"],
             "deleted_count": deleted_count,
-            "total_meals_after": total_after
+            "total_meals_after": total_after,
+            "preview": preview
         }
         
     except Exception as e:
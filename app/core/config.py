@@ -87,7 +87,84 @@ class Settings(BaseSettings):
     
     # 급식 데이터 수집 설정
     MEAL_FETCH_DAYS_AHEAD: int = 14  # 현재부터 2주치 데이터 수집
-    MEAL_FETCH_SCHEDULE: str = "0 2 * * *"  # 매일 새벽 2시에 실행 (cron 표현식)
+    MEAL_FETCH_SCHEDULE: str = "0 2 * * *"  # 사용 안 함 (적응형 스케줄러로 대체, 기존 .env 호환용)
+    MEAL_FETCH_CONCURRENCY: int = 4  # 호스트당 동시 요청 수
+    
+    # 적응형 수집 스케줄러 설정
+    MEAL_FETCH_TICK_MINUTES: int = 10  # 수집 계획 주기 (분)
+    MEAL_FETCH_DAILY_BUDGET: int = 200  # 스케줄러의 하루 최대 요청 수
+    MEAL_FETCH_PREWINDOW_MINUTES: int = 40  # 식사 시간 시작 몇 분 전에 오늘/내일 메뉴 갱신
+    MEAL_FETCH_MIN_INTERVAL_HOURS: float = 6.0  # 먼 날짜 최소 재수집 간격 (자주 바뀌는 날짜)
+    MEAL_FETCH_MAX_INTERVAL_HOURS: float = 72.0  # 먼 날짜 최대 재수집 간격 (오래 그대로인 날짜)
+    
+    # 수집 작업(/meals/fetch, /meals/refetch) 설정
+    INGESTION_JOB_HISTORY: int = 50  # 조회용으로 보관할 최근 작업 수
+    INGESTION_JOB_LOCK_WAIT_SECONDS: float = 300.0  # 다른 수집이 진행 중일 때 기다릴 시간 (초)
+    INGESTION_REFETCH_MAX_DAYS: int = 62  # 지정 수집 한 번에 허용하는 최대 기간 (일)
+    
+    # DB 임대 락 설정 (여러 워커/서버 간 수집 중복 실행 방지)
+    LEASE_TTL_SECONDS: float = 120.0  # 갱신이 끊기면 다른 보유자가 가져갈 수 있는 시간 (초)
+    LEASE_RENEW_SECONDS: float = 30.0  # 보유 중 만료 시간 연장 주기 (초)
+    SCHEDULER_LEADER_CHECK_SECONDS: float = 30.0  # 스케줄러 리더가 아닌 프로세스가 리더 락을 다시 시도하는 주기 (초)
+    
+    # 분산 수집 작업 큐 설정 (fetch_tasks 테이블, MySQL 8.0+/MariaDB 10.6+의 SKIP LOCKED 사용)
+    FETCH_QUEUE_ENABLED: bool = False  # True면 스케줄러가 직접 수집하지 않고 큐에 등록, 모든 프로세스가 워커로 처리
+    FETCH_QUEUE_BATCH_SIZE: int = 8  # 워커가 한 번에 가져가는 작업 수
+    FETCH_QUEUE_VISIBILITY_SECONDS: float = 300.0  # 가져간 작업을 다른 워커에게 숨기는 시간 (초, 처리 중에는 1/3마다 연장, 워커가 죽으면 지난 뒤 다시 처리)
+    FETCH_QUEUE_MAX_ATTEMPTS: int = 5  # 작업별 최대 시도 횟수
+    FETCH_QUEUE_RETRY_BACKOFF_SECONDS: float = 30.0  # 실패 후 재시도 기본 대기 (초, 시도마다 2배)
+    FETCH_QUEUE_POLL_SECONDS: float = 5.0  # 큐가 비었을 때 다시 확인하는 주기 (초)
+    
+    # 한양대 서버 요청 보호 설정
+    UPSTREAM_POOL_MAXSIZE: int = 8  # 호스트당 유지할 keep-alive 연결 수
+    UPSTREAM_CONNECT_TIMEOUT: float = 5.0  # 연결 타임아웃 (초)
+    UPSTREAM_READ_TIMEOUT: float = 15.0  # 응답 타임아웃 (초)
+    UPSTREAM_MAX_RETRIES: int = 2  # 재시도 횟수 (첫 요청 제외)
+    UPSTREAM_RETRY_BACKOFF_BASE: float = 0.5  # 재시도 기본 대기 (초)
+    UPSTREAM_RETRY_BACKOFF_MAX: float = 8.0  # 재시도 최대 대기 (초)
+    UPSTREAM_RATE_PER_SECOND: float = 4.0  # 호스트당 초당 최대 요청 수
+    UPSTREAM_RATE_BURST: int = 4  # 순간 허용 요청 수
+    UPSTREAM_RATE_WAIT_TIMEOUT: float = 30.0  # 속도 제한 최대 대기 (초)
+    UPSTREAM_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 시 서킷 열림
+    UPSTREAM_CIRCUIT_RESET_TIMEOUT: float = 60.0  # 서킷 열림 유지 시간 (초)
+    
+    # 실시간 파싱(/meals/parse) 캐시 설정
+    PARSE_CACHE_TTL: float = 60.0  # 캐시 유지 시간 (초)
+    PARSE_CACHE_STALE_TTL: float = 600.0  # 만료 후 이전 값을 반환하며 갱신하는 시간 (초)
+    PARSE_CACHE_MAX_ENTRIES: int = 256  # 최대 캐시 항목 수
+    PARSE_RESULT_CACHE_MAX_ENTRIES: int = 512  # HTML 해시별 파싱 결과 캐시 최대 항목 수 (모든 수집/파싱 경로가 공유)
+    PARSE_WORKER_PROCESSES: int = 1  # 파싱 워커 프로세스 수 (0이면 스레드 사용)
+    HTML_PARSER_BACKEND: str = "auto"  # HTML 파싱 백엔드 (auto: lxml이 있으면 lxml, lxml, bs4)
+    
+    # 급식 조회(GET /meals) 응답 캐시 설정
+    MEAL_RESPONSE_CACHE_MAX_ENTRIES: int = 256  # (날짜, 식당 코드, 식사 종류)별 응답 캐시 최대 항목 수
+    MEAL_RESPONSE_CACHE_TTL_SECONDS: float = 30.0  # 캐시 유지 시간 (초, 다른 프로세스/서버의 변경이 반영되는 최대 지연, 0이면 사용 안 함)
+    
+    # 메뉴 텍스트 분류 규칙 (.env에서는 JSON 목록으로 지정)
+    MENU_NOTICE_PATTERNS: List[str] = [  # 안내 문구 정규식 (대소문자 무시)
+        r"코너만.*운영",
+        r"금요일.*한.*코너만",
+        r"문의.*전화",
+        r"연락.*안내",
+        r"공지.*알림"
+    ]
+    MENU_NOTICE_KEYWORDS: List[str] = [  # 포함되면 안내 문구로 보는 키워드
+        "운영합니다", "휴무", "휴업", "문의", "전화", "연락", "안내", "공지", "알림"
+    ]
+    MENU_WHOLE_TEXT_KEYWORDS: List[str] = [  # 포함되면 분리하지 않고 그대로 두는 문구
+        "운영 없습니다", "추석연휴", "휴무", "휴업"
+    ]
+    MENU_SPLIT_RULES: List[dict] = [  # 메뉴 분리 구분자 (순서대로 시도)
+        {"pattern": r"\t", "min_items": 1},
+        {"pattern": r"\n", "min_items": 2},
+        {"pattern": r"/", "min_items": 2, "min_count": 2},
+        {"pattern": r"\s{2,}", "min_items": 2}
+    ]
+    
+    # 원본 HTML 보관 설정 (오프라인 재파싱용)
+    MEAL_HTML_ARCHIVE_ENABLED: bool = True
+    MEAL_HTML_ARCHIVE_DIR: str = "data/html_archive"
+    MEAL_HTML_ARCHIVE_HISTORY: int = 20  # 식당/날짜별로 남길 내용 변경 이력 수
     
     # 관리자 API 키 설정 (콤마로 구분된 문자열)
     ADMIN_API_KEYS: str = ""  # 여러 개의 API 키를 콤마로 구분 (예: "key1,key2,key3")
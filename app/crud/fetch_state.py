@@ -0,0 +1,63 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from sqlalchemy.sql import func
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+
+from app.models.fetch_state import MealFetchState
+
+
+def get_fetch_states(
+    db: Session,
+    restaurant_codes: List[str],
+    start_date: date,
+    end_date: date
+) -> Dict[Tuple[str, date], MealFetchState]:
+    """기간 내 수집 상태 조회 ((식당 코드, 날짜) -> 상태)"""
+    states = db.query(MealFetchState).filter(
+        and_(
+            MealFetchState.restaurant_code.in_(restaurant_codes),
+            MealFetchState.date >= start_date,
+            MealFetchState.date <= end_date
+        )
+    ).all()
+    
+    return {(state.restaurant_code, state.date): state for state in states}
+
+
+def save_fetch_state(
+    db: Session,
+    state: Optional[MealFetchState],
+    restaurant_code: str,
+    target_date: date,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    content_hash: Optional[str],
+    changed: bool
+) -> MealFetchState:
+    """
+    수집 상태 저장
+    
+    Args:
+        state: 기존 상태 (없으면 새로 생성)
+        content_hash: 새 해시 (None이면 기존 값 유지)
+        changed: 내용이 바뀌어 저장했는지 여부 (changed_at 갱신)
+    """
+    if state is None:
+        state = MealFetchState(restaurant_code=restaurant_code, date=target_date)
+        db.add(state)
+    
+    # 서버가 검증자를 보내지 않은 경우 기존 값 유지
+    if etag:
+        state.etag = etag
+    if last_modified:
+        state.last_modified = last_modified
+    if content_hash:
+        state.content_hash = content_hash
+    
+    state.checked_at = func.now()
+    if changed:
+        state.changed_at = func.now()
+    
+    db.commit()
+    return state
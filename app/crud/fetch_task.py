@@ -0,0 +1,297 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func
+from sqlalchemy.exc import IntegrityError
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+
+from app.models.fetch_task import FetchTask
+
+# 작업 상태
+TASK_PENDING = "pending"
+TASK_CLAIMED = "claimed"
+TASK_DONE = "done"
+TASK_FAILED = "failed"
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def enqueue_fetch_tasks(
+    db: Session,
+    targets: List[Tuple[str, date]],
+    force: bool = False,
+    source: Optional[str] = None
+) -> Dict[str, int]:
+    """
+    수집 작업 등록 (커밋함)
+    
+    (식당, 날짜)마다 한 행만 유지합니다.
+    - 없으면 새로 등록
+    - 완료/실패한 작업은 pending으로 되돌림 (시도 횟수 초기화)
+    - 대기/처리 중인 작업은 그대로 둠 (force만 올림)
+    
+    Returns:
+        {"created", "requeued", "already_queued"} 작업 수
+    """
+    counts = {"created": 0, "requeued": 0, "already_queued": 0}
+    targets = sorted(set(targets))
+    if not targets:
+        return counts
+    
+    # 동시에 같은 작업을 등록하면 한쪽이 유일성 제약에 걸리므로 한 번 더 시도
+    for attempt in range(2):
+        counts = dict.fromkeys(counts, 0)
+        now = _utcnow()
+        codes = sorted({code for code, _ in targets})
+        existing = {
+            (task.restaurant_code, task.date): task
+            for task in db.query(FetchTask).filter(
+                FetchTask.restaurant_code.in_(codes),
+                FetchTask.date >= min(target_date for _, target_date in targets),
+                FetchTask.date <= max(target_date for _, target_date in targets)
+            )
+        }
+        
+        new_rows = []
+        for restaurant_code, target_date in targets:
+            task = existing.get((restaurant_code, target_date))
+            if task is None:
+                new_rows.append({
+                    "restaurant_code": restaurant_code,
+                    "date": target_date,
+                    "force": force,
+                    "source": source,
+                    "status": TASK_PENDING,
+                    "attempts": 0,
+                    "visible_at": now,
+                    "created_at": now,
+                    "updated_at": now
+                })
+                counts["created"] += 1
+            elif task.status in (TASK_DONE, TASK_FAILED):
+                task.status = TASK_PENDING
+                task.attempts = 0
+                task.force = force
+                task.source = source
+                task.visible_at = now
+                task.claimed_by = None
+                task.last_error = None
+                task.updated_at = now
+                counts["requeued"] += 1
+            else:
+                if force and not task.force:
+                    task.force = True
+                    task.updated_at = now
+                counts["already_queued"] += 1
+        
+        try:
+            if new_rows:
+                db.execute(FetchTask.__table__.insert(), new_rows)
+            db.commit()
+            return counts
+        except IntegrityError:
+            db.rollback()
+            if attempt:
+                raise
+    
+    return counts
+
+
+def claim_fetch_tasks(
+    db: Session,
+    token: str,
+    limit: int,
+    visibility_seconds: float,
+    max_attempts: int
+) -> List[FetchTask]:
+    """
+    처리할 작업 가져가기 (커밋함)
+    
+    pending 작업과 가시성 타임아웃이 지난 claimed 작업(처리하던 워커가 죽음)을 날짜순으로 골라
+    token으로 표시하고 visibility_seconds 동안 다른 워커에게 보이지 않게 합니다.
+    MySQL/PostgreSQL은 SELECT ... FOR UPDATE SKIP LOCKED로 다른 워커가 고르는 중인 행을 건너뛰고,
+    UPDATE 조건을 다시 확인하므로 SKIP LOCKED가 없는 DB(SQLite)에서도 두 워커가 같은 작업을 가져가지 않습니다.
+    
+    Returns:
+        이번에 가져간 작업 목록 (attempts는 이번 시도를 포함)
+    """
+    now = _utcnow()
+    
+    # 시도 횟수를 다 쓴 채 타임아웃된 작업은 실패 처리
+    db.query(FetchTask).filter(
+        FetchTask.status == TASK_CLAIMED,
+        FetchTask.visible_at <= now,
+        FetchTask.attempts >= max_attempts
+    ).update(
+        {"status": TASK_FAILED, "claimed_by": None, "last_error": "처리 중 타임아웃", "updated_at": now},
+        synchronize_session=False
+    )
+    
+    claimable = and_(
+        FetchTask.status.in_((TASK_PENDING, TASK_CLAIMED)),
+        FetchTask.visible_at <= now,
+        FetchTask.attempts < max_attempts
+    )
+    task_ids = [
+        task_id for (task_id,) in db.query(FetchTask.id).filter(claimable).order_by(
+            FetchTask.date, FetchTask.restaurant_code
+        ).limit(limit).with_for_update(skip_locked=True)
+    ]
+    if not task_ids:
+        db.commit()
+        return []
+    
+    db.query(FetchTask).filter(FetchTask.id.in_(task_ids), claimable).update(
+        {
+            "status": TASK_CLAIMED,
+            "claimed_by": token,
+            "attempts": FetchTask.attempts + 1,
+            "visible_at": now + timedelta(seconds=visibility_seconds),
+            "updated_at": now
+        },
+        synchronize_session=False
+    )
+    db.commit()
+    
+    return db.query(FetchTask).filter(
+        FetchTask.id.in_(task_ids),
+        FetchTask.claimed_by == token
+    ).order_by(FetchTask.date, FetchTask.restaurant_code).all()
+
+
+def complete_fetch_tasks(db: Session, task_ids: List[int], token: str) -> int:
+    """
+    작업 완료 처리 (커밋함)
+    
+    타임아웃 후 다른 워커가 다시 가져간 작업(claimed_by가 다름)은 건드리지 않습니다.
+    """
+    if not task_ids:
+        return 0
+    
+    updated = db.query(FetchTask).filter(
+        FetchTask.id.in_(task_ids),
+        FetchTask.claimed_by == token
+    ).update(
+        {"status": TASK_DONE, "claimed_by": None, "last_error": None, "updated_at": _utcnow()},
+        synchronize_session=False
+    )
+    db.commit()
+    return updated
+
+
+def extend_fetch_tasks(db: Session, task_ids: List[int], token: str, visibility_seconds: float) -> int:
+    """
+    처리 중인 작업의 가시성 타임아웃 연장 (커밋함)
+    
+    Returns:
+        연장된 작업 수 (이 토큰으로 처리 중인 것만)
+    """
+    if not task_ids:
+        return 0
+    
+    now = _utcnow()
+    updated = db.query(FetchTask).filter(
+        FetchTask.id.in_(task_ids),
+        FetchTask.claimed_by == token,
+        FetchTask.status == TASK_CLAIMED
+    ).update(
+        {"visible_at": now + timedelta(seconds=visibility_seconds), "updated_at": now},
+        synchronize_session=False
+    )
+    db.commit()
+    return updated
+
+
+def release_fetch_tasks(db: Session, task_ids: List[int], token: str) -> int:
+    """
+    가져간 작업을 처리하지 않고 돌려놓기 (커밋함)
+    
+    이번 시도는 세지 않고 바로 다시 가져갈 수 있게 pending으로 바꿉니다.
+    """
+    if not task_ids:
+        return 0
+    
+    now = _utcnow()
+    updated = db.query(FetchTask).filter(
+        FetchTask.id.in_(task_ids),
+        FetchTask.claimed_by == token
+    ).update(
+        {
+            "status": TASK_PENDING,
+            "claimed_by": None,
+            "attempts": FetchTask.attempts - 1,
+            "visible_at": now,
+            "updated_at": now
+        },
+        synchronize_session=False
+    )
+    db.commit()
+    return updated
+
+
+def fail_fetch_task(
+    db: Session,
+    task_id: int,
+    token: str,
+    error: str,
+    max_attempts: int,
+    backoff_seconds: float
+) -> bool:
+    """
+    작업 실패 처리 (커밋함)
+    
+    시도 횟수가 남았으면 backoff_seconds * 2^(시도 횟수 - 1) 뒤에 다시 가져갈 수 있게 pending으로,
+    다 썼으면 failed로 바꿉니다.
+    
+    Returns:
+        False면 이미 다른 워커가 가져간 작업
+    """
+    now = _utcnow()
+    task = db.query(FetchTask).filter(
+        FetchTask.id == task_id,
+        FetchTask.claimed_by == token
+    ).first()
+    if task is None:
+        db.rollback()
+        return False
+    
+    task.claimed_by = None
+    task.last_error = error[:2000]
+    task.updated_at = now
+    if task.attempts >= max_attempts:
+        task.status = TASK_FAILED
+    else:
+        task.status = TASK_PENDING
+        task.visible_at = now + timedelta(seconds=backoff_seconds * 2 ** max(0, task.attempts - 1))
+    db.commit()
+    return True
+
+
+def count_in_flight_fetch_tasks(db: Session) -> int:
+    """워커가 처리 중인 작업 수 (가시성 타임아웃이 지나지 않은 claimed 작업)"""
+    return db.query(func.count(FetchTask.id)).filter(
+        FetchTask.status == TASK_CLAIMED,
+        FetchTask.visible_at > _utcnow()
+    ).scalar()
+
+
+def count_unfinished_fetch_tasks(db: Session) -> int:
+    """대기 중이거나 처리 중인 작업 수 (재시도 대기, 타임아웃 대기 포함)"""
+    return db.query(func.count(FetchTask.id)).filter(
+        FetchTask.status.in_((TASK_PENDING, TASK_CLAIMED))
+    ).scalar()
+
+
+def get_fetch_queue_stats(db: Session) -> Dict:
+    """상태별 작업 수와 가장 오래 기다린 작업 시간"""
+    counts = dict(
+        db.query(FetchTask.status, func.count(FetchTask.id)).group_by(FetchTask.status).all()
+    )
+    oldest_pending = db.query(func.min(FetchTask.created_at)).filter(
+        FetchTask.status.in_((TASK_PENDING, TASK_CLAIMED))
+    ).scalar()
+    return {
+        **{status: counts.get(status, 0) for status in (TASK_PENDING, TASK_CLAIMED, TASK_DONE, TASK_FAILED)},
+        "oldest_pending_created_at": oldest_pending.isoformat() + "Z" if oldest_pending else None
+    }
@@ -0,0 +1,88 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from typing import Optional
+from datetime import datetime, timedelta
+
+from app.models.lease import Lease
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def get_lease(db: Session, name: str) -> Optional[Lease]:
+    """임대 락 조회"""
+    return db.query(Lease).filter(Lease.name == name).first()
+
+
+def is_lease_held(db: Session, name: str) -> bool:
+    """만료되지 않은 보유자가 있는지"""
+    return db.query(Lease.name).filter(
+        Lease.name == name,
+        Lease.expires_at > _utcnow()
+    ).first() is not None
+
+
+def try_acquire_lease(db: Session, name: str, holder: str, ttl_seconds: float) -> bool:
+    """
+    임대 락 획득 시도 (커밋함)
+    
+    비어 있거나 만료됐거나 이미 같은 보유자면 가져옵니다.
+    조건부 UPDATE 또는 INSERT(기본 키 충돌 시 실패) 한 문장으로 판단하므로 동시에 시도해도 하나만 성공합니다.
+    
+    Returns:
+        획득 여부
+    """
+    now = _utcnow()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+    
+    updated = db.query(Lease).filter(
+        Lease.name == name,
+        or_(Lease.holder == holder, Lease.expires_at < now)
+    ).update(
+        {"holder": holder, "acquired_at": now, "expires_at": expires_at},
+        synchronize_session=False
+    )
+    if updated:
+        db.commit()
+        return True
+    # UPDATE가 잡은 잠금을 놓고 INSERT
+    db.rollback()
+    
+    try:
+        db.add(Lease(name=name, holder=holder, acquired_at=now, expires_at=expires_at))
+        db.commit()
+        return True
+    except IntegrityError:
+        # 다른 보유자가 유효한 락을 가지고 있음
+        db.rollback()
+        return False
+
+
+def renew_lease(db: Session, name: str, holder: str, ttl_seconds: float) -> bool:
+    """
+    임대 락 만료 시간 연장 (커밋함)
+    
+    Returns:
+        False면 이미 다른 보유자에게 넘어감
+    """
+    updated = db.query(Lease).filter(
+        Lease.name == name,
+        Lease.holder == holder
+    ).update(
+        {"expires_at": _utcnow() + timedelta(seconds=ttl_seconds)},
+        synchronize_session=False
+    )
+    db.commit()
+    return bool(updated)
+
+
+def release_lease(db: Session, name: str, holder: str) -> bool:
+    """임대 락 반납 (커밋함, 다른 보유자의 락은 건드리지 않음)"""
+    deleted = db.query(Lease).filter(
+        Lease.name == name,
+        Lease.holder == holder
+    ).delete(synchronize_session=False)
+    db.commit()
+    return bool(deleted)
@@ -1,11 +1,14 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from typing import List, Optional
-from datetime import date
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, and_, exists, bindparam, insert, update
+from typing import Dict, List, Optional
+from datetime import date, timedelta
 
 from app.models.meal import Meal
 from app.models.restaurant import Restaurant
 from app.models.rating import Rating
+from app.models.keyword import MealKeywordReview
+from app.utils.meal_content import meal_content_hash
+from app.db.meal_changes import mark_date_changed
 
 
 def get_all_restaurants(db: Session) -> List[Restaurant]:
@@ -55,14 +58,246 @@ def create_meal(
         korean_name=korean_name,
         tags=tags,
         price=price,
-        image_url=image_url
+        image_url=image_url,
+        content_hash=meal_content_hash(korean_name, tags)
     )
     db.add(meal)
+    mark_date_changed(db, date)
     db.commit()
     db.refresh(meal)
     return meal
 
 
+# 다중 행 upsert 시 기존 메뉴에서 갱신하는 컬럼
+MEAL_UPSERT_COLUMNS = ("day_of_week", "korean_name", "tags", "price", "image_url", "content_hash")
+
+
+def get_meals_for_day(db: Session, restaurant_id: int, target_date: date) -> List[Meal]:
+    """특정 식당/날짜의 메뉴 전체 (식사 종류 무관, ID순)"""
+    return db.query(Meal).filter(
+        Meal.restaurant_id == restaurant_id,
+        Meal.date == target_date
+    ).order_by(Meal.id).all()
+
+
+def upsert_meals(db: Session, rows: List[Dict]):
+    """
+    메뉴 여러 개를 한 문장으로 저장 (커밋하지 않음)
+    
+    id가 있는 행은 해당 메뉴를 갱신하고(ID 유지, 평점 보존), id가 None인 행은 새로 생성합니다.
+    content_hash는 korean_name/tags로 다시 계산해 채웁니다.
+    - MySQL: INSERT ... ON DUPLICATE KEY UPDATE
+    - SQLite/PostgreSQL (로컬 벤치마크용): INSERT ... ON CONFLICT (id) DO UPDATE
+    - 그 밖의 DB: 기존 메뉴 조회 후 일괄 UPDATE/INSERT (_upsert_meals_generic)
+    
+    Args:
+        rows: Meal 컬럼 딕셔너리 목록 (모든 행이 같은 키를 가져야 함)
+    """
+    if not rows:
+        return
+    
+    rows = [
+        {**row, "content_hash": meal_content_hash(row["korean_name"], row["tags"])}
+        for row in rows
+    ]
+    table = Meal.__table__
+    dialect = db.get_bind().dialect.name
+    
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        stmt = insert(table).values(rows)
+        stmt = stmt.on_duplicate_key_update(
+            {column: stmt.inserted[column] for column in MEAL_UPSERT_COLUMNS}
+        )
+    elif dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        stmt = insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={column: stmt.excluded[column] for column in MEAL_UPSERT_COLUMNS}
+        )
+    else:
+        _upsert_meals_generic(db, rows)
+        return
+    
+    db.execute(stmt)
+
+
+def _upsert_meals_generic(db: Session, rows: List[Dict]):
+    """
+    방언별 upsert 문이 없는 DB용 upsert (조회 1번, 일괄 UPDATE 1번, 일괄 INSERT 1번)
+    
+    id가 없는 행도 unique_meal_content가 같은 기존 메뉴가 있으면 그 메뉴를 갱신합니다.
+    (MySQL의 ON DUPLICATE KEY UPDATE와 같은 결과)
+    """
+    table = Meal.__table__
+    
+    def content_key(row: Dict) -> tuple:
+        return tuple(row[column] for column in DUPLICATE_KEY_COLUMNS)
+    
+    new_keys = {content_key(row) for row in rows if row.get("id") is None}
+    existing_ids: Dict[tuple, int] = {}
+    if new_keys:
+        existing = db.query(
+            Meal.id, *(getattr(Meal, column) for column in DUPLICATE_KEY_COLUMNS)
+        ).filter(
+            Meal.restaurant_id.in_({key[0] for key in new_keys}),
+            Meal.date.in_({key[1] for key in new_keys})
+        )
+        existing_ids = {tuple(key): meal_id for meal_id, *key in existing}
+    
+    updates = []
+    inserts = []
+    for row in rows:
+        meal_id = row.get("id") or existing_ids.get(content_key(row))
+        if meal_id is None:
+            inserts.append({key: value for key, value in row.items() if key != "id"})
+        else:
+            # 바인드 이름이 컬럼 이름과 같으면 안 되므로 접두어를 붙임
+            updates.append({
+                "meal_id": meal_id,
+                **{f"new_{column}": row[column] for column in MEAL_UPSERT_COLUMNS}
+            })
+    
+    if updates:
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam("meal_id"))
+            .values({column: bindparam(f"new_{column}") for column in MEAL_UPSERT_COLUMNS}),
+            updates
+        )
+    if inserts:
+        db.execute(insert(table), inserts)
+
+
+def delete_meals_by_ids(db: Session, meal_ids: List[int]) -> int:
+    """
+    메뉴 일괄 삭제 (커밋하지 않음)
+    
+    ORM cascade와 같게 평점과 키워드 리뷰를 먼저 삭제합니다.
+    
+    Returns:
+        삭제된 메뉴 수
+    """
+    if not meal_ids:
+        return 0
+    
+    db.query(Rating).filter(Rating.meal_id.in_(meal_ids)).delete(synchronize_session=False)
+    db.query(MealKeywordReview).filter(
+        MealKeywordReview.meal_id.in_(meal_ids)
+    ).delete(synchronize_session=False)
+    return db.query(Meal).filter(Meal.id.in_(meal_ids)).delete(synchronize_session=False)
+
+
+DUPLICATE_KEY_COLUMNS = ("restaurant_id", "date", "meal_type", "content_hash")
+
+
+def _has_newer_duplicate():
+    """같은 (식당, 날짜, 식사 종류, 해시)에 id가 더 큰 행이 있는지 (EXISTS, unique_meal_content 인덱스 사용)"""
+    newer = aliased(Meal)
+    return exists().where(
+        *(getattr(newer, column) == getattr(Meal, column) for column in DUPLICATE_KEY_COLUMNS),
+        newer.id > Meal.id
+    )
+
+
+def count_duplicate_meals(db: Session) -> Dict[str, int]:
+    """
+    중복 메뉴 집계 (DB에서 GROUP BY)
+    
+    Returns:
+        {"groups": 중복이 있는 메뉴 수, "duplicates": 삭제 대상 행 수}
+    """
+    grouped = db.query(
+        func.count(Meal.id).label("rows")
+    ).group_by(
+        *(getattr(Meal, column) for column in DUPLICATE_KEY_COLUMNS)
+    ).having(func.count(Meal.id) > 1).subquery()
+    
+    groups, rows = db.query(
+        func.count(), func.coalesce(func.sum(grouped.c.rows), 0)
+    ).select_from(grouped).one()
+    return {"groups": groups, "duplicates": int(rows) - groups}
+
+
+def get_duplicate_meal_groups(db: Session, limit: int = 20) -> List[Dict]:
+    """
+    중복 메뉴 미리보기 (최대 limit개 메뉴)
+    
+    Returns:
+        [{"restaurant_code", "date", "meal_type", "content_hash", "keep_id", "delete_ids"}]
+    """
+    key_columns = [getattr(Meal, column) for column in DUPLICATE_KEY_COLUMNS]
+    groups = db.query(
+        *key_columns, func.max(Meal.id).label("keep_id")
+    ).group_by(
+        *key_columns
+    ).having(
+        func.count(Meal.id) > 1
+    ).order_by(
+        Meal.date, Meal.restaurant_id, Meal.meal_type
+    ).limit(limit).subquery()
+    
+    # 미리보기 대상 메뉴의 모든 행을 한 번에 조회
+    rows = db.query(
+        groups.c.keep_id, Meal.id, Meal.date, Meal.meal_type, Meal.content_hash, Restaurant.code
+    ).join(
+        groups, and_(*(getattr(Meal, column) == groups.c[column] for column in DUPLICATE_KEY_COLUMNS))
+    ).join(
+        Restaurant, Meal.restaurant_id == Restaurant.id
+    ).order_by(
+        groups.c.date, groups.c.restaurant_id, groups.c.meal_type, groups.c.keep_id, Meal.id
+    ).all()
+    
+    preview: Dict[int, Dict] = {}
+    for keep_id, meal_id, meal_date, meal_type, content_hash, restaurant_code in rows:
+        group = preview.setdefault(keep_id, {
+            "restaurant_code": restaurant_code,
+            "date": meal_date.isoformat(),
+            "meal_type": meal_type,
+            "content_hash": content_hash,
+            "keep_id": keep_id,
+            "delete_ids": []
+        })
+        if meal_id != keep_id:
+            group["delete_ids"].append(meal_id)
+    return list(preview.values())
+
+
+def delete_duplicate_meals(db: Session, chunk_size: int = 1000) -> int:
+    """
+    중복 메뉴 삭제 (같은 키 중 id가 가장 큰 행만 남김)
+    
+    삭제 대상 id를 chunk_size개씩 id 순서로 DB에서 찾아 평점/키워드 리뷰와 함께 삭제하고
+    청크마다 커밋합니다. 전체 테이블을 메모리에 올리지 않고, 중간에 실패해도 이미 지운 청크는 유지됩니다.
+    
+    Returns:
+        삭제된 메뉴 수
+    """
+    deleted = 0
+    last_id = 0
+    
+    while True:
+        meal_ids = [
+            meal_id for (meal_id,) in db.query(Meal.id).filter(
+                Meal.id > last_id,
+                _has_newer_duplicate()
+            ).order_by(Meal.id).limit(chunk_size)
+        ]
+        if not meal_ids:
+            break
+        
+        deleted += delete_meals_by_ids(db, meal_ids)
+        mark_date_changed(db)
+        db.commit()
+        last_id = meal_ids[-1]
+    
+    return deleted
+
+
 def get_meals_by_date(
     db: Session, 
     restaurant_code: str, 
@@ -134,6 +369,8 @@ def delete_meals_by_date_range(
             Meal.date <= end_date
         )
     ).delete()
+    for offset in range((end_date - start_date).days + 1):
+        mark_date_changed(db, start_date + timedelta(days=offset))
     db.commit()
 
 
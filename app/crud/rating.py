@@ -1,8 +1,17 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func, case
 from typing import Optional
+from app.models.meal import Meal
 from app.models.rating import Rating
 from app.schemas.rating import RatingCreate, RatingUpdate, MealRatingStats
+from app.db.meal_changes import mark_date_changed
+
+
+def _mark_meal_changed(db: Session, meal_id: int):
+    """평점이 바뀐 메뉴의 날짜 조회 캐시를 커밋 후 무효화 (메뉴는 보통 세션에 이미 로드되어 있음)"""
+    meal = db.get(Meal, meal_id)
+    if meal is not None:
+        mark_date_changed(db, meal.date)
 
 
 def create_or_update_rating(
@@ -18,6 +27,7 @@ def create_or_update_rating(
     if existing_rating:
         # 기존 평점 수정
         existing_rating.rating = rating_data.rating
+        _mark_meal_changed(db, rating_data.meal_id)
         db.commit()
         db.refresh(existing_rating)
         return existing_rating
@@ -29,6 +39,7 @@ def create_or_update_rating(
             rating=rating_data.rating
         )
         db.add(new_rating)
+        _mark_meal_changed(db, rating_data.meal_id)
         db.commit()
         db.refresh(new_rating)
         return new_rating
@@ -88,6 +99,7 @@ def delete_rating(
     
     if rating:
         db.delete(rating)
+        _mark_meal_changed(db, meal_id)
         db.commit()
         return True
     return False
@@ -0,0 +1,50 @@
+"""
+급식 데이터 변경 추적
+
+메뉴/평점을 바꾸는 코드는 mark_date_changed(db, 날짜)로 바뀐 날짜를 세션에 기록하고,
+세션이 커밋되면(after_commit) on_dates_committed로 등록된 콜백에 그 날짜들을 넘깁니다.
+롤백되면 기록만 버립니다. (커밋 전에 알리면 그 사이 조회가 이전 데이터를 다시 캐시하므로 커밋 후에 알림)
+
+crud는 이 모듈만 쓰고, 캐시 등 서비스 계층이 콜백을 등록합니다.
+"""
+from datetime import date
+from typing import Callable, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# 세션에 바뀐 날짜를 기록하는 키 (None이 들어 있으면 전체)
+_CHANGED_DATES_KEY = "meal_changed_dates"
+
+# 커밋 후 호출할 콜백 (바뀐 날짜 집합, 전체면 None)
+_callbacks: List[Callable[[Optional[Set[date]]], None]] = []
+
+
+def on_dates_committed(callback: Callable[[Optional[Set[date]]], None]):
+    """커밋 후 바뀐 날짜를 받을 콜백 등록"""
+    if callback not in _callbacks:
+        _callbacks.append(callback)
+
+
+def mark_date_changed(db: Session, target_date: Optional[date] = None):
+    """
+    이 세션이 커밋되면 target_date가 바뀌었다고 알리도록 기록
+    
+    Args:
+        target_date: 메뉴/평점이 바뀐 날짜 (None이면 전체, 날짜를 모르는 일괄 삭제 등)
+    """
+    db.info.setdefault(_CHANGED_DATES_KEY, set()).add(target_date)
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_after_commit(db: Session):
+    changed = db.info.pop(_CHANGED_DATES_KEY, None)
+    if changed:
+        dates = None if None in changed else changed
+        for callback in _callbacks:
+            callback(dates)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(db: Session):
+    db.info.pop(_CHANGED_DATES_KEY, None)
@@ -5,7 +5,11 @@ import logging
 
 from app.core.config import settings
 from app.api.v1.api import api_router
-from app.services.scheduler import start_scheduler, stop_scheduler
+from app.services.leader_election import scheduler_leader
+from app.services.upstream_transport import async_upstream_transport
+from app.services.parse_pool import parse_pool
+from app.services.ingestion_jobs import ingestion_job_runner
+from app.services.fetch_queue import fetch_queue_worker
 from app.db.session import engine
 
 # 모든 모델을 import하여 테이블 생성이 가능하도록 함
@@ -13,6 +17,9 @@ from app.models.restaurant import Restaurant
 from app.models.meal import Meal
 from app.models.rating import Rating
 from app.models.keyword import Keyword, MealKeywordReview
+from app.models.fetch_state import MealFetchState
+from app.models.lease import Lease
+from app.models.fetch_task import FetchTask
 
 # 로깅 설정
 logging.basicConfig(
@@ -36,56 +43,30 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"데이터베이스 테이블 생성 실패: {e}")
     
-    # 스케줄러 시작 (파일 락으로 첫 번째 프로세스에서만)
+    # 스케줄러 리더 선출 시작 (DB 임대 락을 가진 프로세스 하나만 스케줄러 실행)
     try:
-        import os
-        import fcntl
-        import tempfile
-        
-        # 스케줄러 락 파일 경로
-        lock_file_path = "/tmp/ricerica_scheduler.lock"
-        
-        try:
-            # 락 파일 열기
-            lock_file = open(lock_file_path, 'w')
-            
-            # 논블로킹 락 시도
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-            
-            # 락 획득 성공 - 이 프로세스가 스케줄러를 담당
-            pid = os.getpid()
-            lock_file.write(str(pid))
-            lock_file.flush()
-            
-            start_scheduler()
-            logger.info(f"스케줄러 시작 완료 (마스터 프로세스 - PID: {pid})")
-            
-            # 락 파일은 프로세스 종료까지 유지 (자동으로 해제됨)
-            
-        except (IOError, OSError) as e:
-            # 락 획득 실패 - 다른 프로세스가 이미 스케줄러를 담당 중
-            logger.info(f"스케줄러 시작 건너뜀 (워커 프로세스 - PID: {os.getpid()})")
-            if 'lock_file' in locals():
-                lock_file.close()
-                
+        await scheduler_leader.start()
     except Exception as e:
-        logger.error(f"스케줄러 시작 실패: {e}")
+        logger.error(f"스케줄러 리더 선출 시작 실패: {e}")
+    
+    # 분산 수집 작업 큐 워커 (모든 프로세스)
+    if settings.FETCH_QUEUE_ENABLED:
+        fetch_queue_worker.start()
     
     yield
     
     # 종료 시
     logger.info("애플리케이션 종료")
     try:
-        import os
-        is_master = os.environ.get("MASTER_PROCESS", "false").lower() == "true"
-        
-        if is_master:
-            stop_scheduler()
-            logger.info("스케줄러 중지 완료 (마스터 프로세스)")
-        else:
-            logger.info("스케줄러 중지 건너뜀 (워커 프로세스)")
+        await scheduler_leader.stop()
     except Exception as e:
         logger.error(f"스케줄러 중지 실패: {e}")
+    
+    # 실시간 파싱용 HTTP 클라이언트, 워커 풀, 수집 작업 실행기 정리
+    await async_upstream_transport.aclose()
+    parse_pool.shutdown()
+    ingestion_job_runner.shutdown()
+    fetch_queue_worker.stop(timeout=settings.UPSTREAM_READ_TIMEOUT)
 
 
 app = FastAPI(
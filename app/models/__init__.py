@@ -2,6 +2,9 @@ from app.models.restaurant import Restaurant
 from app.models.meal import Meal
 from app.models.rating import Rating
 from app.models.keyword import Keyword, MealKeywordReview
+from app.models.fetch_state import MealFetchState
+from app.models.lease import Lease
+from app.models.fetch_task import FetchTask
 
 __all__ = [
     "Restaurant",
@@ -9,5 +12,8 @@ __all__ = [
     "Rating",
     "Keyword",
     "MealKeywordReview",
+    "MealFetchState",
+    "Lease",
+    "FetchTask",
 ]
 
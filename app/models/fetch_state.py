@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class MealFetchState(Base):
+    """식당/날짜별 급식 페이지 수집 상태 (조건부 요청 및 변경 감지용)"""
+    __tablename__ = "meal_fetch_states"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    restaurant_code = Column(String(10), nullable=False, comment="식당 코드")
+    date = Column(Date, nullable=False, comment="급식 날짜")
+    
+    # HTTP 캐시 검증자
+    etag = Column(String(200), comment="마지막 응답의 ETag")
+    last_modified = Column(String(100), comment="마지막 응답의 Last-Modified")
+    
+    # 정규화된 HTML 해시 (sha256)
+    content_hash = Column(String(64), comment="정규화된 HTML 해시")
+    
+    checked_at = Column(DateTime(timezone=True), server_default=func.now(), comment="마지막 확인 시간")
+    changed_at = Column(DateTime(timezone=True), server_default=func.now(), comment="마지막 변경 시간")
+    
+    __table_args__ = (
+        UniqueConstraint('restaurant_code', 'date', name='unique_fetch_state'),
+    )
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, Boolean, Text, UniqueConstraint, Index
+from app.db.base import Base
+
+
+class FetchTask(Base):
+    """
+    급식 페이지 수집 작업 큐 (식당/날짜별 한 행)
+    
+    모든 워커/서버가 pending 행을 가져가(claim) 처리하고, 처리 중 프로세스가 죽으면
+    visible_at(가시성 타임아웃)이 지난 뒤 다른 워커가 다시 가져갑니다. 시간은 모두 UTC입니다.
+    """
+    __tablename__ = "fetch_tasks"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    restaurant_code = Column(String(10), nullable=False, comment="식당 코드")
+    date = Column(Date, nullable=False, comment="급식 날짜")
+    force = Column(Boolean, nullable=False, default=False, comment="변경 여부와 관계없이 다시 파싱/저장")
+    source = Column(String(50), comment="등록한 곳 (scheduler, cli 등)")
+    
+    status = Column(String(10), nullable=False, default="pending", comment="상태 (pending, claimed, done, failed)")
+    attempts = Column(Integer, nullable=False, default=0, comment="가져간 횟수")
+    visible_at = Column(DateTime, nullable=False, comment="다음에 가져갈 수 있는 시간 (처리 중이면 가시성 타임아웃, 실패 후면 재시도 시간)")
+    claimed_by = Column(String(200), comment="처리 중인 워커의 claim 토큰")
+    last_error = Column(Text, comment="마지막 오류")
+    
+    created_at = Column(DateTime, nullable=False, comment="등록 시간")
+    updated_at = Column(DateTime, nullable=False, comment="마지막 변경 시간")
+    
+    __table_args__ = (
+        UniqueConstraint('restaurant_code', 'date', name='unique_fetch_task'),
+        Index('idx_fetch_task_claim', 'status', 'visible_at'),
+    )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime
+from app.db.base import Base
+
+
+class Lease(Base):
+    """
+    여러 프로세스/서버가 공유하는 이름별 임대(lease) 락
+    
+    보유자가 만료 전에 갱신하지 못하면(프로세스 종료 등) 다른 보유자가 가져갈 수 있습니다.
+    시간은 모두 UTC입니다.
+    """
+    __tablename__ = "leases"
+    
+    name = Column(String(64), primary_key=True, comment="락 이름 (예: meal_fetch)")
+    holder = Column(String(200), nullable=False, comment="보유자 (호스트:PID:토큰)")
+    acquired_at = Column(DateTime, nullable=False, comment="획득 시간 (UTC)")
+    expires_at = Column(DateTime, nullable=False, comment="만료 시간 (UTC)")
@@ -18,6 +18,7 @@ class Meal(Base):
     tags = Column(JSON, comment="태그 (리스트, 예: [중식A], [특식])")
     price = Column(String(20), comment="가격")
     image_url = Column(String(500), comment="이미지 URL")
+    content_hash = Column(String(64), nullable=False, comment="메뉴 내용 해시 (메뉴명 + 태그, 중복 판별용)")
     
     # 관계
     restaurant = relationship("Restaurant", back_populates="meals")
@@ -25,8 +26,9 @@ class Meal(Base):
     keyword_reviews = relationship("MealKeywordReview", back_populates="meal", cascade="all, delete-orphan")
     
     # 인덱스: 식당 + 날짜 + 식사종류 조합으로 빠른 조회
+    # 유일성: JSON 컬럼(korean_name) 대신 내용 해시로 판별 (scripts/migrate_meal_content_hash.py)
     __table_args__ = (
-        UniqueConstraint('restaurant_id', 'date', 'meal_type', 'korean_name', name='unique_meal'),
+        UniqueConstraint('restaurant_id', 'date', 'meal_type', 'content_hash', name='unique_meal_content'),
         Index('idx_restaurant_date', 'restaurant_id', 'date'),
     )
 
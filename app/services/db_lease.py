@@ -0,0 +1,201 @@
+"""
+DB 기반 임대(lease) 락
+
+threading.Lock은 한 프로세스 안에서만 동작하므로, 여러 uvicorn 워커나 여러 서버,
+스크립트가 같은 DB를 쓸 때는 leases 테이블의 행으로 실행 권한을 나눕니다.
+
+- 획득: 비어 있거나 만료된 행을 조건부 UPDATE/INSERT로 가져옴 (crud.lease 참고)
+- 유지: 보유 중에는 백그라운드 스레드가 LEASE_RENEW_SECONDS마다 만료 시간을 연장
+- 반납: 행 삭제. 프로세스가 죽으면 LEASE_TTL_SECONDS 후 다른 보유자가 가져갈 수 있음
+- wait_for: 행을 가져온 뒤 조건이 참이 될 때까지 기다림 (예: 큐 워커가 처리 중인 작업이 끝날 때까지)
+
+만료 판단은 각 서버의 UTC 시계를 쓰므로 서버 시계는 NTP 등으로 맞춰져 있어야 합니다.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+from app.crud import fetch_task as crud_fetch_task
+from app.crud import lease as crud_lease
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 재시도 간격 (초)
+ACQUIRE_POLL_SECONDS = 1.0
+
+
+class DBLease:
+    """
+    이름별 DB 임대 락 (스레드 안전)
+    
+    같은 프로세스 안의 동시 호출은 내부 threading.Lock으로 먼저 막고,
+    다른 프로세스/서버와는 leases 테이블로 막습니다.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: Optional[float] = None,
+        renew_seconds: Optional[float] = None,
+        wait_for: Optional[Callable[[], bool]] = None
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.LEASE_TTL_SECONDS
+        self.renew_seconds = renew_seconds if renew_seconds is not None else settings.LEASE_RENEW_SECONDS
+        self.wait_for = wait_for  # 행을 가져온 뒤 참이 될 때까지 기다릴 조건
+        self.holder: Optional[str] = None
+        self.lost = False  # 보유 중 갱신에 실패해 다른 보유자에게 넘어갔으면 True
+        self._local_lock = threading.Lock()
+        self._stop: Optional[threading.Event] = None
+        self._renewer: Optional[threading.Thread] = None
+    
+    def _new_holder(self) -> str:
+        """보유자 식별자 (fork 이후에도 구분되도록 획득할 때마다 생성)"""
+        return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    
+    def _try_acquire(self, holder: str) -> bool:
+        db = SessionLocal()
+        try:
+            return crud_lease.try_acquire_lease(db, self.name, holder, self.ttl_seconds)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"락 획득 중 오류 ({self.name}): {e}")
+            return False
+        finally:
+            db.close()
+    
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        락 획득
+        
+        Args:
+            timeout: 다른 보유자가 있거나 wait_for가 거짓일 때 기다릴 최대 시간(초) (생략/0이면 기다리지 않음)
+        
+        Returns:
+            획득 여부 (True면 반드시 release() 호출)
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        
+        if deadline is None:
+            if not self._local_lock.acquire(blocking=False):
+                return False
+        elif not self._local_lock.acquire(timeout=timeout):
+            return False
+        
+        holder = self._new_holder()
+        while not self._try_acquire(holder):
+            remaining = deadline - time.monotonic() if deadline is not None else 0
+            if remaining <= 0:
+                self._local_lock.release()
+                return False
+            time.sleep(min(ACQUIRE_POLL_SECONDS, remaining))
+        
+        self.holder = holder
+        self.lost = False
+        self._stop = threading.Event()
+        self._renewer = threading.Thread(
+            target=self._renew_loop,
+            args=(holder, self._stop),
+            name=f"lease-{self.name}",
+            daemon=True
+        )
+        self._renewer.start()
+        logger.info(f"락 획득: {self.name} ({holder})")
+        
+        # 행을 가져온 뒤에 확인해야 그 사이 새로 시작된 작업을 놓치지 않음
+        if self.wait_for is not None and not self._wait_until_ready(deadline):
+            logger.warning(f"대기 조건이 충족되지 않아 락을 반납합니다: {self.name}")
+            self.release()
+            return False
+        return True
+    
+    def _wait_until_ready(self, deadline: Optional[float]) -> bool:
+        """wait_for가 참이 될 때까지 대기 (deadline이 지나면 False)"""
+        while not self.wait_for():
+            remaining = deadline - time.monotonic() if deadline is not None else 0
+            if remaining <= 0:
+                return False
+            time.sleep(min(ACQUIRE_POLL_SECONDS, remaining))
+        return True
+    
+    def _renew_loop(self, holder: str, stop: threading.Event):
+        """보유 중 만료 시간 연장"""
+        while not stop.wait(self.renew_seconds):
+            db = SessionLocal()
+            try:
+                if not crud_lease.renew_lease(db, self.name, holder, self.ttl_seconds):
+                    self.lost = True
+                    logger.error(f"락을 잃었습니다 (만료 후 다른 보유자가 가져감): {self.name}")
+                    return
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"락 갱신 실패 ({self.name}), 다음 주기에 재시도: {e}")
+            finally:
+                db.close()
+    
+    def release(self):
+        """락 반납"""
+        holder = self.holder
+        if self._stop is not None:
+            self._stop.set()
+            self._renewer.join(timeout=self.renew_seconds)
+        self._stop = None
+        self._renewer = None
+        self.holder = None
+        
+        db = SessionLocal()
+        try:
+            crud_lease.release_lease(db, self.name, holder)
+            logger.info(f"락 반납: {self.name}")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"락 반납 실패 ({self.name}), {self.ttl_seconds}초 후 만료됩니다: {e}")
+        finally:
+            db.close()
+            self._local_lock.release()
+    
+    def is_held(self) -> bool:
+        """DB 기준으로 유효한 보유자가 있는지 (이 프로세스 포함)"""
+        db = SessionLocal()
+        try:
+            return crud_lease.is_lease_held(db, self.name)
+        finally:
+            db.close()
+    
+    def status(self) -> Dict:
+        """현재 보유 상태 (DB 기준)"""
+        db = SessionLocal()
+        try:
+            lease = crud_lease.get_lease(db, self.name)
+            return {
+                "name": self.name,
+                "held_here": self.holder is not None,
+                "holder": lease.holder if lease else None,
+                "expires_at": lease.expires_at.isoformat() + "Z" if lease else None
+            }
+        finally:
+            db.close()
+
+
+def _fetch_queue_idle() -> bool:
+    """수집 작업 큐 워커가 처리 중인 작업이 없는지"""
+    db = SessionLocal()
+    try:
+        return crud_fetch_task.count_in_flight_fetch_tasks(db) == 0
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"수집 작업 큐 확인 실패, 처리 중인 작업이 없는 것으로 봅니다: {e}")
+        return True
+    finally:
+        db.close()
+
+
+# 급식 수집 락 (API 수집 작업, 스케줄러, 재파싱, 수집 스크립트 공용)
+# 큐 워커는 이 락이 잡혀 있으면 작업을 가져가지 않고, 락 보유자는 처리 중인 묶음이 끝나길 기다림
+meal_fetch_lease = DBLease("meal_fetch", wait_for=_fetch_queue_idle)
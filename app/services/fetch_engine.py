@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from datetime import date
+from typing import AsyncIterator, Dict, Iterable, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.core.config import settings
+from app.services.meal_service import MealPage
+
+logger = logging.getLogger(__name__)
+
+
+class FetchResult(NamedTuple):
+    """단일 페이지 수집 결과"""
+    restaurant_code: str
+    target_date: date
+    page: Optional[MealPage]
+    error: Optional[Exception]
+    elapsed: float
+    
+    @property
+    def html(self) -> Optional[str]:
+        return self.page.html if self.page else None
+    
+    @property
+    def not_modified(self) -> bool:
+        return bool(self.page and self.page.not_modified)
+
+
+class AsyncFetchEngine:
+    """
+    급식 페이지 비동기 수집 엔진
+    
+    MealService의 블로킹 요청(공용 UpstreamTransport, SECLEVEL=1)을
+    스레드에서 실행하고, 호스트별 세마포어로 동시 요청 수를 제한합니다.
+    완료된 페이지는 도착 순서대로 반환되어 바로 파싱/저장 단계로 넘어갑니다.
+    """
+    
+    def __init__(self, meal_service, concurrency: Optional[int] = None):
+        self.meal_service = meal_service
+        self.concurrency = max(1, concurrency or settings.MEAL_FETCH_CONCURRENCY)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+    
+    def _semaphore_for(self, host: str) -> asyncio.Semaphore:
+        """호스트별 세마포어 (이벤트 루프 안에서만 생성)"""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+    
+    async def _fetch_one(
+        self,
+        restaurant_code: str,
+        target_date: date,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> FetchResult:
+        """세마포어 안에서 페이지 하나 수집"""
+        host = urlparse(settings.HANYANG_BASE_URL).netloc
+        loop = asyncio.get_running_loop()
+        
+        async with self._semaphore_for(host):
+            started = loop.time()
+            try:
+                page = await asyncio.to_thread(
+                    self.meal_service.get_meal_page,
+                    restaurant_code,
+                    target_date.year,
+                    target_date.month,
+                    target_date.day,
+                    etag,
+                    last_modified
+                )
+                return FetchResult(restaurant_code, target_date, page, None, loop.time() - started)
+            except Exception as e:
+                return FetchResult(restaurant_code, target_date, None, e, loop.time() - started)
+    
+    async def fetch_many(
+        self,
+        targets: Iterable[Tuple[str, date]],
+        validators: Optional[Dict[Tuple[str, date], Tuple[Optional[str], Optional[str]]]] = None
+    ) -> AsyncIterator[FetchResult]:
+        """
+        여러 (식당 코드, 날짜) 페이지를 동시에 수집
+        
+        Args:
+            targets: (restaurant_code, date) 목록
+            validators: (restaurant_code, date) -> (ETag, Last-Modified), 있으면 조건부 요청
+        
+        Yields:
+            완료된 순서대로 FetchResult
+        """
+        validators = validators or {}
+        tasks = [
+            asyncio.create_task(
+                self._fetch_one(
+                    restaurant_code,
+                    target_date,
+                    *validators.get((restaurant_code, target_date), (None, None))
+                )
+            )
+            for restaurant_code, target_date in targets
+        ]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 소비자가 중간에 멈춘 경우 남은 요청 정리
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
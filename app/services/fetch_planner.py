@@ -0,0 +1,209 @@
+"""
+적응형 급식 수집 계획
+
+매 주기마다 어떤 (식당, 날짜)를 다시 가져올지 정합니다.
+
+- 오늘/내일: 각 식사 시간(RESTAURANT_OPEN_TIMES) 시작 직전에 갱신 (긴급)
+- 그 이후 날짜: 마지막 변경 이후 안정적이었던 기간에 비례해 재수집 간격을 늘림 (일반)
+- 하루 요청 수는 MEAL_FETCH_DAILY_BUDGET 이내로 제한하고,
+  남은 식사 시간 갱신에 필요한 요청은 일반 수집에 쓰지 않도록 남겨 둠
+"""
+import logging
+import threading
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.models.fetch_state import MealFetchState
+
+logger = logging.getLogger(__name__)
+
+# 식사 시간 직전 갱신 대상 (오늘, 내일)
+NEAR_TERM_DAYS = 2
+
+
+class FetchPlan(NamedTuple):
+    """이번 주기의 수집 계획"""
+    targets: List[Tuple[str, date]]
+    urgent: int  # 식사 시간 직전 갱신
+    routine: int  # 재수집 간격이 지난 날짜
+    deferred: int  # 예산 부족으로 다음 주기로 미룬 수
+
+
+def parse_window_start(window: Optional[str]) -> Optional[dt_time]:
+    """'11:30 ~ 13:30' 형식의 식사 시간에서 시작 시간 추출"""
+    if not window:
+        return None
+    try:
+        hour, minute = window.split("~")[0].strip().split(":")
+        return dt_time(int(hour), int(minute))
+    except ValueError:
+        logger.warning(f"식사 시간 형식 오류: {window}")
+        return None
+
+
+def _to_local(value: Optional[datetime]) -> Optional[datetime]:
+    """DB 시간을 서버 로컬 naive datetime으로 변환"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+
+class FetchPlanner:
+    """식사 시간, 변경 이력, 일일 예산 기반 수집 대상 선정 (스레드 안전)"""
+    
+    def __init__(
+        self,
+        daily_budget: Optional[int] = None,
+        prewindow_minutes: Optional[int] = None,
+        min_interval_hours: Optional[float] = None,
+        max_interval_hours: Optional[float] = None
+    ):
+        self.daily_budget = daily_budget if daily_budget is not None else settings.MEAL_FETCH_DAILY_BUDGET
+        self.prewindow = timedelta(
+            minutes=prewindow_minutes if prewindow_minutes is not None else settings.MEAL_FETCH_PREWINDOW_MINUTES
+        )
+        self.min_interval = timedelta(
+            hours=min_interval_hours if min_interval_hours is not None else settings.MEAL_FETCH_MIN_INTERVAL_HOURS
+        )
+        self.max_interval = timedelta(
+            hours=max_interval_hours if max_interval_hours is not None else settings.MEAL_FETCH_MAX_INTERVAL_HOURS
+        )
+        self._budget_day: Optional[date] = None
+        self._used = 0
+        self._last_plan: Optional[Dict] = None
+        self._lock = threading.Lock()
+    
+    def refresh_points(self, restaurant_code: str, day: date) -> List[datetime]:
+        """식당의 식사 시간 직전 갱신 시각 목록 (시간순)"""
+        open_times = settings.RESTAURANT_OPEN_TIMES.get(restaurant_code) or {}
+        points = []
+        for window in open_times.values():
+            start = parse_window_start(window)
+            if start is not None:
+                points.append(datetime.combine(day, start) - self.prewindow)
+        return sorted(points)
+    
+    def revisit_interval(self, state: MealFetchState) -> timedelta:
+        """
+        재수집 간격
+        
+        마지막 변경 이후 안정적이었던 기간의 절반을 기다립니다.
+        자주 바뀌는 날짜는 min_interval, 오래 그대로인 날짜는 max_interval까지 늘어납니다.
+        """
+        checked_at = _to_local(state.checked_at)
+        changed_at = _to_local(state.changed_at) or checked_at
+        stable_for = max(timedelta(0), checked_at - changed_at)
+        return min(self.max_interval, max(self.min_interval, stable_for / 2))
+    
+    def _reset_budget_if_new_day(self, now: datetime, states: Dict[Tuple[str, date], MealFetchState]):
+        """날짜가 바뀌면 예산 초기화 (재시작 후에는 오늘 확인한 페이지 수로 복원)"""
+        if self._budget_day == now.date():
+            return
+        
+        used = 0
+        if self._budget_day is None:
+            midnight = datetime.combine(now.date(), dt_time.min)
+            used = sum(
+                1 for state in states.values()
+                if state.checked_at is not None and _to_local(state.checked_at) >= midnight
+            )
+        self._budget_day = now.date()
+        self._used = used
+    
+    def plan(
+        self,
+        states: Dict[Tuple[str, date], MealFetchState],
+        now: Optional[datetime] = None
+    ) -> FetchPlan:
+        """
+        이번 주기에 수집할 대상 선정
+        
+        Args:
+            states: (식당 코드, 날짜) -> 수집 상태 (오늘부터 MEAL_FETCH_DAYS_AHEAD일 후까지)
+            now: 기준 시각 (생략시 현재)
+        
+        Returns:
+            FetchPlan: 긴급 대상이 앞에 오도록 정렬된 수집 계획
+        """
+        now = now or datetime.now()
+        today = now.date()
+        
+        urgent: List[Tuple[str, date]] = []
+        routine: List[Tuple[float, date, str]] = []
+        pending_points = 0
+        
+        for restaurant_code in settings.RESTAURANT_CODES:
+            points = self.refresh_points(restaurant_code, today)
+            passed = [point for point in points if point <= now]
+            last_point = passed[-1] if passed else None
+            pending_points += len(points) - len(passed)
+            
+            for offset in range(settings.MEAL_FETCH_DAYS_AHEAD + 1):
+                target_date = today + timedelta(days=offset)
+                state = states.get((restaurant_code, target_date))
+                checked_at = _to_local(state.checked_at) if state is not None else None
+                
+                if offset < NEAR_TERM_DAYS and last_point is not None:
+                    if checked_at is None or checked_at < last_point:
+                        urgent.append((restaurant_code, target_date))
+                        continue
+                
+                if checked_at is None:
+                    routine.append((float("inf"), target_date, restaurant_code))
+                    continue
+                
+                overdue = (now - checked_at) / self.revisit_interval(state)
+                if overdue >= 1:
+                    routine.append((overdue, target_date, restaurant_code))
+        
+        # 가장 오래 밀린 것부터, 같으면 가까운 날짜부터
+        routine.sort(key=lambda item: (-item[0], item[1]))
+        
+        with self._lock:
+            self._reset_budget_if_new_day(now, states)
+            remaining = max(0, self.daily_budget - self._used)
+            
+            urgent_targets = urgent[:remaining]
+            remaining -= len(urgent_targets)
+            
+            # 오늘 남은 식사 시간 직전 갱신(오늘+내일)에 쓸 요청은 남겨 둠
+            reserve = pending_points * NEAR_TERM_DAYS
+            routine_targets = [
+                (restaurant_code, target_date)
+                for _, target_date, restaurant_code in routine[:max(0, remaining - reserve)]
+            ]
+            
+            plan = FetchPlan(
+                targets=urgent_targets + routine_targets,
+                urgent=len(urgent_targets),
+                routine=len(routine_targets),
+                deferred=len(urgent) + len(routine) - len(urgent_targets) - len(routine_targets)
+            )
+            self._last_plan = {
+                "planned_at": now.isoformat(timespec="seconds"),
+                "urgent": plan.urgent,
+                "routine": plan.routine,
+                "deferred": plan.deferred,
+                "reserved": reserve
+            }
+        
+        return plan
+    
+    def record_requests(self, count: int):
+        """실제로 보낸 요청 수를 예산에 반영"""
+        with self._lock:
+            self._used += count
+    
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "budget_day": self._budget_day.isoformat() if self._budget_day else None,
+                "daily_budget": self.daily_budget,
+                "used": self._used,
+                "remaining": max(0, self.daily_budget - self._used),
+                "last_plan": self._last_plan
+            }
+
+
+fetch_planner = FetchPlanner()
@@ -0,0 +1,208 @@
+"""
+분산 수집 작업 큐 워커
+
+fetch_tasks 테이블의 (식당, 날짜) 작업을 모든 워커/서버가 나눠 처리합니다.
+한 번에 FETCH_QUEUE_BATCH_SIZE개를 가져가(claim) MealFetcher로 수집/저장하고,
+대상별로 완료 또는 실패(재시도 예약)를 기록합니다.
+
+- 전체 수집 락(meal_fetch_lease) 대신 작업별 claim으로 배타 처리하므로 여러 노드가 동시에 수집
+- 관리자 수집/재파싱/수집 스크립트가 meal_fetch_lease를 잡고 있으면 작업을 가져가지 않음
+  (락 보유자는 처리 중인 묶음이 끝날 때까지 기다린 뒤 시작하므로 같은 대상을 동시에 저장하지 않음)
+- 처리 중에는 가시성 타임아웃을 주기적으로 연장하고, 프로세스가 죽으면
+  FETCH_QUEUE_VISIBILITY_SECONDS 후 다른 워커가 다시 가져감
+- 실패한 작업은 FETCH_QUEUE_MAX_ATTEMPTS번까지 지수 백오프로 재시도
+- 한양대 서버 요청 속도 제한은 프로세스별이므로 전체 요청 속도는 워커 프로세스 수에 비례
+"""
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.crud import fetch_task as crud_fetch_task
+from app.db.session import SessionLocal
+from app.services.db_lease import meal_fetch_lease
+from app.services.meal_fetcher import meal_fetcher
+
+logger = logging.getLogger(__name__)
+
+
+class FetchQueueWorker:
+    """수집 작업 큐 워커 (백그라운드 스레드 하나)"""
+    
+    def __init__(self, batch_size: Optional[int] = None, poll_seconds: Optional[float] = None):
+        self.batch_size = max(1, batch_size or settings.FETCH_QUEUE_BATCH_SIZE)
+        self.poll_seconds = poll_seconds if poll_seconds is not None else settings.FETCH_QUEUE_POLL_SECONDS
+        self.processed = 0
+        self.failed = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def _new_token(self) -> str:
+        """claim 토큰 (배치마다 새로 생성)"""
+        return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    
+    def process_batch(self) -> int:
+        """
+        작업 한 묶음 가져와서 처리
+        
+        Returns:
+            가져간 작업 수 (0이면 처리할 작업이 없거나 수집 락 보유자가 있음)
+        """
+        if meal_fetch_lease.is_held():
+            return 0
+        
+        token = self._new_token()
+        db = SessionLocal()
+        heartbeat_stop = threading.Event()
+        heartbeat: Optional[threading.Thread] = None
+        try:
+            tasks = crud_fetch_task.claim_fetch_tasks(
+                db,
+                token,
+                self.batch_size,
+                settings.FETCH_QUEUE_VISIBILITY_SECONDS,
+                settings.FETCH_QUEUE_MAX_ATTEMPTS
+            )
+            if not tasks:
+                return 0
+            
+            # 가져가는 사이 락을 잡은 보유자는 이 작업들이 끝나길 기다리므로 처리하지 않고 돌려놓음
+            if meal_fetch_lease.is_held():
+                crud_fetch_task.release_fetch_tasks(db, [task.id for task in tasks], token)
+                return 0
+            
+            task_ids = {(task.restaurant_code, task.date): task.id for task in tasks}
+            heartbeat = threading.Thread(
+                target=self._extend_claims,
+                args=(list(task_ids.values()), token, heartbeat_stop),
+                name="fetch-queue-heartbeat",
+                daemon=True
+            )
+            heartbeat.start()
+            
+            groups: Dict[bool, List[Tuple[str, date]]] = {False: [], True: []}
+            for task in tasks:
+                groups[bool(task.force)].append((task.restaurant_code, task.date))
+            errors: Dict[Tuple[str, date], Optional[str]] = {}
+            
+            def on_result(restaurant_code: str, target_date: date, error: Optional[str]):
+                errors[(restaurant_code, target_date)] = error
+            
+            # force 여부별로 나눠 수집 (작업별 claim으로 배타 처리하므로 전체 수집 락 없이)
+            for force, targets in groups.items():
+                if not targets:
+                    continue
+                try:
+                    meal_fetcher.fetch_and_store_targets(
+                        db, targets, force, lock=False, on_result=on_result
+                    )
+                except Exception as e:
+                    db.rollback()
+                    for target in targets:
+                        errors.setdefault(target, str(e))
+            
+            heartbeat_stop.set()
+            heartbeat.join()
+            
+            done_ids = []
+            for key, task_id in task_ids.items():
+                error = errors.get(key, "처리되지 않았습니다.")
+                if error is None:
+                    done_ids.append(task_id)
+                    continue
+                self.failed += 1
+                crud_fetch_task.fail_fetch_task(
+                    db,
+                    task_id,
+                    token,
+                    error,
+                    settings.FETCH_QUEUE_MAX_ATTEMPTS,
+                    settings.FETCH_QUEUE_RETRY_BACKOFF_SECONDS
+                )
+            
+            crud_fetch_task.complete_fetch_tasks(db, done_ids, token)
+            self.processed += len(done_ids)
+            logger.info(f"수집 작업 큐: {len(tasks)}건 처리 (완료 {len(done_ids)}, 실패 {len(tasks) - len(done_ids)})")
+            return len(tasks)
+        finally:
+            heartbeat_stop.set()
+            db.close()
+    
+    def _extend_claims(self, task_ids: List[int], token: str, stop: threading.Event):
+        """처리 중 가시성 타임아웃 연장 (묶음이 타임아웃보다 오래 걸려도 다른 워커가 다시 가져가지 않게)"""
+        visibility = settings.FETCH_QUEUE_VISIBILITY_SECONDS
+        while not stop.wait(max(1.0, visibility / 3)):
+            db = SessionLocal()
+            try:
+                crud_fetch_task.extend_fetch_tasks(db, task_ids, token, visibility)
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"수집 작업 가시성 연장 실패, 다음 주기에 재시도: {e}")
+            finally:
+                db.close()
+    
+    def _queue_is_empty(self) -> bool:
+        """재시도/타임아웃을 기다리는 작업까지 모두 끝났는지"""
+        db = SessionLocal()
+        try:
+            return crud_fetch_task.count_unfinished_fetch_tasks(db) == 0
+        finally:
+            db.close()
+    
+    def run(self, stop_when_empty: bool = False):
+        """
+        작업 처리 반복
+        
+        Args:
+            stop_when_empty: True면 대기/처리 중인 작업이 하나도 없을 때 종료
+                (다른 워커가 처리 중이거나 재시도를 기다리는 작업이 있으면 계속 대기)
+        """
+        while not self._stop.is_set():
+            try:
+                claimed = self.process_batch()
+            except Exception as e:
+                logger.error(f"수집 작업 큐 처리 실패: {e}")
+                claimed = 0
+            
+            if not claimed:
+                if stop_when_empty and self._queue_is_empty():
+                    return
+                self._stop.wait(self.poll_seconds)
+    
+    def start(self):
+        """백그라운드 스레드에서 실행"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="fetch-queue-worker", daemon=True)
+        self._thread.start()
+        logger.info(f"수집 작업 큐 워커 시작 (PID: {os.getpid()}, 배치 {self.batch_size}건)")
+    
+    def stop(self, timeout: Optional[float] = None):
+        """중지 (처리 중인 묶음은 끝날 때까지 최대 timeout초 대기, 남은 작업은 타임아웃 후 다른 워커가 처리)"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def stats(self) -> Dict:
+        """이 프로세스 워커 통계와 큐 전체 상태"""
+        db = SessionLocal()
+        try:
+            return {
+                "enabled": settings.FETCH_QUEUE_ENABLED,
+                "worker_running": self._thread is not None,
+                "processed": self.processed,
+                "failed": self.failed,
+                "queue": crud_fetch_task.get_fetch_queue_stats(db)
+            }
+        finally:
+            db.close()
+
+
+# 싱글톤 인스턴스
+fetch_queue_worker = FetchQueueWorker()
@@ -0,0 +1,207 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.html_digest import compute_content_hash
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 gzip 사용
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+
+class HTMLArchive:
+    """
+    수집한 원본 HTML의 압축 보관소 (콘텐츠 주소 방식)
+    
+    디렉터리 구조:
+        objects/ab/abcdef....html.zst  - sha256(원본 HTML)로 저장된 압축 본문
+        refs/re11/2025-09-01.json      - 식당/날짜별 최신 다이제스트와 이력
+    
+    페이지마다 요청별 인증 토큰이 섞여 있으므로, 정규화된 HTML 해시(compute_content_hash)가
+    최신 참조와 같으면 새로 저장하지 않습니다. 내용이 바뀐 페이지만 저장되고 이력은
+    history_limit개까지 남기며, 네트워크 없이 재파싱할 수 있습니다.
+    """
+    
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        compression: Optional[str] = None,
+        history_limit: Optional[int] = None
+    ):
+        self.root = Path(root or settings.MEAL_HTML_ARCHIVE_DIR)
+        if compression is None:
+            compression = "zstd" if zstandard is not None else "gzip"
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다.")
+        self.compression = compression
+        self.history_limit = max(1, settings.MEAL_HTML_ARCHIVE_HISTORY if history_limit is None else history_limit)
+    
+    @property
+    def _suffix(self) -> str:
+        return ".html.zst" if self.compression == "zstd" else ".html.gz"
+    
+    def _object_path(self, digest: str, suffix: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}{suffix}"
+    
+    def _ref_path(self, restaurant_code: str, target_date: date) -> Path:
+        return self.root / "refs" / restaurant_code / f"{target_date.isoformat()}.json"
+    
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=6)
+    
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        """임시 파일에 쓴 뒤 교체 (동시 수집 스레드 간 충돌 방지)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    
+    def put(self, restaurant_code: str, target_date: date, html: str) -> str:
+        """
+        HTML 저장
+        
+        Args:
+            restaurant_code: 식당 코드
+            target_date: 급식 날짜
+            html: 원본 HTML
+        
+        Returns:
+            sha256 다이제스트 (내용이 최신 참조와 같으면 최신 참조의 다이제스트)
+        """
+        content_hash = compute_content_hash(html)
+        ref_path = self._ref_path(restaurant_code, target_date)
+        ref = self._read_ref(ref_path) or {"history": []}
+        if ref.get("digest") and self._ref_content_hash(ref) == content_hash:
+            # 토큰만 다른 같은 내용
+            return ref["digest"]
+        
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        
+        # 본문 (이미 있으면 건너뜀)
+        if self._find_object(digest) is None:
+            self._atomic_write(self._object_path(digest, self._suffix), self._compress(data))
+        
+        # 식당/날짜 참조 갱신 (이력은 최근 history_limit개만, 본문은 다른 참조와 공유될 수 있어 남김)
+        ref["digest"] = digest
+        ref["content_hash"] = content_hash
+        ref["history"].append({
+            "digest": digest,
+            "fetched_at": datetime.now().isoformat(timespec="seconds")
+        })
+        ref["history"] = ref["history"][-self.history_limit:]
+        self._atomic_write(ref_path, json.dumps(ref, ensure_ascii=False).encode("utf-8"))
+        
+        return digest
+    
+    def _ref_content_hash(self, ref: dict) -> Optional[str]:
+        """최신 참조의 정규화 해시 (예전 참조에는 없으므로 본문에서 계산)"""
+        if ref.get("content_hash"):
+            return ref["content_hash"]
+        try:
+            return compute_content_hash(self.get(ref["digest"]))
+        except FileNotFoundError:
+            return None
+    
+    def _find_object(self, digest: str) -> Optional[Path]:
+        for suffix in (".html.zst", ".html.gz"):
+            path = self._object_path(digest, suffix)
+            if path.exists():
+                return path
+        return None
+    
+    @staticmethod
+    def _read_ref(ref_path: Path) -> Optional[dict]:
+        if not ref_path.exists():
+            return None
+        with open(ref_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def get(self, digest: str) -> str:
+        """
+        다이제스트로 HTML 읽기
+        
+        Raises:
+            FileNotFoundError: 보관된 본문이 없는 경우
+        """
+        path = self._find_object(digest)
+        if path is None:
+            raise FileNotFoundError(f"보관된 HTML이 없습니다: {digest}")
+        
+        raw = path.read_bytes()
+        if path.name.endswith(".zst"):
+            if zstandard is None:
+                raise ValueError("zstd로 압축된 HTML을 읽으려면 zstandard 패키지가 필요합니다.")
+            data = zstandard.ZstdDecompressor().decompress(raw)
+        else:
+            data = gzip.decompress(raw)
+        return data.decode("utf-8")
+    
+    def get_latest(self, restaurant_code: str, target_date: date) -> Optional[str]:
+        """식당/날짜의 가장 최근 HTML (없으면 None)"""
+        ref = self._read_ref(self._ref_path(restaurant_code, target_date))
+        if not ref:
+            return None
+        return self.get(ref["digest"])
+    
+    def iter_entries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        restaurant_codes: Optional[List[str]] = None
+    ) -> Iterator[Tuple[str, date, str]]:
+        """
+        보관된 (식당 코드, 날짜, 다이제스트) 목록 (식당, 날짜 순)
+        
+        Args:
+            start_date: 시작 날짜 (포함, 생략시 제한 없음)
+            end_date: 종료 날짜 (포함, 생략시 제한 없음)
+            restaurant_codes: 식당 코드 필터 (생략시 전체)
+        """
+        refs_root = self.root / "refs"
+        if not refs_root.exists():
+            return
+        
+        for restaurant_dir in sorted(refs_root.iterdir()):
+            if not restaurant_dir.is_dir():
+                continue
+            if restaurant_codes and restaurant_dir.name not in restaurant_codes:
+                continue
+            
+            for ref_path in sorted(restaurant_dir.glob("*.json")):
+                try:
+                    target_date = date.fromisoformat(ref_path.stem)
+                except ValueError:
+                    continue
+                
+                if start_date and target_date < start_date:
+                    continue
+                if end_date and target_date > end_date:
+                    continue
+                
+                ref = self._read_ref(ref_path)
+                if ref and ref.get("digest"):
+                    yield restaurant_dir.name, target_date, ref["digest"]
+
+
+# 싱글톤 인스턴스
+html_archive = HTMLArchive()
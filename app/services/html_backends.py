@@ -0,0 +1,263 @@
+"""
+급식 HTML 파싱 백엔드
+
+HTMLParser가 사용하는 DOM 추출 단계입니다.
+- lxml: C 기반 파서 (설치되어 있으면 기본값)
+- bs4: BeautifulSoup + html.parser (lxml이 없거나 lxml 파싱에 실패했을 때 사용)
+
+두 백엔드는 같은 구조(PageExtract)를 돌려주며, 메뉴 텍스트 해석은 HTMLParser가 담당합니다.
+"""
+import logging
+from typing import Dict, List, NamedTuple, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # lxml 미설치 시 BeautifulSoup만 사용
+    etree = None
+    lxml_html = None
+
+logger = logging.getLogger(__name__)
+
+HANYANG_ORIGIN = "https://www.hanyang.ac.kr"
+
+# 식사 제목과 메뉴 아이템 (문서 순서대로 한 번에 선택)
+SECTION_SELECTOR = "h4.d-title2, div.bbs ul.thumbnails li.span3"
+
+
+class MenuSection(NamedTuple):
+    """h4.d-title2 제목과, 다음 제목 전까지 나오는 메뉴 아이템 (menu_text, price, image_url)"""
+    title: str
+    items: List[Dict]
+
+
+class PageExtract(NamedTuple):
+    """급식 페이지에서 추출한 원시 데이터"""
+    restaurant: str
+    date: str
+    day_of_week: str
+    sections: List[MenuSection]
+
+
+EMPTY_PAGE = PageExtract(restaurant="", date="", day_of_week="", sections=[])
+
+
+def _menu_item(menu_text: str, price_text: str, image_url: str) -> Dict:
+    if image_url.startswith("/"):
+        image_url = HANYANG_ORIGIN + image_url
+    return {
+        "menu_text": menu_text,
+        "price": price_text,
+        "image_url": image_url
+    }
+
+
+class SoupBackend:
+    """BeautifulSoup(html.parser) 백엔드"""
+    
+    name = "bs4"
+    
+    def extract(self, html: str) -> PageExtract:
+        soup = BeautifulSoup(html, "html.parser")
+        date, day_of_week = self._parse_date_info(soup)
+        return PageExtract(
+            restaurant=self._parse_restaurant_name(soup),
+            date=date,
+            day_of_week=day_of_week,
+            sections=self._parse_sections(soup)
+        )
+    
+    def _parse_restaurant_name(self, soup: BeautifulSoup) -> str:
+        """식당 이름 파싱"""
+        restaurant_tag = soup.find("strong", class_="font-point5")
+        if restaurant_tag:
+            return restaurant_tag.get_text(strip=True)
+        return ""
+    
+    def _parse_date_info(self, soup: BeautifulSoup) -> tuple:
+        """날짜와 요일 파싱"""
+        date = ""
+        day_of_week = ""
+        
+        day_selc = soup.find("div", class_="day-selc")
+        if day_selc:
+            date_tag = day_selc.find("strong")
+            if date_tag:
+                date = date_tag.get_text(strip=True)
+            
+            # strong 태그 바로 다음 span 태그가 요일
+            spans = day_selc.find_all("span")
+            for span in spans:
+                if span.get_text(strip=True) and not span.get("class"):
+                    day_of_week = span.get_text(strip=True)
+                    break
+        
+        return date, day_of_week
+    
+    def _parse_sections(self, soup: BeautifulSoup) -> List[MenuSection]:
+        """
+        식사 제목(h4.d-title2)과 메뉴(div.bbs ul.thumbnails li.span3)를 문서 순서대로 한 번만 훑어
+        각 메뉴를 바로 앞의 제목에 배정
+        """
+        sections: List[MenuSection] = []
+        
+        for element in soup.select(SECTION_SELECTOR):
+            if element.name == "h4":
+                sections.append(MenuSection(element.get_text(strip=True), []))
+            elif sections:
+                menu_item = self._parse_menu_li(element)
+                if menu_item:
+                    sections[-1].items.append(menu_item)
+        
+        return sections
+    
+    def _parse_menu_li(self, li) -> Optional[Dict]:
+        """li.span3 하나에서 메뉴 텍스트, 가격, 이미지 추출"""
+        # h3 태그에서 메뉴 텍스트 가져오기
+        h3_tag = li.find("h3")
+        menu_text = h3_tag.get_text(strip=True) if h3_tag else ""
+        if not menu_text:
+            return None
+        
+        # p.price 태그에서 가격 가져오기
+        price_tag = li.find("p", class_="price")
+        price_text = price_tag.get_text(strip=True) if price_tag else ""
+        
+        # img 태그에서 이미지 URL 가져오기
+        img_tag = li.find("img")
+        image_url = img_tag.get("src", "") if img_tag else ""
+        
+        return _menu_item(menu_text, price_text, image_url)
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """BeautifulSoup의 class_ 검색과 같은 조건 (공백으로 구분된 클래스 중 하나)"""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+class LxmlBackend:
+    """
+    lxml 백엔드
+    
+    텍스트는 BeautifulSoup의 get_text(strip=True)와 같게
+    텍스트 노드마다 앞뒤 공백을 제거한 뒤 이어 붙입니다 (주석/스크립트 제외).
+    """
+    
+    name = "lxml"
+    
+    def __init__(self):
+        def xpath(path: str):
+            return etree.XPath(path, smart_strings=False)
+        
+        self._text_nodes = xpath(".//text()[not(ancestor::script or ancestor::style)]")
+        self._restaurant = xpath("//" + _class_xpath("strong", "font-point5"))
+        self._day_selc = xpath("//" + _class_xpath("div", "day-selc"))
+        # SECTION_SELECTOR와 같은 조건 (합집합 결과는 문서 순서, 중복 없음)
+        self._sections = xpath(
+            "//" + _class_xpath("h4", "d-title2")
+            + " | //" + _class_xpath("div", "bbs")
+            + "//" + _class_xpath("ul", "thumbnails")
+            + "//" + _class_xpath("li", "span3")
+        )
+        self._price = xpath(".//" + _class_xpath("p", "price"))
+    
+    def _text(self, element) -> str:
+        if element is None:
+            return ""
+        return "".join(text.strip() for text in self._text_nodes(element))
+    
+    def _first(self, elements):
+        return elements[0] if elements else None
+    
+    def extract(self, html: str) -> PageExtract:
+        if not html or not html.strip():
+            return EMPTY_PAGE
+        
+        root = lxml_html.document_fromstring(html)
+        date, day_of_week = self._parse_date_info(root)
+        return PageExtract(
+            restaurant=self._text(self._first(self._restaurant(root))),
+            date=date,
+            day_of_week=day_of_week,
+            sections=self._parse_sections(root)
+        )
+    
+    def _parse_date_info(self, root) -> tuple:
+        date = ""
+        day_of_week = ""
+        
+        day_selc = self._first(self._day_selc(root))
+        if day_selc is not None:
+            date = self._text(day_selc.find(".//strong"))
+            
+            for span in day_selc.iterfind(".//span"):
+                text = self._text(span)
+                if text and not (span.get("class") or "").split():
+                    day_of_week = text
+                    break
+        
+        return date, day_of_week
+    
+    def _parse_sections(self, root) -> List[MenuSection]:
+        sections: List[MenuSection] = []
+        
+        for element in self._sections(root):
+            if element.tag == "h4":
+                sections.append(MenuSection(self._text(element), []))
+            elif sections:
+                menu_item = self._parse_menu_li(element)
+                if menu_item:
+                    sections[-1].items.append(menu_item)
+        
+        return sections
+    
+    def _parse_menu_li(self, li) -> Optional[Dict]:
+        menu_text = self._text(li.find(".//h3"))
+        if not menu_text:
+            return None
+        
+        price_text = self._text(self._first(self._price(li)))
+        img_tag = li.find(".//img")
+        image_url = img_tag.get("src", "") if img_tag is not None else ""
+        
+        return _menu_item(menu_text, price_text, image_url)
+
+
+class FallbackBackend:
+    """lxml로 먼저 파싱하고, 실패하면 BeautifulSoup으로 다시 파싱"""
+    
+    name = "lxml"
+    
+    def __init__(self):
+        self.primary = LxmlBackend()
+        self.fallback = SoupBackend()
+    
+    def extract(self, html: str) -> PageExtract:
+        try:
+            return self.primary.extract(html)
+        except Exception as e:
+            logger.warning(f"lxml 파싱 실패, BeautifulSoup으로 다시 파싱합니다: {e}")
+            return self.fallback.extract(html)
+
+
+def get_backend(name: str = "auto"):
+    """
+    파싱 백엔드 생성
+    
+    Args:
+        name: "auto" (lxml이 있으면 lxml), "lxml", "bs4"
+    """
+    if name == "bs4":
+        return SoupBackend()
+    
+    if name not in ("auto", "lxml"):
+        raise ValueError(f"알 수 없는 HTML 파싱 백엔드: {name}")
+    
+    if etree is None:
+        if name == "lxml":
+            logger.warning("lxml이 설치되어 있지 않아 BeautifulSoup 백엔드를 사용합니다.")
+        return SoupBackend()
+    
+    return FallbackBackend()
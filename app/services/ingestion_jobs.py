@@ -0,0 +1,156 @@
+"""
+급식 수집 작업 관리
+
+관리자 API(/meals/fetch, /meals/refetch)로 요청한 수집을 작업 ID가 있는 작업으로 실행합니다.
+작업은 요청 세션과 무관하게 자체 DB 세션(SessionLocal)을 열고 닫으며,
+전용 스레드에서 요청 순서대로 하나씩 실행됩니다.
+상태, 진행률, 식당별 결과와 소요 시간은 작업 ID로 조회할 수 있습니다 (프로세스 메모리에 최근 작업만 보관).
+"""
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.meal_fetcher import meal_fetcher
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class IngestionJob:
+    """수집 작업 하나의 상태"""
+    
+    def __init__(self, kind: str, targets: List[Tuple[str, date]], force: bool = False):
+        self.id = uuid.uuid4().hex
+        self.kind = kind  # "fetch" (전체 기간) 또는 "refetch" (지정 식당/날짜)
+        self.targets = targets
+        self.force = force
+        self.status = JOB_QUEUED
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.done = 0
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        """API 응답용 딕셔너리"""
+        dates = [target_date for _, target_date in self.targets]
+        duration = None
+        if self.started_at is not None:
+            duration = round(((self.finished_at or datetime.now()) - self.started_at).total_seconds(), 3)
+        
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "force": self.force,
+            "restaurant_codes": sorted({code for code, _ in self.targets}),
+            "start_date": min(dates).isoformat() if dates else None,
+            "end_date": max(dates).isoformat() if dates else None,
+            "progress": {"done": self.done, "total": len(self.targets)},
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "duration_seconds": duration,
+            "result": self.result,
+            "error": self.error
+        }
+
+
+class IngestionJobRunner:
+    """
+    수집 작업 실행기 (스레드 안전)
+    
+    수집은 한 번에 하나만 실행되므로(MealFetcher 락) 작업도 단일 스레드에서 순서대로 실행하고,
+    스케줄러 수집이 진행 중이면 INGESTION_JOB_LOCK_WAIT_SECONDS까지 기다립니다.
+    """
+    
+    def __init__(self, history: Optional[int] = None):
+        self.history = max(1, history if history is not None else settings.INGESTION_JOB_HISTORY)
+        self._jobs: "OrderedDict[str, IngestionJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def submit(self, kind: str, targets: List[Tuple[str, date]], force: bool = False) -> IngestionJob:
+        """작업 등록 후 실행 대기열에 추가"""
+        job = IngestionJob(kind, targets, force)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingestion-job")
+            self._jobs[job.id] = job
+            self._trim()
+            self._executor.submit(self._run, job)
+        
+        logger.info(f"수집 작업 등록: {job.id} ({kind}, {len(targets)}건)")
+        return job
+    
+    def _trim(self):
+        """오래된 완료 작업 정리 (대기/실행 중인 작업은 유지)"""
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.history:
+                break
+            if self._jobs[job_id].status in (JOB_SUCCEEDED, JOB_FAILED):
+                del self._jobs[job_id]
+    
+    def _run(self, job: IngestionJob):
+        """작업 실행 (작업 전용 DB 세션 사용)"""
+        job.status = JOB_RUNNING
+        job.started_at = datetime.now()
+        
+        def on_progress(done: int, total: int):
+            job.done = done
+        
+        db = SessionLocal()
+        try:
+            summary = meal_fetcher.fetch_and_store_targets(
+                db,
+                job.targets,
+                job.force,
+                progress=on_progress,
+                lock_timeout=settings.INGESTION_JOB_LOCK_WAIT_SECONDS
+            )
+            job.result = summary
+            if summary["busy"]:
+                job.status = JOB_FAILED
+                job.error = "다른 급식 정보 수집이 진행 중이라 실행하지 못했습니다."
+            else:
+                job.status = JOB_SUCCEEDED
+        except Exception as e:
+            job.status = JOB_FAILED
+            job.error = str(e)
+            logger.error(f"수집 작업 실패: {job.id}: {e}")
+        finally:
+            db.close()
+            job.finished_at = datetime.now()
+            logger.info(f"수집 작업 종료: {job.id} ({job.status})")
+    
+    def get(self, job_id: str) -> Optional[IngestionJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def recent(self) -> List[IngestionJob]:
+        """보관 중인 작업 (최근 순)"""
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+    
+    def shutdown(self):
+        """실행기 종료 (대기 중인 작업은 취소, 실행 중인 작업은 기다리지 않음)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 싱글톤 인스턴스
+ingestion_job_runner = IngestionJobRunner()
@@ -0,0 +1,95 @@
+"""
+스케줄러 리더 선출
+
+모든 워커/서버가 같은 DB의 임대 락(scheduler_leader)을 주기적으로 시도하고,
+획득한 프로세스 하나만 스케줄러를 실행합니다.
+
+- 리더는 DBLease의 갱신 스레드로 락을 유지
+- 리더가 죽으면 LEASE_TTL_SECONDS 후 만료되고, 다른 프로세스가 다음 확인 때 리더가 되어 스케줄러 시작
+- 갱신에 실패해 락을 잃으면 스케줄러를 일시 정지하고 다시 후보로 돌아감
+- 종료 시 리더면 스케줄러를 멈추고 락을 반납해 다른 프로세스가 바로 넘겨받음
+"""
+import asyncio
+import logging
+import os
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.services.db_lease import DBLease
+from app.services.scheduler import scheduler, start_scheduler, stop_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulerLeader:
+    """DB 임대 락 기반 스케줄러 리더 선출 (이벤트 루프에서 실행)"""
+    
+    def __init__(self, lease: Optional[DBLease] = None, check_seconds: Optional[float] = None):
+        self.lease = lease or DBLease("scheduler_leader")
+        self.check_seconds = check_seconds if check_seconds is not None else settings.SCHEDULER_LEADER_CHECK_SECONDS
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self):
+        """리더 선출 시작 (첫 시도는 즉시)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def _run(self):
+        while True:
+            try:
+                await self._check()
+            except Exception as e:
+                logger.error(f"스케줄러 리더 확인 실패: {e}")
+            await asyncio.sleep(self.check_seconds)
+    
+    async def _check(self):
+        """락 상태에 따라 리더 전환"""
+        if self.is_leader:
+            if self.lease.lost:
+                self.is_leader = False
+                scheduler.pause()
+                await asyncio.to_thread(self.lease.release)
+                logger.warning(f"스케줄러 리더 지위를 잃어 스케줄러를 일시 정지합니다 (PID: {os.getpid()})")
+            return
+        
+        if not await asyncio.to_thread(self.lease.acquire):
+            return
+        
+        self.is_leader = True
+        # 스케줄러는 이벤트 루프 스레드에서 시작/재개
+        if scheduler.running:
+            scheduler.resume()
+            logger.info(f"스케줄러 재개 (리더 - PID: {os.getpid()})")
+        else:
+            start_scheduler()
+            logger.info(f"스케줄러 시작 완료 (리더 - PID: {os.getpid()})")
+    
+    async def stop(self):
+        """리더 선출 중지 (리더였으면 스케줄러 중지 후 락 반납)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        if scheduler.running:
+            stop_scheduler()
+        if self.is_leader:
+            self.is_leader = False
+            await asyncio.to_thread(self.lease.release)
+            logger.info(f"스케줄러 리더 락 반납 (PID: {os.getpid()})")
+    
+    def status(self) -> Dict:
+        """이 프로세스의 리더 여부와 클러스터의 현재 리더"""
+        return {
+            "is_leader": self.is_leader,
+            "pid": os.getpid(),
+            "lease": self.lease.status()
+        }
+
+
+# 싱글톤 인스턴스
+scheduler_leader = SchedulerLeader()
@@ -0,0 +1,63 @@
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.services.meal_service import meal_service
+from app.services.parse_pool import parse_pool
+from app.utils.async_cache import SingleFlightTTLCache
+
+
+class LiveParseService:
+    """
+    한양대 웹사이트 실시간 파싱 서비스 (GET /meals/parse)
+    
+    같은 식당/날짜에 대한 동시 요청은 한 번의 한양대 서버 요청을 공유하고,
+    파싱 결과는 PARSE_CACHE_TTL초 동안 캐시합니다.
+    요청은 비동기 HTTP 클라이언트로, 파싱은 워커 풀에서 실행하여 이벤트 루프를 막지 않습니다.
+    """
+    
+    def __init__(self):
+        self.cache = SingleFlightTTLCache(
+            ttl=settings.PARSE_CACHE_TTL,
+            stale_ttl=settings.PARSE_CACHE_STALE_TTL,
+            max_entries=settings.PARSE_CACHE_MAX_ENTRIES
+        )
+    
+    async def get_parsed_meals(
+        self,
+        restaurant_code: str,
+        year: int,
+        month: int,
+        day: int
+    ) -> Optional[Dict]:
+        """
+        파싱된 급식 정보 조회 (캐시 사용)
+        
+        Returns:
+            HTMLParser.parse_meal_html 결과 (페이지가 비어 있으면 None)
+        
+        Raises:
+            ValueError: 잘못된 파라미터
+            requests.exceptions.RequestException: 요청 실패 (캐시된 값이 없을 때)
+        """
+        key = (restaurant_code, year, month, day)
+        return await self.cache.get_or_load(
+            key,
+            lambda: self._fetch_and_parse(restaurant_code, year, month, day)
+        )
+    
+    async def _fetch_and_parse(
+        self,
+        restaurant_code: str,
+        year: int,
+        month: int,
+        day: int
+    ) -> Optional[Dict]:
+        """한양대 서버에서 HTML을 가져와 워커 풀에서 파싱"""
+        html_content = await meal_service.get_meal_html_async(restaurant_code, year, month, day)
+        if not html_content:
+            return None
+        return await parse_pool.parse(html_content)
+
+
+# 싱글톤 인스턴스
+live_parse_service = LiveParseService()
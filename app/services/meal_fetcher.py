@@ -1,78 +1,365 @@
 from datetime import date, timedelta
 from sqlalchemy.orm import Session
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
 import logging
-import threading
 import time
 
-from app.services.meal_service import MealService
+from app.services.meal_service import meal_service
+from app.services.fetch_engine import AsyncFetchEngine
+from app.services.html_archive import html_archive
+from app.services.db_lease import meal_fetch_lease
+from app.db.meal_changes import mark_date_changed
 from app.core.config import settings
 from app.crud import meal as crud_meal
+from app.crud import fetch_state as crud_fetch_state
+from app.utils.html_digest import compute_content_hash
+from app.utils.meal_content import meal_content_hash
 
 logger = logging.getLogger(__name__)
 
-# 급식 수집 작업 락 (동시 실행 방지)
-_meal_fetch_lock = threading.Lock()
+# store_meal_data 결과 항목
+STORE_COUNT_KEYS = ("inserted", "updated", "unchanged", "deleted")
+
+# 수집 결과의 날짜 수 항목
+DAY_COUNT_KEYS = ("fetched_days", "skipped_days", "failed_days")
+
+
+def _empty_counts() -> Dict:
+    """수집 결과 집계 (전체/식당별 공통)"""
+    return {
+        "total_saved": 0,
+        **dict.fromkeys(STORE_COUNT_KEYS, 0),
+        **dict.fromkeys(DAY_COUNT_KEYS, 0),
+        "timings": {"fetch": 0.0, "parse": 0.0, "store": 0.0}
+    }
 
 
 class MealFetcher:
     """급식 정보 수집 서비스"""
     
     def __init__(self):
-        self.meal_service = MealService()
+        self.meal_service = meal_service
     
-    def fetch_and_store_meals(self, db: Session):
+    def fetch_and_store_meals(self, db: Session, force: bool = False) -> Dict:
         """
         모든 식당의 급식 정보를 가져와서 DB에 저장
         (현재 날짜부터 MEAL_FETCH_DAYS_AHEAD일 후까지)
+        
+        Args:
+            db: DB 세션
+            force: True면 변경 여부와 관계없이 모두 다시 파싱/저장
+        
+        Returns:
+            수집 결과 요약 (fetch_and_store_targets 참고)
+        """
+        today = date.today()
+        end_date = today + timedelta(days=settings.MEAL_FETCH_DAYS_AHEAD)
+        
+        logger.info(f"급식 정보 수집 시작: {today} ~ {end_date}")
+        
+        return self.fetch_and_store_targets(db, self.default_targets(today), force)
+    
+    def default_targets(self, today: Optional[date] = None) -> List[Tuple[str, date]]:
+        """전체 식당의 오늘부터 MEAL_FETCH_DAYS_AHEAD일 후까지 수집 대상"""
+        today = today or date.today()
+        return [
+            (restaurant_code, today + timedelta(days=offset))
+            for restaurant_code in settings.RESTAURANT_CODES
+            for offset in range(settings.MEAL_FETCH_DAYS_AHEAD + 1)
+        ]
+    
+    def fetch_and_store_targets(
+        self,
+        db: Session,
+        targets: List[Tuple[str, date]],
+        force: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+        lock_timeout: Optional[float] = None,
+        lock: bool = True,
+        on_result: Optional[Callable[[str, date, Optional[str]], None]] = None
+    ) -> Dict:
+        """
+        지정한 (식당 코드, 날짜) 목록의 급식 정보를 가져와서 DB에 저장
+        
+        Args:
+            db: DB 세션
+            targets: 수집 대상 (식당 코드, 날짜) 목록
+            force: True면 변경 여부와 관계없이 모두 다시 파싱/저장
+            progress: 페이지가 도착할 때마다 (도착한 수, 전체 수)로 호출
+            lock_timeout: 다른 수집이 진행 중이면 기다릴 시간(초) (생략시 기다리지 않음)
+            lock: False면 수집 락 없이 실행 (작업 큐처럼 호출자가 대상별 배타 처리를 보장할 때)
+            on_result: 대상마다 처리가 끝나면 (식당 코드, 날짜, 오류 메시지 또는 None)으로 호출
+        
+        Returns:
+            수집 결과 요약 (total_saved, inserted, updated, unchanged, deleted,
+            fetched_days, skipped_days, failed_days, timings, restaurants, busy)
+            total_saved는 생성 + 갱신한 메뉴 수 (store_meal_data 참고)
+            timings는 단계별 누적 소요 시간(초)이며, fetch는 동시 요청 시간의 합입니다.
+            restaurants는 식당 코드별로 같은 항목을 집계합니다 (timings에 total 없음).
+            busy는 다른 수집이 진행 중이라 실행하지 못했으면 True입니다.
         """
-        # 동시 실행 방지를 위한 락 체크
-        if not _meal_fetch_lock.acquire(blocking=False):
+        summary = _empty_counts()
+        summary["timings"]["total"] = 0.0
+        summary["restaurants"] = {}
+        summary["busy"] = False
+        
+        if not targets:
+            return summary
+        
+        # 동시 실행 방지를 위한 락 체크 (모든 워커/서버/스크립트 공용 DB 락)
+        lease = meal_fetch_lease if lock else None
+        if lease is not None and not lease.acquire(timeout=lock_timeout):
             logger.warning("급식 정보 수집이 이미 진행 중입니다. 현재 요청을 건너뜁니다.")
-            return 0
+            summary["busy"] = True
+            return summary
         
         try:
-            today = date.today()
-            end_date = today + timedelta(days=settings.MEAL_FETCH_DAYS_AHEAD)
-            
-            logger.info(f"급식 정보 수집 시작: {today} ~ {end_date}")
-            
-            total_saved = 0
-            
-            for restaurant_code, restaurant_name in settings.RESTAURANT_CODES.items():
+            # 식당 정보 가져오기 또는 생성
+            restaurants = {}
+            for restaurant_code in sorted({code for code, _ in targets}):
+                restaurant_name = settings.RESTAURANT_CODES.get(restaurant_code)
+                if restaurant_name is None:
+                    logger.warning(f"알 수 없는 식당 코드: {restaurant_code}")
+                    continue
                 try:
-                    # 식당 정보 가져오기 또는 생성
-                    restaurant = crud_meal.get_or_create_restaurant(
+                    restaurants[restaurant_code] = crud_meal.get_or_create_restaurant(
                         db, restaurant_code, restaurant_name
                     )
+                except Exception as e:
+                    logger.error(f"{restaurant_name} 급식 정보 수집 중 오류: {e}")
+            
+            # 식당 정보를 준비하지 못한 대상은 실패로 집계
+            for restaurant_code, target_date in targets:
+                if restaurant_code not in restaurants:
+                    summary["failed_days"] += 1
+                    if on_result is not None:
+                        on_result(restaurant_code, target_date, "식당 정보를 준비하지 못했습니다.")
+            targets = [target for target in targets if target[0] in restaurants]
+            if not targets:
+                return summary
+            
+            # 이전 수집 상태 (조건부 요청 및 해시 비교용)
+            dates = [target_date for _, target_date in targets]
+            states = crud_fetch_state.get_fetch_states(
+                db, list(restaurants.keys()), min(dates), max(dates)
+            )
+            
+            started = time.perf_counter()
+            asyncio.run(
+                self._fetch_and_store_all(
+                    db, restaurants, targets, states, summary, force, progress, lease, on_result
+                )
+            )
+            summary["timings"]["total"] = time.perf_counter() - started
+            
+            logger.info(
+                f"급식 정보 수집 완료. 총 {summary['total_saved']}개 메뉴 저장 "
+                f"(생성 {summary['inserted']}, 갱신 {summary['updated']}, "
+                f"변경 없음 {summary['unchanged']}, 삭제 {summary['deleted']} / "
+                f"수집 {summary['fetched_days']}일, 변경 없음 {summary['skipped_days']}일, "
+                f"실패 {summary['failed_days']}일)"
+            )
+            return summary
+            
+        finally:
+            # 락 해제
+            if lease is not None:
+                lease.release()
+    
+    async def _fetch_and_store_all(
+        self,
+        db: Session,
+        restaurants: Dict,
+        targets,
+        states: Dict,
+        summary: Dict,
+        force: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+        lease=None,
+        on_result: Optional[Callable[[str, date, Optional[str]], None]] = None
+    ):
+        """
+        페이지를 동시에 수집하고, 도착하는 순서대로 파싱/저장
+        (DB 세션은 이 코루틴에서만 사용)
+        
+        304 응답이거나 정규화된 HTML 해시가 이전과 같으면 파싱/저장을 건너뜁니다.
+        전체 집계와 함께 summary["restaurants"]에 식당별로 집계합니다.
+        """
+        engine = AsyncFetchEngine(self.meal_service)
+        by_restaurant = summary["restaurants"]
+        for code in restaurants:
+            by_restaurant[code] = _empty_counts()
+        done = 0
+        
+        validators = {}
+        if not force:
+            validators = {
+                key: (state.etag, state.last_modified)
+                for key, state in states.items()
+            }
+        
+        async for result in engine.fetch_many(targets, validators):
+            if lease is not None and lease.lost:
+                # 락이 만료되어 다른 워커/서버가 수집 중이므로 더 저장하지 않음
+                logger.error("수집 락을 잃어 남은 페이지 저장을 중단합니다.")
+                break
+            
+            restaurant = restaurants[result.restaurant_code]
+            key = (result.restaurant_code, result.target_date)
+            state = states.get(key)
+            # 전체와 해당 식당에 같이 더함
+            aggregates = (summary, by_restaurant[result.restaurant_code])
+            done += 1
+            if progress is not None:
+                progress(done, len(targets))
+            
+            for aggregate in aggregates:
+                aggregate["timings"]["fetch"] += result.elapsed
+            
+            if result.error:
+                for aggregate in aggregates:
+                    aggregate["failed_days"] += 1
+                logger.error(
+                    f"급식 정보 수집 실패 - {restaurant.name} {result.target_date}: {result.error}"
+                )
+                if on_result is not None:
+                    on_result(result.restaurant_code, result.target_date, str(result.error))
+                continue
+            
+            try:
+                page = result.page
+                content_hash = None if page.not_modified else compute_content_hash(page.html)
+                unchanged = page.not_modified or (
+                    not force and state is not None and state.content_hash == content_hash
+                )
+                
+                if unchanged:
+                    for aggregate in aggregates:
+                        aggregate["skipped_days"] += 1
+                else:
+                    stage_started = time.perf_counter()
+                    meal_data = self._parse_html(page.html, content_hash)
+                    parse_elapsed = time.perf_counter() - stage_started
                     
-                    # 날짜별로 데이터 수집
-                    current_date = today
-                    while current_date <= end_date:
-                        try:
-                            count = self._fetch_and_store_single_day(
-                                db, restaurant, restaurant_code, current_date
-                            )
-                            total_saved += count
-                        except Exception as e:
-                            logger.error(
-                                f"급식 정보 수집 실패 - {restaurant_name} {current_date}: {e}"
-                            )
-                        
-                        current_date += timedelta(days=1)
+                    stage_started = time.perf_counter()
+                    # 수집 상태와 같은 트랜잭션으로 커밋
+                    counts = self.store_meal_data(
+                        db, restaurant, result.target_date, meal_data, commit=False
+                    )
+                    store_elapsed = time.perf_counter() - stage_started
                     
-                    logger.info(f"{restaurant_name} 급식 정보 수집 완료")
+                    for aggregate in aggregates:
+                        aggregate["timings"]["parse"] += parse_elapsed
+                        aggregate["timings"]["store"] += store_elapsed
+                        for count_key in STORE_COUNT_KEYS:
+                            aggregate[count_key] += counts[count_key]
+                        aggregate["total_saved"] += counts["inserted"] + counts["updated"]
+                        aggregate["fetched_days"] += 1
+                
+                states[key] = crud_fetch_state.save_fetch_state(
+                    db,
+                    state,
+                    result.restaurant_code,
+                    result.target_date,
+                    etag=page.etag,
+                    last_modified=page.last_modified,
+                    content_hash=content_hash,
+                    changed=not unchanged
+                )
+            except Exception as e:
+                db.rollback()
+                for aggregate in aggregates:
+                    aggregate["failed_days"] += 1
+                logger.error(
+                    f"급식 정보 저장 실패 - {restaurant.name} {result.target_date}: {e}"
+                )
+                if on_result is not None:
+                    on_result(result.restaurant_code, result.target_date, str(e))
+                continue
+            
+            if on_result is not None:
+                on_result(result.restaurant_code, result.target_date, None)
+        
+        for restaurant_code, counts in by_restaurant.items():
+            logger.info(
+                f"{restaurants[restaurant_code].name} 급식 정보 수집 완료 ({counts['total_saved']}개)"
+            )
+    
+    def reparse_from_archive(
+        self,
+        db: Session,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        restaurant_codes: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        보관된 원본 HTML로 급식 정보를 다시 파싱하여 저장 (네트워크 사용 안 함)
+        
+        Args:
+            db: DB 세션
+            start_date: 시작 날짜 (생략시 보관된 전체)
+            end_date: 종료 날짜 (생략시 보관된 전체)
+            restaurant_codes: 식당 코드 목록 (생략시 전체)
+        
+        Returns:
+            재파싱 결과 요약 (total_saved, inserted, updated, unchanged, deleted, reparsed_days, failed_days, busy)
+        """
+        summary = {
+            "total_saved": 0,
+            **dict.fromkeys(STORE_COUNT_KEYS, 0),
+            "reparsed_days": 0,
+            "failed_days": 0,
+            "busy": False
+        }
+        
+        if not meal_fetch_lease.acquire():
+            logger.warning("급식 정보 수집이 이미 진행 중입니다. 재파싱을 건너뜁니다.")
+            summary["busy"] = True
+            return summary
+        
+        try:
+            restaurants = {}
+            
+            for restaurant_code, target_date, digest in html_archive.iter_entries(
+                start_date, end_date, restaurant_codes
+            ):
+                if meal_fetch_lease.lost:
+                    # 락이 만료되어 다른 워커/서버가 수집 중이므로 더 저장하지 않음
+                    logger.error("수집 락을 잃어 재파싱을 중단합니다.")
+                    summary["failed_days"] += 1
+                    break
+                
+                if restaurant_code not in settings.RESTAURANT_CODES:
+                    continue
+                
+                try:
+                    if restaurant_code not in restaurants:
+                        restaurants[restaurant_code] = crud_meal.get_or_create_restaurant(
+                            db, restaurant_code, settings.RESTAURANT_CODES[restaurant_code]
+                        )
                     
+                    html_content = html_archive.get(digest)
+                    counts = self._store_single_day(
+                        db, restaurants[restaurant_code], target_date, html_content
+                    )
+                    for count_key in STORE_COUNT_KEYS:
+                        summary[count_key] += counts[count_key]
+                    summary["total_saved"] += counts["inserted"] + counts["updated"]
+                    summary["reparsed_days"] += 1
                 except Exception as e:
-                    logger.error(f"{restaurant_name} 급식 정보 수집 중 오류: {e}")
+                    db.rollback()
+                    summary["failed_days"] += 1
+                    logger.error(f"재파싱 실패 - {restaurant_code} {target_date}: {e}")
             
-            logger.info(f"급식 정보 수집 완료. 총 {total_saved}개 메뉴 저장")
-            return total_saved
+            logger.info(
+                f"보관 HTML 재파싱 완료. 총 {summary['total_saved']}개 메뉴 저장 "
+                f"(재파싱 {summary['reparsed_days']}일, 실패 {summary['failed_days']}일)"
+            )
+            return summary
             
         finally:
-            # 락 해제
-            _meal_fetch_lock.release()
-            logger.info("급식 정보 수집 락 해제")
+            meal_fetch_lease.release()
     
     def _fetch_and_store_single_day(
         self,
@@ -80,7 +367,7 @@ class MealFetcher:
         restaurant,
         restaurant_code: str,
         target_date: date
-    ) -> int:
+    ) -> Dict[str, int]:
         """특정 날짜의 급식 정보 수집 및 저장"""
         # 한양대 서버에서 HTML 가져오기
         html_content = self.meal_service.get_meal_html(
@@ -90,89 +377,124 @@ class MealFetcher:
             target_date.day
         )
         
-        # HTML 파싱
-        from app.services.html_parser import HTMLParser
-        html_parser = HTMLParser()
-        meal_data = html_parser.parse_meal_html(html_content)
+        return self._store_single_day(db, restaurant, target_date, html_content)
+    
+    def _store_single_day(
+        self,
+        db: Session,
+        restaurant,
+        target_date: date,
+        html_content: str
+    ) -> Dict[str, int]:
+        """수집한 HTML을 파싱하여 특정 날짜의 급식 정보 저장"""
+        meal_data = self._parse_html(html_content)
+        return self.store_meal_data(db, restaurant, target_date, meal_data)
+    
+    def _parse_html(self, html_content: str, digest: Optional[str] = None) -> Dict:
+        """HTML 파싱 (파싱 결과 캐시 사용)"""
+        return self.meal_service.parse_html(html_content, digest)
+    
+    def store_meal_data(
+        self,
+        db: Session,
+        restaurant,
+        target_date: date,
+        meal_data: Dict,
+        commit: bool = True
+    ) -> Dict[str, int]:
+        """
+        파싱된 특정 날짜의 급식 정보를 DB와 맞춤 (한 트랜잭션)
         
-        saved_count = 0
+        식사 종류별로 메뉴 내용 해시(메뉴명 + 태그, meals.content_hash)가 같은 기존 메뉴와 짝지어
+        순서가 바뀌어도 ID와 평점을 유지합니다.
+        - 내용과 가격/이미지/요일까지 같으면 그대로 둠 (unchanged)
+        - 내용은 같고 나머지가 다르면 갱신 (updated)
+        - 짝이 없는 새 메뉴는 생성, 짝이 없는 기존 메뉴는 삭제 (inserted / deleted)
+        메뉴가 없는 식사 종류는 그대로 두고, 한 식사 종류에 같은 메뉴가 두 번 나오면 한 번만 저장합니다.
+        
+        조회 1번, 다중 행 upsert 1번, 일괄 삭제, 커밋 1번으로 처리합니다.
+        
+        Args:
+            commit: False면 커밋하지 않음 (호출자가 수집 상태와 함께 커밋)
+        
+        Returns:
+            {"inserted", "updated", "unchanged", "deleted"} 메뉴 수
+        """
+        counts = dict.fromkeys(STORE_COUNT_KEYS, 0)
+        day_of_week = meal_data.get("day_of_week", "")
+        
+        existing_by_type: Dict[str, list] = {}
+        for meal in crud_meal.get_meals_for_day(db, restaurant.id, target_date):
+            existing_by_type.setdefault(meal.meal_type, []).append(meal)
+        
+        rows = []
+        stale_ids = []
         
-        # 각 식사 종류별로 저장
         for meal_type in ["조식", "중식", "석식"]:
             meals = meal_data.get(meal_type, [])
+            if not meals:  # 해당 식사 종류에 메뉴가 있는 경우만 처리
+                continue
             
-            if meals:  # 해당 식사 종류에 메뉴가 있는 경우만 처리
-                try:
-                    # 1. 기존 메뉴들 조회
-                    from app.models.meal import Meal
-                    existing_meals = db.query(Meal).filter(
-                        Meal.restaurant_id == restaurant.id,
-                        Meal.date == target_date,
-                        Meal.meal_type == meal_type
-                    ).all()
-                    
-                    logger.info(f"{meal_type} 처리 시작: {restaurant.name} {target_date} - 기존 {len(existing_meals)}개, 신규 {len(meals)}개")
-                    
-                    # 2. 기존 메뉴를 업데이트하거나 새로 생성
-                    updated_existing_ids = set()
-                    
-                    for i, meal_item in enumerate(meals):
-                        try:
-                            new_korean = meal_item["korean"] if isinstance(meal_item["korean"], list) else [meal_item["korean"]]
-                            
-                            # 기존 메뉴 중에서 같은 순서의 메뉴 찾기 (i번째)
-                            existing_meal = None
-                            if i < len(existing_meals):
-                                existing_meal = existing_meals[i]
-                                updated_existing_ids.add(existing_meal.id)
-                            
-                            if existing_meal:
-                                # 기존 메뉴 업데이트 (ID 유지, 평점 데이터 보존)
-                                existing_meal.korean_name = meal_item["korean"]
-                                existing_meal.tags = meal_item.get("tags", [])
-                                existing_meal.price = meal_item.get("price", "")
-                                existing_meal.image_url = meal_item.get("image", "")
-                                existing_meal.day_of_week = meal_data.get("day_of_week", "")
-                                db.commit()
-                                
-                                saved_count += 1
-                                logger.info(f"메뉴 업데이트: {restaurant.name} {target_date} {meal_type} (ID: {existing_meal.id}) - {new_korean}")
-                            else:
-                                # 새 메뉴 생성
-                                new_meal = crud_meal.create_meal(
-                                    db=db,
-                                    restaurant_id=restaurant.id,
-                                    date=target_date,
-                                    day_of_week=meal_data.get("day_of_week", ""),
-                                    meal_type=meal_type,
-                                    korean_name=meal_item["korean"],
-                                    tags=meal_item.get("tags", []),
-                                    price=meal_item.get("price", ""),
-                                    image_url=meal_item.get("image", "")
-                                )
-                                saved_count += 1
-                                logger.info(f"새 메뉴 생성: {restaurant.name} {target_date} {meal_type} (ID: {new_meal.id}) - {new_korean}")
-                                
-                        except Exception as meal_error:
-                            logger.error(f"개별 메뉴 처리 실패: {meal_error}")
-                            logger.error(f"메뉴 데이터: {meal_item}")
-                            import traceback
-                            logger.error(f"상세 오류: {traceback.format_exc()}")
-                    
-                    # 3. 더 이상 필요없는 기존 메뉴들 삭제 (메뉴 개수가 줄어든 경우)
-                    for existing_meal in existing_meals:
-                        if existing_meal.id not in updated_existing_ids:
-                            logger.info(f"불필요한 메뉴 삭제: {restaurant.name} {target_date} {meal_type} (ID: {existing_meal.id}) - {existing_meal.korean_name}")
-                            db.delete(existing_meal)
-                            db.commit()
-                            
-                except Exception as meal_type_error:
-                    logger.error(f"{meal_type} 저장 실패: {meal_type_error}")
-                    import traceback
-                    logger.error(f"상세 오류: {traceback.format_exc()}")
-        
-        return saved_count
-
+            # 내용 해시 -> 기존 메뉴 (같은 내용이 여러 개면 ID순으로 하나씩 짝지음)
+            unmatched: Dict[str, list] = {}
+            for meal in existing_by_type.get(meal_type, []):
+                unmatched.setdefault(meal.content_hash, []).append(meal)
+            
+            seen_hashes = set()
+            for meal_item in meals:
+                values = {
+                    "day_of_week": day_of_week,
+                    "korean_name": meal_item["korean"],
+                    "tags": meal_item.get("tags", []),
+                    "price": meal_item.get("price", ""),
+                    "image_url": meal_item.get("image", "")
+                }
+                content_hash = meal_content_hash(values["korean_name"], values["tags"])
+                if content_hash in seen_hashes:
+                    # 같은 메뉴가 페이지에 두 번 나오면 첫 번째만 저장 (unique_meal_content)
+                    continue
+                seen_hashes.add(content_hash)
+                
+                candidates = unmatched.get(content_hash)
+                existing_meal = candidates.pop(0) if candidates else None
+                
+                if existing_meal is None:
+                    counts["inserted"] += 1
+                elif all(getattr(existing_meal, column) == value for column, value in values.items()):
+                    counts["unchanged"] += 1
+                    continue
+                else:
+                    counts["updated"] += 1
+                
+                rows.append({
+                    "id": existing_meal.id if existing_meal is not None else None,
+                    "restaurant_id": restaurant.id,
+                    "date": target_date,
+                    "meal_type": meal_type,
+                    **values
+                })
+            
+            # 짝이 없는 기존 메뉴 (메뉴에서 빠졌거나 내용이 바뀜)
+            stale_ids.extend(meal.id for leftovers in unmatched.values() for meal in leftovers)
+        
+        try:
+            # 짝이 없는 기존 메뉴를 먼저 삭제 (같은 해시의 기존 행은 위에서 짝지어지므로 새 행과 unique_meal_content가 겹치지 않음)
+            counts["deleted"] = crud_meal.delete_meals_by_ids(db, stale_ids)
+            crud_meal.upsert_meals(db, rows)
+            if rows or stale_ids:
+                # 커밋되면 이 날짜의 조회 캐시 무효화
+                mark_date_changed(db, target_date)
+            if commit:
+                db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        
+        logger.info(
+            f"급식 정보 저장: {restaurant.name} {target_date} - 생성 {counts['inserted']}개, "
+            f"갱신 {counts['updated']}개, 변경 없음 {counts['unchanged']}개, 삭제 {counts['deleted']}개"
+        )
+        return counts
 
 meal_fetcher = MealFetcher()
 
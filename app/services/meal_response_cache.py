@@ -0,0 +1,113 @@
+"""
+급식 조회(GET /meals) 응답 캐시
+
+메뉴는 수집할 때만, 평점은 식사 시간에만 바뀌므로 (날짜, 식당 코드, 식사 종류)별로
+직렬화된 응답(JSON 바이트)을 프로세스 안에 저장하고, 데이터가 바뀐 날짜만 무효화합니다.
+
+- 메뉴/평점을 바꾸는 코드는 app.db.meal_changes.mark_date_changed(db, 날짜)로 바뀐 날짜를 기록
+- 세션이 커밋되면 기록된 날짜의 캐시를 삭제 (on_dates_committed 콜백, 롤백되면 기록만 버림)
+- 조회 시작 후 무효화가 있었으면 그 조회 결과는 저장하지 않음 (generation 비교)
+- 다른 프로세스/서버의 변경은 알 수 없으므로 MEAL_RESPONSE_CACHE_TTL_SECONDS 후 만료
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.db.meal_changes import on_dates_committed
+
+CacheKey = Tuple[date, Optional[Tuple[str, ...]], Optional[Tuple[str, ...]]]
+
+
+class MealResponseCache:
+    """
+    (날짜, 식당 코드, 식사 종류) -> 직렬화된 응답 LRU 캐시 (스레드 안전)
+    """
+    
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self.max_entries = max(1, settings.MEAL_RESPONSE_CACHE_MAX_ENTRIES if max_entries is None else max_entries)
+        self.ttl_seconds = settings.MEAL_RESPONSE_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[bytes, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0  # 무효화할 때마다 증가
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    @staticmethod
+    def make_key(
+        target_date: date,
+        restaurant_codes: Optional[list] = None,
+        meal_types: Optional[list] = None
+    ) -> CacheKey:
+        """캐시 키 (응답이 요청 순서를 따르므로 순서는 유지)"""
+        return (
+            target_date,
+            tuple(restaurant_codes) if restaurant_codes else None,
+            tuple(meal_types) if meal_types else None
+        )
+    
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        """캐시된 응답 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+    
+    def put(self, key: CacheKey, body: bytes, generation: int):
+        """
+        응답 저장
+        
+        Args:
+            generation: 조회를 시작하기 전에 읽은 self.generation (그 사이 무효화가 있었으면 저장하지 않음)
+        """
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (body, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, dates: Optional[Set[date]] = None):
+        """지정한 날짜의 캐시 삭제 (None이면 전체)"""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+            if dates is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] in dates]:
+                del self._entries[key]
+    
+    def clear(self):
+        self.invalidate()
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / requests, 3) if requests else None,
+                "invalidations": self.invalidations
+            }
+
+
+# 싱글톤 인스턴스
+meal_response_cache = MealResponseCache()
+
+on_dates_committed(meal_response_cache.invalidate)
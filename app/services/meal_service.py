@@ -1,17 +1,151 @@
+import asyncio
+import httpx
 import requests
-from typing import Dict
+import logging
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
 from datetime import date
+from urllib.parse import urlparse
 
 from app.core.config import settings
-from app.utils.ssl_adapter import create_ssl_session
+from app.services.upstream_transport import (
+    UpstreamTransport, upstream_transport, async_upstream_transport
+)
 from app.services.html_parser import HTMLParser
+from app.services.html_archive import html_archive
+from app.services.parse_result_cache import parse_result_cache
+from app.utils.resilience import (
+    AdaptiveTokenBucket, CircuitBreaker, RateLimitWaitTimeout, backoff_delay
+)
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 HTTP 상태 코드 (서버 과부하/일시 장애)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 호스트별 속도 제한기/서킷 브레이커 (모든 MealService 인스턴스가 공유)
+_host_guards: Dict[str, Tuple[AdaptiveTokenBucket, CircuitBreaker]] = {}
+_host_guards_lock = threading.Lock()
+
+
+def _get_host_guard(host: str) -> Tuple[AdaptiveTokenBucket, CircuitBreaker]:
+    """호스트별 속도 제한기와 서킷 브레이커 가져오기"""
+    with _host_guards_lock:
+        guard = _host_guards.get(host)
+        if guard is None:
+            guard = (
+                AdaptiveTokenBucket(
+                    settings.UPSTREAM_RATE_PER_SECOND,
+                    settings.UPSTREAM_RATE_BURST
+                ),
+                CircuitBreaker(
+                    settings.UPSTREAM_CIRCUIT_FAILURE_THRESHOLD,
+                    settings.UPSTREAM_CIRCUIT_RESET_TIMEOUT
+                )
+            )
+            _host_guards[host] = guard
+        return guard
+
+
+class UpstreamRetry:
+    """
+    한 요청의 재시도 판단 (동기/비동기 요청 루프 공용)
+    
+    응답/오류마다 속도 제한기를 조정하고, 다음 시도까지 기다릴 시간(지수 백오프와 Retry-After 중 큰 값)을 정합니다.
+    요청 전송과 대기만 호출자가 동기/비동기로 합니다.
+    """
+    
+    def __init__(self, limiter: AdaptiveTokenBucket):
+        self.limiter = limiter
+        self.max_attempts = settings.UPSTREAM_MAX_RETRIES + 1
+        self.attempt = 0
+        self.last_error = None
+        self._retry_after = 0.0
+    
+    def record_response(self, response) -> bool:
+        """
+        응답 기록
+        
+        Returns:
+            True면 최종 응답 (재시도하지 않음)
+        """
+        self.attempt += 1
+        if response.status_code not in RETRYABLE_STATUS_CODES:
+            self.limiter.reward()
+            return True
+        
+        self.last_error = f"{response.status_code} 응답"
+        self.limiter.penalize()
+        self._retry_after = _parse_retry_after(response)
+        return False
+    
+    def record_error(self, error: Exception):
+        """재시도할 수 있는 전송 오류 (연결 실패, 타임아웃) 기록"""
+        self.attempt += 1
+        self.last_error = error
+        self.limiter.penalize()
+        self._retry_after = 0.0
+    
+    def next_delay(self) -> Optional[float]:
+        """다음 시도까지 기다릴 시간(초) (시도 횟수를 다 썼으면 None)"""
+        if self.attempt >= self.max_attempts:
+            return None
+        delay = max(
+            backoff_delay(
+                self.attempt - 1,
+                settings.UPSTREAM_RETRY_BACKOFF_BASE,
+                settings.UPSTREAM_RETRY_BACKOFF_MAX
+            ),
+            min(self._retry_after, settings.UPSTREAM_RETRY_BACKOFF_MAX)
+        )
+        logger.warning(
+            f"한양대 서버 요청 재시도 ({self.attempt}/{self.max_attempts - 1}, {delay:.1f}초 후): {self.last_error}"
+        )
+        return delay
+    
+    def exhausted(self) -> requests.exceptions.RequestException:
+        return requests.exceptions.RequestException(f"{self.max_attempts}회 시도 후 실패: {self.last_error}")
+
+
+def _parse_retry_after(response) -> float:
+    """Retry-After 헤더 (초 단위만 지원)"""
+    try:
+        return float(response.headers.get("Retry-After", 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def get_upstream_status() -> Dict:
+    """호스트별 속도 제한기/서킷 브레이커 상태 및 커넥션 풀 통계"""
+    with _host_guards_lock:
+        guards = dict(_host_guards)
+    
+    return {
+        "hosts": {
+            host: {
+                "circuit": breaker.snapshot(),
+                "rate_limiter": limiter.snapshot()
+            }
+            for host, (limiter, breaker) in guards.items()
+        },
+        "transport": upstream_transport.stats()
+    }
+
+
+class MealPage(NamedTuple):
+    """한양대 서버 응답 (조건부 요청 결과 포함)"""
+    html: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    not_modified: bool
 
 
 class MealService:
     """급식 정보 조회 서비스"""
     
-    def __init__(self):
-        self.session = create_ssl_session()
+    def __init__(self, transport: Optional[UpstreamTransport] = None):
+        self.transport = transport or upstream_transport
         self.parser = HTMLParser()
     
     def get_meal_info(
@@ -36,6 +170,7 @@ class MealService:
         Raises:
             ValueError: 잘못된 파라미터
             requests.exceptions.RequestException: 요청 실패
+            RateLimitWaitTimeout: 속도 제한 대기 시간 초과
         """
         # 입력값 검증
         self._validate_params(restaurant_code, year, month, day)
@@ -44,10 +179,23 @@ class MealService:
         html = self._fetch_html(restaurant_code, year, month, day)
         
         # 파싱
-        meal_data = self.parser.parse_meal_html(html)
+        meal_data = self.parse_html(html)
         
         return meal_data
     
+    def parse_html(self, html: str, digest: Optional[str] = None) -> Dict:
+        """
+        HTML 파싱 (같은 내용의 페이지는 프로세스 안에서 한 번만 파싱)
+        
+        Args:
+            html: 한양대 급식 페이지 HTML
+            digest: 이미 계산한 compute_content_hash(html) (생략시 계산)
+        
+        Returns:
+            파싱된 급식 정보 (공유 객체, 읽기 전용)
+        """
+        return parse_result_cache.get_or_parse(html, self.parser.parse_meal_html, digest)
+    
     def _validate_params(
         self, 
         restaurant_code: str, 
@@ -70,15 +218,15 @@ class MealService:
         if year <= 0:
             raise ValueError("year는 0보다 큰 값이어야 합니다.")
     
-    def _fetch_html(
+    def _build_url(
         self, 
         restaurant_code: str, 
         year: int, 
         month: int, 
         day: int
     ) -> str:
-        """한양대 서버에서 HTML 가져오기"""
-        api_url = (
+        """한양대 급식 페이지 URL"""
+        return (
             f"{settings.HANYANG_BASE_URL}/web/www/{restaurant_code}"
             f"?p_p_id=foodView_WAR_foodportlet"
             f"&p_p_lifecycle=0"
@@ -92,7 +240,13 @@ class MealService:
             f"&_foodView_WAR_foodportlet_action=view"
             f"&_foodView_WAR_foodportlet_sFoodDateMonth={month - 1}"
         )
-        
+    
+    def _build_headers(
+        self,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Dict[str, str]:
+        """요청 헤더 (검증자가 있으면 조건부 요청 헤더 포함)"""
         headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -102,13 +256,132 @@ class MealService:
             "Upgrade-Insecure-Requests": "1"
         }
         
+        # 조건부 요청 헤더
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
+        return headers
+    
+    def _fetch_html(
+        self, 
+        restaurant_code: str, 
+        year: int, 
+        month: int, 
+        day: int
+    ) -> str:
+        """한양대 서버에서 HTML 가져오기"""
+        return self._fetch_page(restaurant_code, year, month, day).html
+    
+    def _fetch_page(
+        self, 
+        restaurant_code: str, 
+        year: int, 
+        month: int, 
+        day: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> MealPage:
+        """한양대 서버에서 페이지 가져오기 (검증자가 있으면 조건부 요청)"""
+        api_url = self._build_url(restaurant_code, year, month, day)
+        headers = self._build_headers(etag, last_modified)
+        
+        limiter, breaker = _get_host_guard(urlparse(api_url).netloc)
+        
+        # 서킷이 열려 있으면 즉시 실패 (CircuitOpenError)
+        breaker.before_request()
+        
         try:
-            response = self.session.get(api_url, headers=headers)
+            response = self._send_with_retry(api_url, headers, limiter)
+        except RateLimitWaitTimeout:
+            # 서버 장애가 아니므로 실패로 세지 않고 시험 요청만 반납
+            breaker.release_probe()
+            raise
+        except requests.exceptions.RequestException as e:
+            breaker.record_failure()
+            raise requests.exceptions.RequestException(f"한양대 서버 요청 실패: {e}")
+        except Exception:
+            # 예상하지 못한 오류도 실패로 기록 (half-open 시험 요청이 남아 있으면 서킷이 닫히지 않음)
+            breaker.record_failure()
+            raise
+        
+        # 서버가 응답했으면 (4xx 포함) 서킷 관점에서는 성공
+        breaker.record_success()
+        
+        try:
+            if response.status_code == 304:
+                return MealPage(
+                    html=None,
+                    etag=response.headers.get("ETag", etag),
+                    last_modified=response.headers.get("Last-Modified", last_modified),
+                    not_modified=True
+                )
+            
             response.raise_for_status()
-            return response.text
+            self._archive_html(restaurant_code, year, month, day, response.text)
+            return MealPage(
+                html=response.text,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                not_modified=False
+            )
         except requests.exceptions.RequestException as e:
             raise requests.exceptions.RequestException(f"한양대 서버 요청 실패: {e}")
     
+    def _send_with_retry(
+        self,
+        api_url: str,
+        headers: Dict,
+        limiter: AdaptiveTokenBucket
+    ) -> requests.Response:
+        """
+        속도 제한, 타임아웃, 지수 백오프 재시도를 적용한 GET 요청
+        
+        최악의 경우 소요 시간은
+        (UPSTREAM_MAX_RETRIES + 1) * (연결 + 응답 타임아웃 + 속도 제한 대기) + 백오프 합계로 제한됩니다.
+        
+        Raises:
+            RateLimitWaitTimeout: 속도 제한 대기 시간 초과 (이 프로세스의 요청 과다)
+            requests.exceptions.RequestException: 재시도 후에도 실패한 경우
+        """
+        timeout = (settings.UPSTREAM_CONNECT_TIMEOUT, settings.UPSTREAM_READ_TIMEOUT)
+        retry = UpstreamRetry(limiter)
+        
+        while True:
+            if not limiter.acquire(timeout=settings.UPSTREAM_RATE_WAIT_TIMEOUT):
+                raise RateLimitWaitTimeout("속도 제한 대기 시간 초과")
+            
+            try:
+                response = self.transport.get(api_url, headers=headers, timeout=timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                retry.record_error(e)
+            else:
+                if retry.record_response(response):
+                    return response
+            
+            delay = retry.next_delay()
+            if delay is None:
+                raise retry.exhausted()
+            time.sleep(delay)
+    
+    def _archive_html(
+        self, 
+        restaurant_code: str, 
+        year: int, 
+        month: int, 
+        day: int,
+        html: str
+    ):
+        """원본 HTML 보관 (실패해도 수집은 계속)"""
+        if not settings.MEAL_HTML_ARCHIVE_ENABLED:
+            return
+        
+        try:
+            html_archive.put(restaurant_code, date(year, month, day), html)
+        except Exception as e:
+            logger.warning(f"원본 HTML 보관 실패 - {restaurant_code} {year}-{month}-{day}: {e}")
+    
     def get_meal_html(
         self, 
         restaurant_code: str, 
@@ -131,6 +404,7 @@ class MealService:
         Raises:
             ValueError: 잘못된 파라미터
             requests.exceptions.RequestException: 요청 실패
+            RateLimitWaitTimeout: 속도 제한 대기 시간 초과
         """
         # 입력값 검증
         self._validate_params(restaurant_code, year, month, day)
@@ -138,6 +412,115 @@ class MealService:
         # HTML 가져오기
         return self._fetch_html(restaurant_code, year, month, day)
     
+    def get_meal_page(
+        self, 
+        restaurant_code: str, 
+        year: int, 
+        month: int, 
+        day: int,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> MealPage:
+        """
+        한양대 서버에서 페이지 가져오기 (조건부 요청 지원)
+        
+        Args:
+            restaurant_code: 식당 코드 (re11, re12, re13, re15)
+            year: 연도
+            month: 월 (1-12)
+            day: 일 (1-31)
+            etag: 이전 응답의 ETag (If-None-Match)
+            last_modified: 이전 응답의 Last-Modified (If-Modified-Since)
+            
+        Returns:
+            MealPage (304 응답이면 not_modified=True, html=None)
+            
+        Raises:
+            ValueError: 잘못된 파라미터
+            requests.exceptions.RequestException: 요청 실패
+            RateLimitWaitTimeout: 속도 제한 대기 시간 초과
+        """
+        self._validate_params(restaurant_code, year, month, day)
+        return self._fetch_page(restaurant_code, year, month, day, etag, last_modified)
+    
+    async def get_meal_html_async(
+        self, 
+        restaurant_code: str, 
+        year: int, 
+        month: int, 
+        day: int
+    ) -> str:
+        """
+        한양대 서버에서 HTML 가져오기 (비동기, 이벤트 루프를 막지 않음)
+        
+        get_meal_html과 같은 속도 제한/재시도/서킷 브레이커를 사용합니다.
+        
+        Raises:
+            ValueError: 잘못된 파라미터
+            requests.exceptions.RequestException: 요청 실패
+            RateLimitWaitTimeout: 속도 제한 대기 시간 초과
+        """
+        self._validate_params(restaurant_code, year, month, day)
+        
+        api_url = self._build_url(restaurant_code, year, month, day)
+        headers = self._build_headers()
+        limiter, breaker = _get_host_guard(urlparse(api_url).netloc)
+        
+        breaker.before_request()
+        
+        try:
+            response = await self._send_with_retry_async(api_url, headers, limiter)
+        except (asyncio.CancelledError, RateLimitWaitTimeout):
+            # 취소/속도 제한 대기 초과는 서버 장애가 아니므로 실패로 세지 않고 시험 요청만 반납
+            breaker.release_probe()
+            raise
+        except (requests.exceptions.RequestException, httpx.HTTPError) as e:
+            breaker.record_failure()
+            raise requests.exceptions.RequestException(f"한양대 서버 요청 실패: {e}")
+        except Exception:
+            # 예상하지 못한 오류 (DecodingError 등)도 실패로 기록
+            breaker.record_failure()
+            raise
+        
+        # 서버가 응답했으면 (4xx 포함) 서킷 관점에서는 성공
+        breaker.record_success()
+        
+        if response.is_error:
+            raise requests.exceptions.RequestException(
+                f"한양대 서버 요청 실패: {response.status_code} 응답"
+            )
+        
+        await asyncio.to_thread(
+            self._archive_html, restaurant_code, year, month, day, response.text
+        )
+        return response.text
+    
+    async def _send_with_retry_async(
+        self,
+        api_url: str,
+        headers: Dict,
+        limiter: AdaptiveTokenBucket
+    ) -> httpx.Response:
+        """_send_with_retry의 비동기 버전 (같은 UpstreamRetry 판단 사용)"""
+        retry = UpstreamRetry(limiter)
+        
+        while True:
+            if not await limiter.acquire_async(timeout=settings.UPSTREAM_RATE_WAIT_TIMEOUT):
+                raise RateLimitWaitTimeout("속도 제한 대기 시간 초과")
+            
+            try:
+                response = await async_upstream_transport.get(api_url, headers=headers)
+            except httpx.TransportError as e:
+                retry.record_error(e)
+            else:
+                if retry.record_response(response):
+                    return response
+            
+            delay = retry.next_delay()
+            if delay is None:
+                raise retry.exhausted()
+            await asyncio.sleep(delay)
+    
     def get_available_restaurants(self) -> Dict[str, str]:
         """사용 가능한 식당 목록 반환"""
         return settings.RESTAURANT_CODES
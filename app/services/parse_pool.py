@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.services.html_parser import HTMLParser
+from app.services.parse_result_cache import parse_result_cache
+from app.utils.html_digest import compute_content_hash
+
+logger = logging.getLogger(__name__)
+
+
+# 워커(프로세스/스레드)별 파서 (컴파일된 XPath 등을 재사용)
+_worker_local = threading.local()
+
+
+def _get_worker_parser() -> HTMLParser:
+    parser = getattr(_worker_local, "parser", None)
+    if parser is None:
+        parser = _worker_local.parser = HTMLParser()
+    return parser
+
+
+def parse_meal_html(html: str) -> Dict:
+    """워커 프로세스에서 실행되는 파싱 함수 (pickle 가능하도록 모듈 최상위에 정의)"""
+    return _get_worker_parser().parse_meal_html(html)
+
+
+def parse_meal_html_compact(html: str) -> Dict:
+    """
+    저장에 필요한 필드만 남긴 파싱 결과 (프로세스 간 전달량을 줄이기 위함)
+    
+    Returns:
+        {"day_of_week": str, "조식"/"중식"/"석식": [{"korean", "tags", "price", "image"}, ...]}
+    """
+    meal_data = parse_meal_html(html)
+    compact = {"day_of_week": meal_data.get("day_of_week", "")}
+    for meal_type in ("조식", "중식", "석식"):
+        compact[meal_type] = [
+            {
+                "korean": item["korean"],
+                "tags": item.get("tags", []),
+                "price": item.get("price", ""),
+                "image": item.get("image", "")
+            }
+            for item in meal_data.get(meal_type, [])
+        ]
+    return compact
+
+
+class ParsePool:
+    """
+    HTML 파싱 워커 풀
+    
+    BeautifulSoup 파싱은 CPU를 많이 쓰므로 이벤트 루프나 요청 스레드에서 하지 않고
+    별도 프로세스에서 실행합니다. PARSE_WORKER_PROCESSES가 0이면 스레드 하나로 대신합니다.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = settings.PARSE_WORKER_PROCESSES if max_workers is None else max_workers
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def executor(self) -> Executor:
+        """필요할 때 풀 생성"""
+        with self._lock:
+            if self._executor is None:
+                if self.max_workers > 0:
+                    # 스레드가 있는 서버 프로세스에서 fork하지 않도록 spawn 사용
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                    logger.info(f"파싱 워커 프로세스 풀 시작 ({self.max_workers}개)")
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="html-parse")
+            return self._executor
+    
+    async def parse(self, html: str) -> Dict:
+        """
+        HTML 파싱 (비동기, 이벤트 루프를 막지 않음)
+        
+        같은 내용의 페이지를 이미 파싱했다면 워커에 보내지 않고 캐시된 결과를 반환합니다.
+        """
+        # 해시 계산도 이벤트 루프 밖에서
+        digest = await asyncio.to_thread(compute_content_hash, html)
+        result = parse_result_cache.get(digest)
+        if result is None:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self.executor, parse_meal_html, html)
+            parse_result_cache.put(digest, result)
+        return result
+    
+    def shutdown(self):
+        """풀 종료 (앱 종료 시)"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+# 싱글톤 인스턴스
+parse_pool = ParsePool()
@@ -0,0 +1,95 @@
+"""
+HTML 파싱 결과 캐시
+
+/meals/parse, 자동 수집(MealFetcher), 수동 수집(/meals/fetch)이 같은 페이지를
+각자 다시 파싱하지 않도록, 프로세스 안에서 파싱 결과를 공유합니다.
+
+키는 정규화된 HTML 해시(compute_content_hash)입니다.
+요청마다 바뀌는 스크립트/주석/인증 토큰만 제외하므로(파서는 이 부분을 읽지 않음)
+토큰만 다른 같은 페이지는 한 번만 파싱되고, MealFetcher의 변경 감지와 같은 기준을 사용합니다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+from app.utils.html_digest import compute_content_hash
+
+
+class ParseResultCache:
+    """
+    HTML 해시 -> 파싱 결과 LRU 캐시 (스레드 안전)
+    
+    반환된 결과는 모든 호출자가 공유하므로 수정하지 말고 읽기만 해야 합니다.
+    """
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max(1, settings.PARSE_RESULT_CACHE_MAX_ENTRIES if max_entries is None else max_entries)
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, digest: str) -> Optional[Dict]:
+        """캐시된 파싱 결과 (없으면 None)"""
+        with self._lock:
+            result = self._entries.get(digest)
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(digest)
+            return result
+    
+    def put(self, digest: str, result: Dict):
+        with self._lock:
+            self._entries[digest] = result
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def get_or_parse(
+        self,
+        html: str,
+        parse: Callable[[str], Dict],
+        digest: Optional[str] = None
+    ) -> Dict:
+        """
+        캐시된 결과를 반환하거나 파싱 후 저장
+        
+        Args:
+            html: 원본 HTML
+            parse: 파싱 함수 (HTMLParser.parse_meal_html 등)
+            digest: 이미 계산한 compute_content_hash(html) (생략시 계산)
+        
+        Returns:
+            파싱된 급식 정보 (공유 객체, 읽기 전용)
+        """
+        if digest is None:
+            digest = compute_content_hash(html)
+        
+        result = self.get(digest)
+        if result is None:
+            # 파싱은 락 밖에서 (동시에 같은 페이지가 들어오면 양쪽 모두 파싱할 수 있음)
+            result = parse(html)
+            self.put(digest, result)
+        return result
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / requests, 3) if requests else None
+            }
+
+
+# 싱글톤 인스턴스
+parse_result_cache = ParseResultCache()
@@ -1,9 +1,13 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from datetime import datetime, timedelta
 import logging
 
 from app.db.session import SessionLocal
 from app.services.meal_fetcher import meal_fetcher
+from app.services.fetch_planner import fetch_planner
+from app.crud import fetch_state as crud_fetch_state
+from app.crud import fetch_task as crud_fetch_task
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -12,11 +16,45 @@ scheduler = AsyncIOScheduler()
 
 
 def scheduled_meal_fetch():
-    """스케줄된 급식 정보 수집 작업"""
-    logger.info("스케줄된 급식 정보 수집 시작")
+    """
+    스케줄된 급식 정보 수집 작업
+    
+    수집 계획(fetch_planner)이 고른 (식당, 날짜)만 가져옵니다.
+    FETCH_QUEUE_ENABLED면 직접 수집하지 않고 작업 큐에 등록해 모든 워커가 나눠 처리합니다.
+    """
     db = SessionLocal()
     try:
-        meal_fetcher.fetch_and_store_meals(db)
+        now = datetime.now()
+        today = now.date()
+        states = crud_fetch_state.get_fetch_states(
+            db,
+            list(settings.RESTAURANT_CODES.keys()),
+            today,
+            today + timedelta(days=settings.MEAL_FETCH_DAYS_AHEAD)
+        )
+        
+        plan = fetch_planner.plan(states, now)
+        if plan.deferred:
+            logger.warning(f"일일 요청 예산 부족으로 {plan.deferred}건을 다음 주기로 미룹니다.")
+        if not plan.targets:
+            return
+        
+        if settings.FETCH_QUEUE_ENABLED:
+            counts = crud_fetch_task.enqueue_fetch_tasks(db, plan.targets, source="scheduler")
+            fetch_planner.record_requests(counts["created"] + counts["requeued"])
+            logger.info(
+                f"스케줄된 급식 정보 수집 작업 등록 (식사 시간 갱신 {plan.urgent}건, 재수집 {plan.routine}건 / "
+                f"신규 {counts['created']}, 재등록 {counts['requeued']}, 대기 중 {counts['already_queued']})"
+            )
+            return
+        
+        logger.info(
+            f"스케줄된 급식 정보 수집 시작 (식사 시간 갱신 {plan.urgent}건, 재수집 {plan.routine}건)"
+        )
+        summary = meal_fetcher.fetch_and_store_targets(db, plan.targets)
+        fetch_planner.record_requests(
+            summary["fetched_days"] + summary["skipped_days"] + summary["failed_days"]
+        )
     except Exception as e:
         logger.error(f"스케줄된 급식 정보 수집 실패: {e}")
     finally:
@@ -24,30 +62,22 @@ def scheduled_meal_fetch():
 
 
 def start_scheduler():
-    """스케줄러 시작"""
-    # Cron 표현식 파싱 (예: "0 2 * * *" = 매일 새벽 2시)
-    cron_parts = settings.MEAL_FETCH_SCHEDULE.split()
+    """스케줄러 시작 (시작 직후 한 번 실행 후 MEAL_FETCH_TICK_MINUTES마다 실행)"""
+    scheduler.add_job(
+        scheduled_meal_fetch,
+        IntervalTrigger(minutes=settings.MEAL_FETCH_TICK_MINUTES),
+        id="meal_fetch_job",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now()
+    )
     
-    if len(cron_parts) == 5:
-        minute, hour, day, month, day_of_week = cron_parts
-        
-        scheduler.add_job(
-            scheduled_meal_fetch,
-            CronTrigger(
-                minute=minute,
-                hour=hour,
-                day=day,
-                month=month,
-                day_of_week=day_of_week
-            ),
-            id="meal_fetch_job",
-            replace_existing=True
-        )
-        
-        logger.info(f"스케줄러 시작: {settings.MEAL_FETCH_SCHEDULE}")
-        scheduler.start()
-    else:
-        logger.error(f"잘못된 cron 표현식: {settings.MEAL_FETCH_SCHEDULE}")
+    logger.info(
+        f"스케줄러 시작: {settings.MEAL_FETCH_TICK_MINUTES}분 주기 "
+        f"(일일 요청 예산 {settings.MEAL_FETCH_DAILY_BUDGET}건)"
+    )
+    scheduler.start()
 
 
 def stop_scheduler():
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from typing import Dict, Optional
+
+import httpx
+import requests
+
+from app.core.config import settings
+from app.utils.ssl_adapter import SSLContextAdapter, create_ssl_context
+
+
+class UpstreamTransport:
+    """
+    한양대 서버용 프로세스 공용 HTTP 전송 계층
+    
+    - SSL 컨텍스트(SECLEVEL=1)와 커넥션 풀(어댑터)은 프로세스에서 하나만 만들어 공유합니다.
+      keep-alive 연결을 재사용하므로 요청마다 TLS 핸드셰이크를 하지 않습니다.
+    - requests.Session은 스레드 안전하지 않으므로(쿠키 등) 스레드마다 따로 두고,
+      같은 어댑터를 마운트하여 연결만 공유합니다.
+    """
+    
+    def __init__(self, pool_maxsize: int = None):
+        self.pool_maxsize = pool_maxsize or max(
+            settings.UPSTREAM_POOL_MAXSIZE, settings.MEAL_FETCH_CONCURRENCY
+        )
+        self.ssl_context = create_ssl_context()
+        self.adapter = SSLContextAdapter(
+            self.ssl_context,
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=True  # 풀이 가득 차면 새 연결 대신 반납을 기다림
+        )
+        self._local = threading.local()
+        self._sessions_created = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def session(self) -> requests.Session:
+        """현재 스레드 전용 세션 (공유 어댑터 사용)"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            # HANYANG_BASE_URL이 http://인 경우(로컬 대역 서버 등)도 같은 풀 사용
+            for prefix in ("https://", "http://"):
+                session.mount(prefix, self.adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions_created += 1
+        return session
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET 요청"""
+        return self.session.get(url, **kwargs)
+    
+    def stats(self) -> Dict:
+        """
+        커넥션 풀 통계
+        
+        Returns:
+            requests: 보낸 요청 수
+            new_connections: 새로 연 연결 수 (= TLS 핸드셰이크 수)
+            reused_requests: 기존 keep-alive 연결로 처리한 요청 수
+        """
+        total_requests = 0
+        new_connections = 0
+        
+        pools = self.adapter.poolmanager.pools
+        with pools.lock:
+            pool_list = list(pools._container.values())
+        
+        for pool in pool_list:
+            total_requests += pool.num_requests
+            new_connections += pool.num_connections
+        
+        return {
+            "pool_maxsize": self.pool_maxsize,
+            "sessions": self._sessions_created,
+            "requests": total_requests,
+            "new_connections": new_connections,
+            "reused_requests": max(0, total_requests - new_connections),
+            "reuse_ratio": round(1 - new_connections / total_requests, 3) if total_requests else None
+        }
+
+
+# 프로세스 공용 인스턴스
+upstream_transport = UpstreamTransport()
+
+
+class AsyncUpstreamTransport:
+    """
+    한양대 서버용 비동기 HTTP 전송 계층 (httpx)
+    
+    UpstreamTransport와 같은 SSL 컨텍스트(SECLEVEL=1)를 사용하며,
+    클라이언트는 이벤트 루프마다 하나씩 만들어 keep-alive 연결을 재사용합니다.
+    """
+    
+    def __init__(self, ssl_context=None, pool_maxsize: int = None):
+        self.ssl_context = ssl_context or upstream_transport.ssl_context
+        self.pool_maxsize = pool_maxsize or upstream_transport.pool_maxsize
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프용 클라이언트"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                verify=self.ssl_context,
+                timeout=httpx.Timeout(
+                    settings.UPSTREAM_READ_TIMEOUT,
+                    connect=settings.UPSTREAM_CONNECT_TIMEOUT
+                ),
+                limits=httpx.Limits(
+                    max_connections=self.pool_maxsize,
+                    max_keepalive_connections=self.pool_maxsize
+                )
+            )
+            self._client_loop = loop
+        return self._client
+    
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """GET 요청"""
+        return await self.client.get(url, **kwargs)
+    
+    async def aclose(self):
+        """클라이언트 종료 (앱 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+
+
+# 프로세스 공용 비동기 인스턴스
+async_upstream_transport = AsyncUpstreamTransport()
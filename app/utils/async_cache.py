@@ -0,0 +1,128 @@
+"""
+비동기 single-flight + TTL 캐시
+
+같은 키에 대한 동시 요청은 하나의 로드 작업을 공유하고,
+결과는 짧은 시간 동안 메모리에 보관합니다.
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    stored_at: float
+
+
+class SingleFlightTTLCache:
+    """
+    single-flight + TTL 캐시 (이벤트 루프 단일 스레드에서 사용)
+    
+    - ttl 이내: 캐시된 값을 바로 반환
+    - ttl ~ ttl + stale_ttl: 이전 값을 바로 반환하고 백그라운드에서 갱신 (stale-while-revalidate)
+    - 그 이후 또는 캐시 없음: 로드 완료까지 대기 (동시 요청은 같은 로드를 공유)
+    - 로드가 실패했을 때 캐시에 이전 값이 남아 있으면 그 값을 반환 (stale-if-error)
+    """
+    
+    def __init__(self, ttl: float, stale_ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.load_errors = 0
+    
+    def _store(self, key: Hashable, value: Any):
+        self._entries[key] = _CacheEntry(value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _start_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """진행 중인 로드가 있으면 공유, 없으면 새로 시작"""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+        
+        async def load():
+            value = await loader()
+            self._store(key, value)
+            return value
+        
+        task = asyncio.ensure_future(load())
+        self._inflight[key] = task
+        
+        def on_done(done: asyncio.Task):
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+            if not done.cancelled() and done.exception() is not None:
+                self.load_errors += 1
+                logger.warning(f"캐시 로드 실패 - {key}: {done.exception()}")
+        
+        task.add_done_callback(on_done)
+        return task
+    
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        캐시에서 값을 가져오거나 로드
+        
+        Args:
+            key: 캐시 키
+            loader: 값을 만드는 코루틴 함수 (인자 없음)
+        
+        Returns:
+            캐시된 값 또는 새로 로드한 값
+        """
+        entry = self._entries.get(key)
+        age = time.monotonic() - entry.stored_at if entry else None
+        
+        if entry and age < self.ttl:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry.value
+        
+        if entry and age < self.ttl + self.stale_ttl:
+            # 이전 값을 바로 반환하고 백그라운드에서 갱신
+            self.stale_hits += 1
+            self._start_load(key, loader)
+            return entry.value
+        
+        self.misses += 1
+        task = self._start_load(key, loader)
+        try:
+            # 요청이 취소되어도 공유 로드는 계속 진행
+            return await asyncio.shield(task)
+        except Exception:
+            if entry is not None:
+                self.stale_hits += 1
+                return entry.value
+            raise
+    
+    def invalidate(self, key: Hashable = None):
+        """캐시 삭제 (key가 없으면 전체)"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+    
+    def stats(self) -> Dict:
+        requests = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "load_errors": self.load_errors,
+            "hit_ratio": round((self.hits + self.stale_hits) / requests, 3) if requests else None
+        }
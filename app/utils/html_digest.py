@@ -0,0 +1,50 @@
+"""
+HTML 정규화 및 해시 유틸리티
+
+한양대 페이지에는 요청마다 바뀌는 스크립트/인증 토큰이 섞여 있어
+원문 그대로 비교하면 항상 "변경됨"으로 판단됩니다.
+비교 전에 이런 부분을 제거한 뒤 해시를 계산합니다.
+
+파서는 텍스트의 연속 공백으로 메뉴를 나누고 이미지 URL을 저장하므로,
+텍스트 공백과 그 밖의 쿼리 파라미터는 그대로 둡니다 (바뀌면 다시 파싱해야 함).
+"""
+import hashlib
+import re
+
+
+# 요청마다 달라지는 부분
+_SCRIPT_RE = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_VOLATILE_PARAM_RE = re.compile(r"\b(p_auth|_csrf)=[\w\-]+", re.IGNORECASE)
+
+
+def normalize_html(html: str) -> str:
+    """
+    비교용 HTML 정규화
+    
+    Args:
+        html: 원본 HTML
+    
+    Returns:
+        스크립트, 주석, 인증/CSRF 토큰 값을 제거한 문자열
+    """
+    if not html:
+        return ""
+    
+    text = _SCRIPT_RE.sub("", html)
+    text = _COMMENT_RE.sub("", text)
+    text = _VOLATILE_PARAM_RE.sub(r"\1=", text)
+    return text.strip()
+
+
+def compute_content_hash(html: str) -> str:
+    """
+    정규화된 HTML의 sha256 해시
+    
+    Args:
+        html: 원본 HTML
+    
+    Returns:
+        16진수 해시 문자열 (64자)
+    """
+    return hashlib.sha256(normalize_html(html).encode("utf-8")).hexdigest()
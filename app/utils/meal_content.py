@@ -0,0 +1,45 @@
+"""
+메뉴 내용 비교 유틸리티
+
+수집한 메뉴와 DB의 메뉴를 목록 순서가 아니라 내용(메뉴명 + 태그)으로 짝짓기 위한 키와 해시입니다.
+공백 차이와 태그 순서는 같은 메뉴로 봅니다.
+해시는 meals.content_hash에 저장되어 중복 판별과 유일성 제약(unique_meal_content)에 쓰입니다.
+"""
+import hashlib
+import json
+from typing import Iterable, Optional, Tuple, Union
+
+
+def normalize_menu_items(items: Optional[Union[str, Iterable[str]]]) -> Tuple[str, ...]:
+    """메뉴명/태그 목록 정규화 (앞뒤 공백 제거, 연속 공백은 하나로, 빈 항목 제거)"""
+    if not items:
+        return ()
+    if isinstance(items, str):
+        items = [items]
+    normalized = (" ".join(str(item).split()) for item in items)
+    return tuple(item for item in normalized if item)
+
+
+def meal_content_key(korean_name, tags) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    메뉴 내용 키
+    
+    Args:
+        korean_name: 메뉴명 리스트 (또는 문자열)
+        tags: 태그 리스트
+    
+    Returns:
+        (정규화된 메뉴명 튜플, 정렬된 태그 튜플)
+    """
+    return normalize_menu_items(korean_name), tuple(sorted(normalize_menu_items(tags)))
+
+
+def meal_content_hash(korean_name, tags) -> str:
+    """
+    메뉴 내용 해시 (meals.content_hash)
+    
+    Returns:
+        meal_content_key를 JSON으로 직렬화한 sha256 16진수 문자열 (64자)
+    """
+    canonical = json.dumps(meal_content_key(korean_name, tags), ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
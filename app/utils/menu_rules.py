@@ -0,0 +1,119 @@
+"""
+메뉴 텍스트 분류 규칙
+
+안내 문구 판별과 메뉴 분리 규칙을 설정(MENU_NOTICE_*, MENU_SPLIT_RULES 등)에서 읽어
+한 번만 컴파일합니다. 안내 문구는 .env에 JSON 목록으로 추가할 수 있습니다.
+"""
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from app.core.config import settings
+
+TAG_PATTERN = re.compile(r'\[([^\]]+)\]')
+TAG_REMOVE_PATTERN = re.compile(r'\[[^\]]+\]')
+KOREAN_WORD_PATTERN = re.compile(r'[가-힣]+')
+
+
+class SplitRule(NamedTuple):
+    """구분자 분리 규칙 (구분자가 min_count번 이상 있고, 결과가 min_items개 이상이면 채택)"""
+    separator: "re.Pattern"
+    min_items: int
+    min_count: int
+
+
+def _compile_alternation(patterns: Iterable[str], keywords: Iterable[str]) -> Optional["re.Pattern"]:
+    """정규식과 키워드를 하나의 대소문자 무시 정규식으로 합침"""
+    alternatives = [f"(?:{pattern})" for pattern in patterns]
+    alternatives += [re.escape(keyword) for keyword in keywords]
+    if not alternatives:
+        return None
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+class MenuTextRules:
+    """컴파일된 안내 문구 판별 및 메뉴 분리 규칙"""
+    
+    def __init__(
+        self,
+        notice_patterns: List[str],
+        notice_keywords: List[str],
+        whole_text_keywords: List[str],
+        split_rules: List[Dict]
+    ):
+        self.notice = _compile_alternation(notice_patterns, notice_keywords)
+        self.whole_text = _compile_alternation([], whole_text_keywords)
+        self.split_rules = [
+            SplitRule(
+                separator=re.compile(rule["pattern"]),
+                min_items=rule.get("min_items", 1),
+                min_count=rule.get("min_count", 1)
+            )
+            for rule in split_rules
+        ]
+    
+    @classmethod
+    def from_settings(cls) -> "MenuTextRules":
+        return cls(
+            notice_patterns=settings.MENU_NOTICE_PATTERNS,
+            notice_keywords=settings.MENU_NOTICE_KEYWORDS,
+            whole_text_keywords=settings.MENU_WHOLE_TEXT_KEYWORDS,
+            split_rules=settings.MENU_SPLIT_RULES
+        )
+    
+    def is_notice(self, text: str) -> bool:
+        """안내 문구인지 확인"""
+        return bool(text) and self.notice is not None and self.notice.search(text) is not None
+    
+    def has_notice(self, items: List[str]) -> bool:
+        """
+        항목 중 하나라도 안내 문구인지 확인
+        
+        안내 문구 규칙은 줄바꿈을 넘어 매칭되지 않으므로 (re.DOTALL 미사용)
+        줄바꿈으로 이어 붙여 한 번만 검사합니다.
+        """
+        return self.is_notice("\n".join(items))
+    
+    def extract_tags(self, text: str) -> List[str]:
+        """대괄호 안의 텍스트를 태그로 추출"""
+        if not text:
+            return []
+        return TAG_PATTERN.findall(text)
+    
+    def split(self, text: str) -> List[str]:
+        """
+        태그를 제거하고 메뉴 항목 리스트로 분리
+        
+        1. 분리하지 않을 문구(휴무 등)가 있으면 전체를 하나로
+        2. MENU_SPLIT_RULES를 순서대로 적용해 처음 조건을 만족하는 결과
+        3. 한글 단어가 2개 이상이면 한글 단어 단위
+        4. 공백 단위
+        """
+        if not text:
+            return []
+        
+        # 대괄호 제거 (태그는 별도로 처리됨)
+        text = TAG_REMOVE_PATTERN.sub('', text)
+        
+        if self.whole_text is not None and self.whole_text.search(text):
+            return [text.strip()]
+        
+        for rule in self.split_rules:
+            if rule.min_count > 1:
+                if len(rule.separator.findall(text)) < rule.min_count:
+                    continue
+            elif not rule.separator.search(text):
+                continue
+            
+            result = [item.strip() for item in rule.separator.split(text) if item.strip()]
+            if len(result) >= rule.min_items:
+                return result
+        
+        # 한글 단어 경계로 분리 (예: "요구르트참치김치찌개" -> "요구르트", "참치김치찌개")
+        korean_words = KOREAN_WORD_PATTERN.findall(text)
+        if len(korean_words) > 1:
+            return korean_words
+        
+        return text.split()
+
+
+menu_text_rules = MenuTextRules.from_settings()
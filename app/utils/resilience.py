@@ -0,0 +1,213 @@
+"""
+외부 서버 요청 보호 유틸리티
+
+한양대 서버가 느리거나 장애일 때 요청이 쌓이지 않도록
+호스트별 토큰 버킷 속도 제한, 지터가 있는 지수 백오프, 서킷 브레이커를 제공합니다.
+"""
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않음"""
+    pass
+
+
+class RateLimitWaitTimeout(Exception):
+    """
+    속도 제한기 토큰을 기다리다 시간 초과
+    
+    이 프로세스의 요청이 몰렸다는 뜻이지 서버 장애가 아니므로 RequestException이 아니며,
+    서킷 브레이커 실패로 세지 않습니다.
+    """
+    pass
+
+
+class AdaptiveTokenBucket:
+    """
+    적응형 토큰 버킷 속도 제한기 (스레드 안전)
+    
+    서버가 느려지거나 오류를 보내면 초당 요청 수를 절반으로 줄이고(penalize),
+    성공하면 조금씩 원래 속도로 회복합니다(reward).
+    """
+    
+    def __init__(self, rate: float, burst: int, min_rate: float = 0.2):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+    
+    def _try_take(self) -> float:
+        """토큰이 있으면 하나 가져가고 0, 없으면 다음 토큰까지 대기 시간(초) 반환"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+    
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        토큰 하나 획득 (필요하면 대기)
+        
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+        
+        Returns:
+            bool: 획득하면 True, 시간 초과면 False
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        while True:
+            wait = self._try_take()
+            if wait == 0:
+                return True
+            
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+    
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """acquire의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        while True:
+            wait = self._try_take()
+            if wait == 0:
+                return True
+            
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            await asyncio.sleep(wait)
+    
+    def penalize(self):
+        """서버 과부하 신호 - 속도를 절반으로"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+    
+    def reward(self):
+        """요청 성공 - 속도를 조금씩 회복"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
+    
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "max_rate": self.max_rate,
+                "tokens": round(self.tokens, 2)
+            }
+
+
+class CircuitBreaker:
+    """
+    서킷 브레이커 (스레드 안전)
+    
+    - closed: 정상. 연속 실패가 failure_threshold에 도달하면 open
+    - open: reset_timeout 동안 요청을 즉시 실패 처리
+    - half_open: 시험 요청 하나만 허용. 성공하면 closed, 실패하면 다시 open
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.total_failures = 0
+        self.total_rejected = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    def before_request(self):
+        """
+        요청 전 상태 확인
+        
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    self.total_rejected += 1
+                    raise CircuitOpenError("서킷 브레이커가 열려 있어 요청을 보내지 않습니다.")
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            
+            if self.state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    self.total_rejected += 1
+                    raise CircuitOpenError("서킷 브레이커 시험 요청이 진행 중입니다.")
+                self._probe_in_flight = True
+    
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._probe_in_flight = False
+    
+    def release_probe(self):
+        """결과 없이 끝난 요청(취소 등)의 시험 요청 반납 (실패로 세지 않음)"""
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self.total_failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+    
+    def snapshot(self) -> Dict:
+        with self._lock:
+            retry_in = None
+            if self.state == self.OPEN:
+                retry_in = max(0.0, round(self.reset_timeout - (time.monotonic() - self.opened_at), 1))
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "total_failures": self.total_failures,
+                "total_rejected": self.total_rejected,
+                "retry_in_seconds": retry_in
+            }
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """
+    지터가 있는 지수 백오프 (full jitter)
+    
+    Args:
+        attempt: 재시도 횟수 (0부터)
+        base: 기본 대기 시간 (초)
+        maximum: 최대 대기 시간 (초)
+    
+    Returns:
+        float: 0 ~ min(maximum, base * 2^attempt) 사이의 대기 시간
+    """
+    return random.uniform(0, min(maximum, base * (2 ** attempt)))
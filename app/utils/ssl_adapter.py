@@ -18,15 +18,18 @@ class SSLContextAdapter(HTTPAdapter):
         return super().proxy_manager_for(*args, **kwargs)
 
 
+def create_ssl_context() -> ssl.SSLContext:
+    """한양대 서버용 SSL 컨텍스트 생성 (SECLEVEL=1)"""
+    ctx = ssl.create_default_context()
+    ctx.set_ciphers("DEFAULT@SECLEVEL=1")
+    return ctx
+
+
 def create_ssl_session():
     """SSL 세션 생성"""
     import requests
     
-    ctx = ssl.create_default_context()
-    ctx.set_ciphers("DEFAULT@SECLEVEL=1")
-    
     session = requests.Session()
-    session.mount("https://", SSLContextAdapter(ctx))
+    session.mount("https://", SSLContextAdapter(create_ssl_context()))
     
     return session
-
@@ -0,0 +1,347 @@
+"""
+여러 기간의 급식 데이터 일괄 수집 (이어하기 지원)
+
+사용법:
+    python scripts/backfill_meals.py 2024
+    python scripts/backfill_meals.py 2024-03:2024-06 2024-09-01:2024-09-15 --restaurants re11 re12
+    python scripts/backfill_meals.py 2024 --concurrency 8 --rate 8 --workers 2
+    python scripts/backfill_meals.py 2024 --restart
+
+설명:
+    기간은 START[:END] 형식이며 START/END는 YYYY, YYYY-MM, YYYY-MM-DD 중 하나입니다.
+    (START는 해당 기간의 첫날, END는 마지막 날로 해석, END를 생략하면 START 기간 전체)
+    
+    수집은 --concurrency개 스레드, 파싱은 --workers개 프로세스에서 병렬로 실행하고
+    저장은 메인 스레드 하나가 (식당, 날짜) 단위로 합니다. (fetch_meals.py와 같은 파이프라인)
+    
+    (식당, 날짜)를 저장할 때마다 체크포인트 파일에 기록하므로, 중단된 뒤 같은 명령을 다시 실행하면
+    이미 끝난 (식당, 날짜)는 건너뛰고 이어서 수집합니다. 실패한 날짜는 기록되지 않아 다음 실행에서 다시 시도합니다.
+    처음부터 다시 하려면 --restart를 사용하세요.
+    
+    한양대 서버 요청은 UPSTREAM_RATE_PER_SECOND(기본 초당 4회)로 제한되므로
+    1년치(4개 식당, 약 1,460페이지)는 기본 설정으로 약 6분이 걸립니다.
+"""
+
+import argparse
+import calendar
+import json
+import os
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+import logging
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT = "data/backfill_checkpoint.jsonl"
+
+
+def parse_period_start(value: str) -> date:
+    """YYYY / YYYY-MM / YYYY-MM-DD -> 기간의 첫날"""
+    parts = [int(part) for part in value.split("-")]
+    if len(parts) == 1:
+        return date(parts[0], 1, 1)
+    if len(parts) == 2:
+        return date(parts[0], parts[1], 1)
+    return date(*parts)
+
+
+def parse_period_end(value: str) -> date:
+    """YYYY / YYYY-MM / YYYY-MM-DD -> 기간의 마지막 날"""
+    parts = [int(part) for part in value.split("-")]
+    if len(parts) == 1:
+        return date(parts[0], 12, 31)
+    if len(parts) == 2:
+        return date(parts[0], parts[1], calendar.monthrange(parts[0], parts[1])[1])
+    return date(*parts)
+
+
+def parse_range(value: str) -> Tuple[date, date]:
+    """START[:END] 형식의 기간"""
+    start, _, end = value.partition(":")
+    try:
+        start_date = parse_period_start(start)
+        end_date = parse_period_end(end or start)
+    except (TypeError, ValueError):
+        raise argparse.ArgumentTypeError(f"잘못된 기간: {value} (예: 2024, 2024-03:2024-06, 2024-09-01:2024-09-15)")
+    if start_date > end_date:
+        raise argparse.ArgumentTypeError(f"시작 날짜가 종료 날짜보다 늦습니다: {value}")
+    return start_date, end_date
+
+
+def expand_dates(ranges: List[Tuple[date, date]]) -> List[date]:
+    """기간 목록 -> 중복 없는 날짜 목록 (날짜순)"""
+    dates = set()
+    for start_date, end_date in ranges:
+        for offset in range((end_date - start_date).days + 1):
+            dates.add(start_date + timedelta(days=offset))
+    return sorted(dates)
+
+
+class Checkpoint:
+    """완료한 (식당 코드, 날짜)를 한 줄씩 추가 기록하는 파일 (JSON Lines)"""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = None
+    
+    def load(self) -> Set[Tuple[str, date]]:
+        done = set()
+        if not self.path.exists():
+            return done
+        
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    done.add((entry["restaurant"], date.fromisoformat(entry["date"])))
+                except (ValueError, KeyError):
+                    # 기록 중 중단되어 잘린 마지막 줄
+                    continue
+        return done
+    
+    def reset(self):
+        if self.path.exists():
+            self.path.unlink()
+    
+    def mark_done(self, restaurant_code: str, target_date: date):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a", encoding="utf-8")
+        self._file.write(json.dumps({"restaurant": restaurant_code, "date": target_date.isoformat()}) + "\n")
+        self._file.flush()
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}시간 {seconds % 3600 // 60}분"
+    if seconds >= 60:
+        return f"{seconds // 60}분 {seconds % 60}초"
+    return f"{seconds}초"
+
+
+class ProgressReporter:
+    """처리량(pages/sec)과 남은 시간 출력"""
+    
+    def __init__(self, total: int, interval: float):
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self._last_report = self.started
+    
+    def update(self, ok: bool):
+        if ok:
+            self.done += 1
+        else:
+            self.failed += 1
+        
+        now = time.monotonic()
+        if now - self._last_report >= self.interval:
+            self._last_report = now
+            self.report()
+    
+    def report(self):
+        processed = self.done + self.failed
+        elapsed = time.monotonic() - self.started
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        remaining = self.total - processed
+        eta = format_duration(remaining / rate) if rate > 0 else "-"
+        percent = processed / self.total * 100 if self.total else 100.0
+        logger.info(
+            f"📈 진행 {processed}/{self.total} ({percent:.1f}%) | 실패 {self.failed} | "
+            f"{rate:.1f} pages/s | 경과 {format_duration(elapsed)} | 남은 시간 약 {eta}"
+        )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="여러 기간의 급식 데이터 일괄 수집 (이어하기 지원)")
+    parser.add_argument("ranges", nargs="+", type=parse_range, help="수집 기간 START[:END] (YYYY, YYYY-MM, YYYY-MM-DD)")
+    parser.add_argument("--restaurants", nargs="+", help="식당 코드 (생략시 전체)")
+    parser.add_argument("--concurrency", type=int, help="동시 요청 수 (생략시 MEAL_FETCH_CONCURRENCY)")
+    parser.add_argument("--rate", type=float, help="초당 최대 요청 수 (생략시 UPSTREAM_RATE_PER_SECOND)")
+    parser.add_argument("--workers", type=int, default=0, help="HTML 파싱 프로세스 수 (0이면 수집 스레드에서 파싱)")
+    parser.add_argument("--checkpoint", type=Path, default=Path(DEFAULT_CHECKPOINT), help="체크포인트 파일")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 지우고 처음부터 수집")
+    parser.add_argument("--progress-interval", type=float, default=5.0, help="진행 상황 출력 간격 (초)")
+    parser.add_argument("--lock-wait", type=float, default=0, help="다른 수집이 진행 중일 때 기다릴 시간 (초, 0이면 바로 종료)")
+    return parser.parse_args()
+
+
+def configure_environment(args: argparse.Namespace):
+    """app 모듈을 import하기 전에 설정을 환경 변수로 덮어쓰기"""
+    if args.concurrency:
+        os.environ["MEAL_FETCH_CONCURRENCY"] = str(args.concurrency)
+    if args.rate:
+        os.environ["UPSTREAM_RATE_PER_SECOND"] = str(args.rate)
+        os.environ["UPSTREAM_RATE_BURST"] = str(max(1, int(args.rate)))
+
+
+def backfill(
+    ranges: List[Tuple[date, date]],
+    restaurant_codes: Optional[List[str]],
+    workers: int,
+    checkpoint: Checkpoint,
+    progress_interval: float
+) -> dict:
+    """
+    기간 목록의 급식 데이터 수집
+    
+    Returns:
+        수집 결과 통계 (fetch_meals.fetch_meals_for_month와 같은 형식, skipped 포함)
+    """
+    from app.core.config import settings
+    from app.crud import meal as crud_meal
+    from app.db.session import SessionLocal
+    from app.services.db_lease import meal_fetch_lease
+    from fetch_meals import iter_parsed_pages, store_day
+    
+    codes = restaurant_codes or list(settings.RESTAURANT_CODES)
+    dates = expand_dates(ranges)
+    done = checkpoint.load()
+    
+    targets = [
+        (restaurant_code, target_date)
+        for target_date in dates
+        for restaurant_code in codes
+        if (restaurant_code, target_date) not in done
+    ]
+    skipped = len(dates) * len(codes) - len(targets)
+    
+    stats = {
+        "total_saved": 0,
+        "total_updated": 0,
+        "total_unchanged": 0,
+        "total_deleted": 0,
+        "total_errors": 0,
+        "skipped": skipped,
+        "restaurants": {}
+    }
+    
+    logger.info(f"📅 기간: {', '.join(f'{start} ~ {end}' for start, end in ranges)} ({len(dates)}일)")
+    logger.info(f"🍽️  식당: {', '.join(codes)}")
+    logger.info(
+        f"⚙️  동시 요청 {settings.MEAL_FETCH_CONCURRENCY}, 초당 최대 {settings.UPSTREAM_RATE_PER_SECOND}회, "
+        f"파싱 프로세스 {workers}"
+    )
+    if skipped:
+        logger.info(f"⏩ 체크포인트에서 이어하기: 완료된 {skipped}개 건너뜀 ({checkpoint.path})")
+    logger.info(f"📦 수집 대상: {len(targets)}개 (식당, 날짜)")
+    
+    if not targets:
+        return stats
+    
+    db = SessionLocal()
+    progress = ProgressReporter(len(targets), progress_interval)
+    
+    try:
+        restaurants = {}
+        for restaurant_code in codes:
+            restaurant_name = settings.RESTAURANT_CODES[restaurant_code]
+            restaurants[restaurant_code] = crud_meal.get_or_create_restaurant(db, restaurant_code, restaurant_name)
+            stats["restaurants"][restaurant_name] = {"saved": 0, "updated": 0, "unchanged": 0, "deleted": 0, "errors": 0}
+        
+        for restaurant_code, target_date, future in iter_parsed_pages(targets, workers):
+            if meal_fetch_lease.lost:
+                # 락 갱신에 실패해 다른 서버/프로세스가 가져갔으므로 더 저장하지 않음
+                logger.error("❌ 수집 락을 잃어 중단합니다. 다시 실행하면 이어서 수집합니다.")
+                stats["total_errors"] += 1
+                break
+            
+            restaurant = restaurants[restaurant_code]
+            restaurant_stats = stats["restaurants"][restaurant.name]
+            
+            try:
+                meal_data = future.result()
+                ok = store_day(db, restaurant, target_date, meal_data, stats, restaurant_stats)
+            except Exception as e:
+                db.rollback()
+                logger.error(f"   ❌ [{restaurant.name}] {target_date} 처리 실패: {e}")
+                restaurant_stats["errors"] += 1
+                stats["total_errors"] += 1
+                ok = False
+            
+            if ok:
+                checkpoint.mark_done(restaurant_code, target_date)
+            progress.update(ok)
+        
+        progress.report()
+        return stats
+    
+    finally:
+        checkpoint.close()
+        db.close()
+
+
+def main():
+    """메인 함수"""
+    args = parse_arguments()
+    configure_environment(args)
+    
+    from app.core.config import settings
+    from app.services.db_lease import meal_fetch_lease
+    
+    unknown = [code for code in args.restaurants or [] if code not in settings.RESTAURANT_CODES]
+    if unknown:
+        logger.error(f"❌ 알 수 없는 식당 코드: {unknown} (사용 가능: {list(settings.RESTAURANT_CODES)})")
+        sys.exit(1)
+    
+    checkpoint = Checkpoint(args.checkpoint)
+    if args.restart:
+        checkpoint.reset()
+        logger.info(f"🗑️  체크포인트 초기화: {args.checkpoint}")
+    
+    logger.info("=" * 70)
+    logger.info("🚀 급식 데이터 일괄 수집 시작")
+    logger.info("=" * 70)
+    
+    # 수집 락 획득 (서버의 스케줄러/수집 작업, 다른 스크립트와 동시에 실행하지 않음)
+    if not meal_fetch_lease.acquire(timeout=args.lock_wait):
+        logger.error("❌ 다른 급식 정보 수집(서버 또는 다른 스크립트)이 진행 중입니다. --lock-wait로 기다릴 수 있습니다.")
+        sys.exit(1)
+    
+    try:
+        stats = backfill(args.ranges, args.restaurants, max(0, args.workers), checkpoint, args.progress_interval)
+    except KeyboardInterrupt:
+        logger.warning(f"\n⏸️  중단되었습니다. 같은 명령으로 다시 실행하면 이어서 수집합니다. ({args.checkpoint})")
+        sys.exit(130)
+    finally:
+        meal_fetch_lease.release()
+    
+    logger.info("=" * 70)
+    logger.info("📊 전체 통계:")
+    logger.info(f"   신규 저장: {stats['total_saved']}개")
+    logger.info(f"   업데이트: {stats['total_updated']}개")
+    logger.info(f"   변경 없음: {stats['total_unchanged']}개")
+    logger.info(f"   삭제: {stats['total_deleted']}개")
+    logger.info(f"   이어하기로 건너뜀: {stats['skipped']}개 (식당, 날짜)")
+    logger.info(f"   오류: {stats['total_errors']}개")
+    
+    if stats["total_errors"] > 0:
+        logger.warning(f"⚠️  경고: {stats['total_errors']}개의 오류가 발생했습니다. 다시 실행하면 실패한 날짜만 재시도합니다.")
+        sys.exit(1)
+    
+    logger.info("✅ 모든 작업이 성공적으로 완료되었습니다!")
+
+
+if __name__ == "__main__":
+    main()
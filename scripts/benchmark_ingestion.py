@@ -0,0 +1,136 @@
+"""
+급식 수집 파이프라인 벤치마크
+
+사용법:
+    python scripts/benchmark_ingestion.py
+    python scripts/benchmark_ingestion.py --days 28 --concurrency 8 --latency-ms 300 --jitter-ms 100
+    python scripts/benchmark_ingestion.py --error-rate 0.05 --drip-rate 0.1 --rounds 3
+    python scripts/benchmark_ingestion.py --database-url "mysql+pymysql://user:pw@localhost:3306/bench_db?charset=utf8mb4"
+
+설명:
+    로컬 대역 서버(fake_upstream.py)를 띄우고 MealFetcher.fetch_and_store_meals를 실행해
+    pages/sec, rows/sec, 단계별(fetch/parse/store) 소요 시간을 측정합니다.
+    한양대 서버에는 요청을 보내지 않습니다.
+    
+    기본 DB는 임시 SQLite 파일입니다. 운영 DB 주소를 넣지 마세요 (테이블을 생성하고 데이터를 씁니다).
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+import logging
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_upstream import FakeUpstreamServer, add_fault_arguments, config_from_arguments
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="급식 수집 파이프라인 벤치마크")
+    parser.add_argument("--database-url", help="벤치마크용 DB 주소 (기본: 임시 SQLite)")
+    parser.add_argument("--port", type=int, default=0, help="대역 서버 포트 (0이면 자동)")
+    parser.add_argument("--days", type=int, default=14, help="수집 기간 (MEAL_FETCH_DAYS_AHEAD)")
+    parser.add_argument("--concurrency", type=int, default=4, help="호스트당 동시 요청 수")
+    parser.add_argument("--rate", type=float, default=1000.0, help="초당 최대 요청 수 (속도 제한)")
+    parser.add_argument("--rounds", type=int, default=1, help="반복 횟수")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="force 없이 실행 (두 번째 라운드부터 변경 없는 페이지는 건너뜀)"
+    )
+    add_fault_arguments(parser)
+    return parser.parse_args()
+
+
+def configure_environment(args: argparse.Namespace, database_url: str):
+    """app 모듈을 import하기 전에 설정을 환경 변수로 덮어쓰기"""
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["MEAL_FETCH_DAYS_AHEAD"] = str(args.days)
+    os.environ["MEAL_FETCH_CONCURRENCY"] = str(args.concurrency)
+    os.environ["UPSTREAM_RATE_PER_SECOND"] = str(args.rate)
+    os.environ["UPSTREAM_RATE_BURST"] = str(max(1, int(args.rate)))
+    os.environ["MEAL_HTML_ARCHIVE_ENABLED"] = "false"
+
+
+def report(round_number: int, summary: dict, elapsed: float, server_stats: dict):
+    timings = summary["timings"]
+    pages = summary["fetched_days"] + summary["skipped_days"]
+    rows = summary["total_saved"]
+    
+    logger.info(f"📊 라운드 {round_number} 결과")
+    logger.info(f"   페이지: {pages}개 (저장 {summary['fetched_days']}, 변경 없음 {summary['skipped_days']}, 실패 {summary['failed_days']})")
+    logger.info(f"   저장 행: {rows}개")
+    logger.info(f"   총 소요: {elapsed:.2f}초")
+    logger.info(f"   pages/sec: {pages / elapsed:.1f}")
+    logger.info(f"   rows/sec: {rows / elapsed:.1f}")
+    logger.info(
+        f"   단계별: fetch {timings['fetch']:.2f}초 (요청 합계) / "
+        f"parse {timings['parse']:.2f}초 / store {timings['store']:.2f}초"
+    )
+    logger.info(f"   대역 서버 통계: {server_stats}")
+
+
+def main():
+    """메인 함수"""
+    args = parse_arguments()
+    
+    temp_dir = None
+    database_url = args.database_url
+    if not database_url:
+        temp_dir = tempfile.TemporaryDirectory(prefix="meal_bench_")
+        database_url = f"sqlite:///{temp_dir.name}/bench.db"
+    
+    configure_environment(args, database_url)
+    
+    from app.core.config import settings
+    from app.db.base import Base
+    from app.db.session import SessionLocal, engine
+    from app.services.meal_fetcher import meal_fetcher
+    from app.models import Restaurant, Meal, MealFetchState, Rating, Keyword, MealKeywordReview, Lease, FetchTask  # noqa: F401
+    
+    server = FakeUpstreamServer(config_from_arguments(args), port=args.port).start()
+    settings.HANYANG_BASE_URL = server.base_url
+    
+    logger.info("=" * 60)
+    logger.info(f"🏁 수집 벤치마크 시작 (대역 서버: {server.base_url})")
+    logger.info(f"   DB: {database_url}")
+    logger.info(f"   식당 {len(settings.RESTAURANT_CODES)}곳 x {args.days + 1}일, 동시 요청 {args.concurrency}")
+    logger.info("=" * 60)
+    
+    Base.metadata.create_all(bind=engine)
+    
+    try:
+        for round_number in range(1, args.rounds + 1):
+            db = SessionLocal()
+            try:
+                started = time.perf_counter()
+                summary = meal_fetcher.fetch_and_store_meals(db, force=not args.incremental)
+                elapsed = time.perf_counter() - started
+            finally:
+                db.close()
+            
+            report(round_number, summary, elapsed, server.stats.snapshot())
+    finally:
+        server.stop()
+        engine.dispose()
+        if temp_dir is not None:
+            temp_dir.cleanup()
+    
+    logger.info("✅ 벤치마크 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+HTMLParser 회귀 검사 및 백엔드별 벤치마크
+
+사용법:
+    python scripts/benchmark_parser.py
+    python scripts/benchmark_parser.py --backends lxml --rounds 50
+    python scripts/benchmark_parser.py --update
+
+설명:
+    scripts/fixtures의 페이지 모음(4개 식당의 평일/연휴/안내 문구/주말 페이지)으로
+    1. 백엔드별 파싱 결과가 저장된 기대값(fixtures/parser_expected.json)과 같은지 확인하고
+    2. 백엔드별 parses/sec, 페이지당 Python 메모리 할당 최대치, 프로세스 RSS 증가량을 측정해
+       저장된 기준값(fixtures/parser_baseline.json)과 비교합니다.
+    
+    결과가 기대값과 다르거나 기준값보다 허용 오차(--tolerance) 이상 느려지거나
+    메모리를 더 쓰면 종료 코드 1을 반환합니다.
+    
+    파서 동작을 의도적으로 바꿨거나 다른 장비에서 기준값을 다시 잡을 때는 --update를 사용하세요.
+    (parses/sec는 장비에 따라 다르므로 기준값은 같은 장비에서 비교해야 의미가 있습니다.)
+    
+    페이지 모음은 실제 응답을 녹화한 것이 아니라 한양대 페이지 구조(마크업, 클래스명,
+    인증 토큰 위치)를 따라 손으로 만든 것입니다. 실제 페이지로 바꿀 때는 p_auth/authToken 값을
+    지우고 같은 경로에 저장한 뒤 --update로 기대값과 기준값을 다시 만드세요.
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict
+import logging
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from parser_corpus import FIXTURES_DIR, iter_fixture_pages
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+EXPECTED_PATH = FIXTURES_DIR / "parser_expected.json"
+BASELINE_PATH = FIXTURES_DIR / "parser_baseline.json"
+
+BACKENDS = ["bs4", "lxml"]
+
+# RSS 증가량 비교 시 무시할 변동 (KiB)
+RSS_NOISE_KIB = 2048
+
+
+def create_parser(backend: str):
+    """대체 경로 없이 지정한 백엔드만 사용하는 HTMLParser"""
+    from app.services.html_backends import LxmlBackend
+    from app.services.html_parser import HTMLParser
+    
+    parser = HTMLParser(backend=backend)
+    if backend == "lxml":
+        parser.backend = LxmlBackend()
+    return parser
+
+
+def max_rss_kib() -> int:
+    """프로세스 최대 RSS (KiB, Linux 기준)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(backend: str, rounds: int, repeat: int) -> Dict:
+    """
+    한 백엔드 측정 (별도 프로세스에서 실행해 RSS가 섞이지 않게 함)
+    
+    Returns:
+        parses_per_sec: 페이지 모음 전체를 rounds번 파싱한 시간 중 가장 빠른 값 기준
+        alloc_peak_kib: 페이지 하나 파싱 중 Python 메모리 할당 최대치 (tracemalloc)
+        rss_growth_kib: 파싱 전후 프로세스 최대 RSS 증가량 (C 라이브러리 할당 포함)
+    """
+    corpus = [html for _, html in iter_fixture_pages()]
+    parser = create_parser(backend)
+    rss_before = max_rss_kib()
+    
+    # 준비 실행 (XPath 컴파일, 정규식 캐시 등)
+    for html in corpus:
+        parser.parse_meal_html(html)
+    
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for html in corpus:
+                parser.parse_meal_html(html)
+        best = min(best, time.perf_counter() - started)
+    
+    tracemalloc.start()
+    alloc_peak = 0
+    for html in corpus:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        parser.parse_meal_html(html)
+        _, peak = tracemalloc.get_traced_memory()
+        alloc_peak = max(alloc_peak, peak - current)
+    tracemalloc.stop()
+    
+    return {
+        "pages": len(corpus),
+        "parses_per_sec": round(len(corpus) * rounds / best, 1),
+        "alloc_peak_kib": round(alloc_peak / 1024, 1),
+        "rss_growth_kib": max_rss_kib() - rss_before
+    }
+
+
+def measure_in_subprocess(backend: str, rounds: int, repeat: int) -> Dict:
+    """백엔드마다 새 프로세스에서 측정 (앞선 측정의 메모리 사용량이 섞이지 않도록)"""
+    completed = subprocess.run(
+        [
+            sys.executable, __file__,
+            "--measure", backend,
+            "--rounds", str(rounds),
+            "--repeat", str(repeat)
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def check_expected(backends, update: bool) -> bool:
+    """파싱 결과가 기대값과 같은지 확인 (update면 bs4 결과로 기대값 저장)"""
+    results = {
+        backend: {name: create_parser(backend).parse_meal_html(html) for name, html in iter_fixture_pages()}
+        for backend in backends
+    }
+    
+    if update:
+        reference = results.get("bs4") or next(iter(results.values()))
+        EXPECTED_PATH.write_text(
+            json.dumps(reference, ensure_ascii=False, indent=2) + "\n",
+            encoding="utf-8"
+        )
+        logger.info(f"💾 기대값 저장: {EXPECTED_PATH}")
+    
+    if not EXPECTED_PATH.exists():
+        logger.error(f"❌ 기대값 파일이 없습니다. --update로 생성하세요: {EXPECTED_PATH}")
+        return False
+    
+    expected = json.loads(EXPECTED_PATH.read_text(encoding="utf-8"))
+    ok = True
+    for backend, outputs in results.items():
+        for name in sorted(set(expected) | set(outputs)):
+            if expected.get(name) != outputs.get(name):
+                ok = False
+                logger.error(f"❌ [{backend}] 결과가 기대값과 다름: {name}")
+                logger.error(f"   기대값: {json.dumps(expected.get(name), ensure_ascii=False)}")
+                logger.error(f"   결과:   {json.dumps(outputs.get(name), ensure_ascii=False)}")
+    
+    if ok:
+        logger.info(f"✅ 파싱 결과 일치 ({len(expected)}개 페이지, 백엔드: {', '.join(results)})")
+    return ok
+
+
+def compare_baseline(backend: str, current: Dict, baseline: Dict, tolerance: float) -> bool:
+    """기준값 대비 성능 저하 확인"""
+    failures = []
+    
+    if current["parses_per_sec"] < baseline["parses_per_sec"] * (1 - tolerance):
+        failures.append(
+            f"parses/sec {current['parses_per_sec']} < 기준 {baseline['parses_per_sec']}"
+        )
+    if current["alloc_peak_kib"] > baseline["alloc_peak_kib"] * (1 + tolerance):
+        failures.append(
+            f"Python 할당 최대치 {current['alloc_peak_kib']}KiB > 기준 {baseline['alloc_peak_kib']}KiB"
+        )
+    if current["rss_growth_kib"] > baseline["rss_growth_kib"] * (1 + tolerance) + RSS_NOISE_KIB:
+        failures.append(
+            f"RSS 증가량 {current['rss_growth_kib']}KiB > 기준 {baseline['rss_growth_kib']}KiB"
+        )
+    
+    for failure in failures:
+        logger.error(f"❌ [{backend}] 성능 저하: {failure}")
+    return not failures
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="HTMLParser 회귀 검사 및 백엔드별 벤치마크")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS, help="측정할 백엔드")
+    parser.add_argument("--rounds", type=int, default=20, help="측정 1회당 페이지 모음 반복 횟수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (가장 빠른 값 사용)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="기준값 대비 허용 오차 (0.25 = 25%%)")
+    parser.add_argument("--update", action="store_true", help="기대값과 기준값을 현재 결과로 갱신")
+    parser.add_argument("--measure", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.measure:
+        # 측정용 하위 프로세스
+        print(json.dumps(measure(args.measure, args.rounds, args.repeat)))
+        return
+    
+    from app.services.html_backends import etree
+    backends = [backend for backend in args.backends if backend != "lxml" or etree is not None]
+    if len(backends) < len(args.backends):
+        logger.warning("⚠️  lxml이 설치되어 있지 않아 lxml 백엔드는 건너뜁니다.")
+    
+    logger.info("=" * 60)
+    logger.info("🧪 HTMLParser 회귀 검사")
+    logger.info("=" * 60)
+    ok = check_expected(backends, args.update)
+    
+    logger.info("=" * 60)
+    logger.info(f"🏁 백엔드별 벤치마크 (반복 {args.rounds}회 x {args.repeat})")
+    logger.info("=" * 60)
+    
+    baseline = {}
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8")).get("backends", {})
+    
+    results = {}
+    for backend in backends:
+        current = measure_in_subprocess(backend, args.rounds, args.repeat)
+        results[backend] = current
+        logger.info(
+            f"📊 [{backend}] {current['parses_per_sec']} parses/sec, "
+            f"Python 할당 최대 {current['alloc_peak_kib']}KiB/페이지, "
+            f"RSS 증가 {current['rss_growth_kib']}KiB ({current['pages']}개 페이지)"
+        )
+        
+        if args.update:
+            continue
+        if backend not in baseline:
+            logger.warning(f"⚠️  [{backend}] 기준값이 없습니다. --update로 생성하세요.")
+            continue
+        ok = compare_baseline(backend, current, baseline[backend], args.tolerance) and ok
+    
+    if args.update:
+        saved = {"backends": {**baseline, **results}}
+        saved["machine"] = f"{platform.machine()} / Python {platform.python_version()}"
+        BASELINE_PATH.write_text(json.dumps(saved, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        logger.info(f"💾 기준값 저장: {BASELINE_PATH}")
+    
+    logger.info("=" * 60)
+    if not ok:
+        logger.error("❌ 회귀 검사 실패")
+        sys.exit(1)
+    logger.info("✅ 회귀 검사 통과")
+
+
+if __name__ == "__main__":
+    main()
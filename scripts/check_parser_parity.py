@@ -0,0 +1,93 @@
+"""
+HTML 파싱 백엔드(lxml / BeautifulSoup) 결과 비교 스크립트
+
+사용법:
+    python scripts/check_parser_parity.py
+    python scripts/check_parser_parity.py --archive
+    python scripts/check_parser_parity.py --files page1.html page2.html
+
+설명:
+    같은 HTML을 두 백엔드로 파싱해 결과가 완전히 같은지 확인합니다.
+    scripts/fixtures 아래의 모든 HTML(날짜 템플릿은 고정 값으로 치환)을 기본 대상으로 하고,
+    --archive를 주면 보관된 원본 HTML(MEAL_HTML_ARCHIVE_DIR)도 함께 비교합니다.
+    
+    결과가 하나라도 다르면 종료 코드 1을 반환합니다.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Iterator, Tuple
+import logging
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from parser_corpus import iter_fixture_pages
+from app.services.html_backends import LxmlBackend, etree
+from app.services.html_parser import HTMLParser
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def iter_corpus(include_archive: bool, files) -> Iterator[Tuple[str, str]]:
+    """(이름, HTML) 목록"""
+    yield from iter_fixture_pages()
+    
+    for path in files or []:
+        yield str(path), Path(path).read_text(encoding="utf-8")
+    
+    if include_archive:
+        from app.services.html_archive import html_archive
+        for restaurant_code, target_date, digest in html_archive.iter_entries():
+            yield f"archive:{restaurant_code}/{target_date}", html_archive.get(digest)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="HTML 파싱 백엔드 결과 비교")
+    parser.add_argument("--archive", action="store_true", help="보관된 원본 HTML도 비교")
+    parser.add_argument("--files", nargs="*", type=Path, help="추가로 비교할 HTML 파일")
+    args = parser.parse_args()
+    
+    if etree is None:
+        logger.error("❌ lxml이 설치되어 있지 않습니다. (pip install -r requirements.txt)")
+        sys.exit(1)
+    
+    soup_parser = HTMLParser(backend="bs4")
+    lxml_parser = HTMLParser(backend="lxml")
+    # 실패 시 BeautifulSoup으로 넘어가는 대체 경로 없이 lxml 결과만 비교
+    lxml_parser.backend = LxmlBackend()
+    
+    checked = 0
+    mismatches = []
+    
+    for name, html in iter_corpus(args.archive, args.files):
+        expected = soup_parser.parse_meal_html(html)
+        actual = lxml_parser.parse_meal_html(html)
+        checked += 1
+        
+        if expected != actual:
+            mismatches.append(name)
+            logger.error(f"❌ 결과 불일치: {name}")
+            logger.error(f"   bs4:  {json.dumps(expected, ensure_ascii=False)}")
+            logger.error(f"   lxml: {json.dumps(actual, ensure_ascii=False)}")
+    
+    logger.info("=" * 60)
+    if mismatches:
+        logger.error(f"❌ {checked}개 중 {len(mismatches)}개 불일치")
+        sys.exit(1)
+    
+    logger.info(f"✅ {checked}개 모두 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+한양대 급식 페이지(foodView_WAR_foodportlet) 로컬 대역 서버
+
+사용법:
+    python scripts/fake_upstream.py
+    python scripts/fake_upstream.py --port 8765 --latency-ms 300 --jitter-ms 100 --error-rate 0.05
+    python scripts/fake_upstream.py --drip-rate 0.1 --drip-bytes-per-sec 2048 --etag
+
+설명:
+    한양대 서버 대신 저장된 HTML fixture를 식당/날짜별로 돌려주는 서버입니다.
+    응답 지연, 오류율, 느린 전송(slow-drip)을 설정할 수 있어
+    한양대 서버에 부하를 주지 않고 MealFetcher 벤치마크와 부하 테스트를 할 수 있습니다.
+    
+    서버 실행 후 .env의 HANYANG_BASE_URL을 http://127.0.0.1:8765 로 설정하세요.
+
+Fixture 검색 순서:
+    1. {fixtures}/{식당코드}/{YYYY-MM-DD}.html  (특정 날짜 고정 페이지)
+    2. {fixtures}/{식당코드}.html              (날짜 템플릿, __DATE__ / __DAY_OF_WEEK__ / __AUTH_TOKEN__ 치환)
+"""
+
+import argparse
+import hashlib
+import logging
+import random
+import secrets
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_FIXTURES_DIR = Path(__file__).parent / "fixtures" / "pages"
+
+DAY_NAMES = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
+
+
+class FakeUpstreamConfig:
+    """대역 서버 동작 설정"""
+    
+    def __init__(
+        self,
+        fixtures_dir: Path = DEFAULT_FIXTURES_DIR,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0.0,
+        hang_rate: float = 0.0,
+        hang_seconds: float = 30.0,
+        drip_rate: float = 0.0,
+        drip_bytes_per_sec: int = 4096,
+        etag: bool = False,
+        seed: Optional[int] = None
+    ):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.drip_rate = drip_rate
+        self.drip_bytes_per_sec = max(1, drip_bytes_per_sec)
+        self.etag = etag
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+    
+    def roll(self, rate: float) -> bool:
+        with self.random_lock:
+            return self.random.random() < rate
+    
+    def delay(self) -> float:
+        with self.random_lock:
+            jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+
+class FakeUpstreamStats:
+    """요청 통계 (스레드 안전)"""
+    
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def incr(self, name: str):
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+    
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+
+def render_page(
+    fixtures_dir: Path,
+    restaurant_code: str,
+    target_date: date,
+    auth_token: Optional[str] = None
+) -> Optional[str]:
+    """
+    식당/날짜에 해당하는 fixture HTML (없으면 None)
+    
+    auth_token을 생략하면 실제 서버처럼 요청마다 다른 토큰을 넣습니다.
+    """
+    fixed_path = fixtures_dir / restaurant_code / f"{target_date.isoformat()}.html"
+    if fixed_path.exists():
+        return fixed_path.read_text(encoding="utf-8")
+    
+    template_path = fixtures_dir / f"{restaurant_code}.html"
+    if not template_path.exists():
+        return None
+    
+    return (
+        template_path.read_text(encoding="utf-8")
+        .replace("__DATE__", target_date.strftime("%Y. %m. %d"))
+        .replace("__DAY_OF_WEEK__", DAY_NAMES[target_date.weekday()])
+        .replace("__AUTH_TOKEN__", secrets.token_hex(4) if auth_token is None else auth_token)
+    )
+
+
+class FakeUpstreamHandler(BaseHTTPRequestHandler):
+    """GET /web/www/{식당코드}?..._sFoodDateYear=&_sFoodDateMonth=(0부터)&_sFoodDateDay="""
+    
+    config: FakeUpstreamConfig = None
+    stats: FakeUpstreamStats = None
+    protocol_version = "HTTP/1.1"
+    
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+    
+    def do_GET(self):
+        self.stats.incr("requests")
+        parsed = urlparse(self.path)
+        parts = parsed.path.strip("/").split("/")
+        
+        if len(parts) != 3 or parts[:2] != ["web", "www"]:
+            return self._send(404, b"not found")
+        
+        query = parse_qs(parsed.query)
+        try:
+            target_date = date(
+                int(query["_foodView_WAR_foodportlet_sFoodDateYear"][0]),
+                int(query["_foodView_WAR_foodportlet_sFoodDateMonth"][0]) + 1,
+                int(query["_foodView_WAR_foodportlet_sFoodDateDay"][0])
+            )
+        except (KeyError, ValueError):
+            return self._send(400, b"bad date")
+        
+        time.sleep(self.config.delay())
+        
+        if self.config.roll(self.config.hang_rate):
+            # 응답하지 않는 서버 흉내 (클라이언트 타임아웃 확인용)
+            self.stats.incr("hung")
+            time.sleep(self.config.hang_seconds)
+            self.close_connection = True
+            return
+        
+        if self.config.roll(self.config.error_rate):
+            self.stats.incr("errors")
+            return self._send(503, b"service unavailable")
+        
+        html = render_page(self.config.fixtures_dir, parts[2], target_date)
+        if html is None:
+            return self._send(404, b"no fixture")
+        
+        body = html.encode("utf-8")
+        headers = {"Content-Type": "text/html; charset=UTF-8"}
+        
+        if self.config.etag:
+            # 휘발성 토큰을 뺀 내용 기준 ETag
+            stable = render_page(self.config.fixtures_dir, parts[2], target_date, auth_token="")
+            etag = '"' + hashlib.sha1(stable.encode("utf-8")).hexdigest() + '"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                self.stats.incr("not_modified")
+                return self._send(304, b"", headers={"ETag": etag})
+        
+        if self.config.roll(self.config.drip_rate):
+            self.stats.incr("dripped")
+            return self._send(200, body, headers=headers, drip=True)
+        
+        self.stats.incr("ok")
+        return self._send(200, body, headers=headers)
+    
+    def _send(self, status: int, body: bytes, headers: Dict[str, str] = None, drip: bool = False):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        
+        if not drip:
+            self.wfile.write(body)
+            return
+        
+        # 느린 전송: 0.1초마다 drip_bytes_per_sec / 10 바이트씩
+        chunk_size = max(1, self.config.drip_bytes_per_sec // 10)
+        for start in range(0, len(body), chunk_size):
+            self.wfile.write(body[start:start + chunk_size])
+            self.wfile.flush()
+            time.sleep(0.1)
+
+
+class FakeUpstreamServer:
+    """대역 서버 (백그라운드 스레드 실행 지원)"""
+    
+    def __init__(self, config: FakeUpstreamConfig, host: str = "127.0.0.1", port: int = 8765):
+        self.config = config
+        self.stats = FakeUpstreamStats()
+        handler = type(
+            "ConfiguredFakeUpstreamHandler",
+            (FakeUpstreamHandler,),
+            {"config": config, "stats": self.stats}
+        )
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        """백그라운드 스레드에서 실행"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+    
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser):
+    """지연/장애 주입 인자 (benchmark_ingestion.py와 공유)"""
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES_DIR, help="fixture 디렉터리")
+    parser.add_argument("--latency-ms", type=float, default=0, help="평균 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="응답 지연 편차 (ms, ±)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="응답하지 않는 요청 비율 (0~1)")
+    parser.add_argument("--hang-seconds", type=float, default=30.0, help="응답하지 않는 시간 (초)")
+    parser.add_argument("--drip-rate", type=float, default=0.0, help="느린 전송 응답 비율 (0~1)")
+    parser.add_argument("--drip-bytes-per-sec", type=int, default=4096, help="느린 전송 속도 (bytes/s)")
+    parser.add_argument("--etag", action="store_true", help="ETag / 304 응답 사용")
+    parser.add_argument("--seed", type=int, help="난수 시드 (재현용)")
+
+
+def config_from_arguments(args: argparse.Namespace) -> FakeUpstreamConfig:
+    return FakeUpstreamConfig(
+        fixtures_dir=args.fixtures,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+        drip_rate=args.drip_rate,
+        drip_bytes_per_sec=args.drip_bytes_per_sec,
+        etag=args.etag,
+        seed=args.seed
+    )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="한양대 급식 페이지 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩 주소")
+    parser.add_argument("--port", type=int, default=8765, help="포트")
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+    
+    server = FakeUpstreamServer(config_from_arguments(args), args.host, args.port)
+    logger.info(f"🧪 대역 서버 시작: {server.base_url} (fixture: {args.fixtures})")
+    logger.info(f"   .env에 HANYANG_BASE_URL={server.base_url} 설정 후 사용하세요.")
+    
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info(f"\n종료. 요청 통계: {server.stats.snapshot()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,27 @@
 사용법:
     python scripts/fetch_meals.py 2025 9
     python scripts/fetch_meals.py 2024 12
+    python scripts/fetch_meals.py 2025 9 --workers 4
 
 설명:
     지정한 연도와 월의 모든 급식 데이터를 한양대 서버에서 가져와 DB에 저장합니다.
     이미 존재하는 데이터는 업데이트됩니다.
+    
+    --workers를 주면 HTML 파싱을 별도 프로세스들에서 병렬로 실행합니다.
+    수집/파싱 결과는 크기가 제한된 큐를 거쳐 메인 스레드 하나가 순서대로 저장합니다.
 """
 
+import argparse
+import multiprocessing
+import queue
 import sys
 import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import date, timedelta
 from calendar import monthrange
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
 
 # 프로젝트 루트 경로 추가
@@ -22,10 +32,12 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from app.db.session import SessionLocal
-from app.services.meal_service import MealService
+from app.services.meal_service import meal_service
+from app.services.meal_fetcher import meal_fetcher
+from app.services.db_lease import meal_fetch_lease
 from app.core.config import settings
 from app.crud import meal as crud_meal
-from app.services.html_parser import HTMLParser
+from app.services.parse_pool import parse_meal_html_compact
 from app.models import Meal, Restaurant, Rating, Keyword, MealKeywordReview
 
 # 로깅 설정
@@ -35,21 +47,138 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# store_meal_data 결과 -> 통계 항목
+STATS_KEYS = {"inserted": "saved", "updated": "updated", "unchanged": "unchanged", "deleted": "deleted"}
+
+
+def iter_parsed_pages(
+    targets: List[Tuple[str, date]],
+    workers: int = 0,
+    queue_size: Optional[int] = None,
+    fetch_concurrency: Optional[int] = None
+) -> Iterator[Tuple[str, date, Future]]:
+    """
+    (식당 코드, 날짜, 파싱 결과 Future)를 targets 순서대로 반환
+    
+    - 수집: fetch_concurrency개 스레드 (생략시 MEAL_FETCH_CONCURRENCY)
+    - 파싱: workers개 프로세스 (0이면 수집 스레드에서 바로 파싱)
+    - 수집/파싱 중인 페이지는 최대 queue_size개 (저장이 밀리면 수집도 멈춤)
+    """
+    fetch_concurrency = fetch_concurrency or settings.MEAL_FETCH_CONCURRENCY
+    queue_size = queue_size or max(4, workers * 4, fetch_concurrency * 2)
+    pending: "queue.Queue[Optional[Tuple[str, date, Future]]]" = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    
+    parse_executor = None
+    if workers > 0:
+        parse_executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    fetch_executor = ThreadPoolExecutor(
+        max_workers=fetch_concurrency,
+        thread_name_prefix="backfill-fetch"
+    )
+    
+    def fetch_and_parse(restaurant_code: str, target_date: date) -> Dict:
+        html_content = meal_service.get_meal_html(
+            restaurant_code,
+            target_date.year,
+            target_date.month,
+            target_date.day
+        )
+        if parse_executor is None:
+            return parse_meal_html_compact(html_content)
+        return parse_executor.submit(parse_meal_html_compact, html_content).result()
+    
+    def produce():
+        try:
+            for restaurant_code, target_date in targets:
+                future = fetch_executor.submit(fetch_and_parse, restaurant_code, target_date)
+                while not stop.is_set():
+                    try:
+                        pending.put((restaurant_code, target_date, future), timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    future.cancel()
+                    return
+        finally:
+            pending.put(None)
+    
+    producer = threading.Thread(target=produce, name="backfill-producer", daemon=True)
+    producer.start()
+    
+    try:
+        while True:
+            item = pending.get()
+            if item is None:
+                break
+            yield item
+    finally:
+        stop.set()
+        # 생산자가 put에서 막혀 있지 않도록 비움
+        while producer.is_alive():
+            try:
+                pending.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        fetch_executor.shutdown(wait=True, cancel_futures=True)
+        if parse_executor is not None:
+            parse_executor.shutdown(wait=True, cancel_futures=True)
+
+
+def store_day(
+    db,
+    restaurant,
+    current_date: date,
+    meal_data: Dict,
+    stats: dict,
+    restaurant_stats: dict
+) -> bool:
+    """
+    하루치 파싱 결과 저장 (단일 writer)
+    
+    메뉴 내용(메뉴명 + 태그)으로 기존 메뉴와 짝지어 생성/갱신/삭제합니다. (MealFetcher.store_meal_data)
+    
+    Returns:
+        저장 성공 여부
+    """
+    try:
+        counts = meal_fetcher.store_meal_data(db, restaurant, current_date, meal_data)
+    except Exception as e:
+        logger.error(f"   ❌ 메뉴 저장 실패: {e}")
+        restaurant_stats["errors"] += 1
+        stats["total_errors"] += 1
+        return False
+    
+    for count_key, stats_key in STATS_KEYS.items():
+        restaurant_stats[stats_key] += counts[count_key]
+        stats[f"total_{stats_key}"] += counts[count_key]
+    
+    # 해당 날짜 처리 결과 출력
+    if counts["inserted"] or counts["updated"] or counts["deleted"]:
+        logger.info(
+            f"   ✓ 신규 {counts['inserted']}개, 업데이트 {counts['updated']}개, "
+            f"변경 없음 {counts['unchanged']}개, 삭제 {counts['deleted']}개"
+        )
+    return True
+
 
-def fetch_meals_for_month(year: int, month: int) -> dict:
+def fetch_meals_for_month(year: int, month: int, workers: int = 0) -> dict:
     """
     특정 연도/월의 전체 급식 데이터 수집
     
     Args:
         year: 연도 (예: 2025)
         month: 월 (1-12)
+        workers: 파싱 프로세스 수 (0이면 프로세스 풀 없이 수집 스레드에서 파싱)
     
     Returns:
         수집 결과 통계 딕셔너리
     """
     db = SessionLocal()
-    meal_service = MealService()
-    html_parser = HTMLParser()
     
     # 해당 월의 마지막 날짜 계산
     _, last_day = monthrange(year, month)
@@ -60,139 +189,69 @@ def fetch_meals_for_month(year: int, month: int) -> dict:
     logger.info(f"📅 {year}년 {month}월 급식 정보 수집 시작")
     logger.info("=" * 70)
     logger.info(f"수집 기간: {start_date} ~ {end_date} (총 {last_day}일)")
+    if workers > 0:
+        logger.info(f"파싱 프로세스: {workers}개")
     logger.info("")
     
     # 통계 변수
     stats = {
         "total_saved": 0,
         "total_updated": 0,
+        "total_unchanged": 0,
+        "total_deleted": 0,
         "total_errors": 0,
         "restaurants": {}
     }
     
     try:
-        # 모든 식당에 대해 반복
+        # 식당 정보 가져오기 또는 생성
+        restaurants = {}
         for restaurant_code, restaurant_name in settings.RESTAURANT_CODES.items():
-            logger.info(f"\n{'=' * 70}")
-            logger.info(f"🍽️  [{restaurant_name}] 데이터 수집 시작")
-            logger.info(f"{'=' * 70}")
-            
-            restaurant_saved = 0
-            restaurant_updated = 0
-            restaurant_errors = 0
-            
             try:
-                # 식당 정보 가져오기 또는 생성
-                restaurant = crud_meal.get_or_create_restaurant(
+                restaurants[restaurant_code] = crud_meal.get_or_create_restaurant(
                     db, restaurant_code, restaurant_name
                 )
+                stats["restaurants"][restaurant_name] = {"saved": 0, "updated": 0, "unchanged": 0, "deleted": 0, "errors": 0}
+            except Exception as e:
+                logger.error(f"\n❌ [{restaurant_name}] 오류 발생: {e}")
+                stats["total_errors"] += 1
+        
+        # 식당별로 날짜 순서대로 수집 (수집/파싱은 병렬, 저장은 이 스레드에서 순서대로)
+        targets = [
+            (restaurant_code, start_date + timedelta(days=offset))
+            for restaurant_code in restaurants
+            for offset in range(last_day)
+        ]
+        
+        current_code = None
+        for restaurant_code, current_date, future in iter_parsed_pages(targets, workers):
+            if meal_fetch_lease.lost:
+                # 락 갱신에 실패해 다른 서버/프로세스가 가져갔으므로 더 저장하지 않음
+                logger.error("\n❌ 수집 락을 잃어 중단합니다 (다른 서버 또는 스크립트가 수집 중).")
+                stats["total_errors"] += 1
+                break
+            
+            restaurant = restaurants[restaurant_code]
+            restaurant_stats = stats["restaurants"][restaurant.name]
+            
+            if restaurant_code != current_code:
+                current_code = restaurant_code
+                logger.info(f"\n{'=' * 70}")
+                logger.info(f"🍽️  [{restaurant.name}] 데이터 수집 시작")
+                logger.info(f"{'=' * 70}")
+            
+            try:
+                day_name = current_date.strftime('%A')
+                logger.info(f"📆 {current_date.strftime('%Y-%m-%d')} ({day_name})")
                 
-                # 날짜별로 데이터 수집
-                current_date = start_date
-                while current_date <= end_date:
-                    try:
-                        day_name = current_date.strftime('%A')
-                        logger.info(f"📆 {current_date.strftime('%Y-%m-%d')} ({day_name})")
-                        
-                        # 한양대 서버에서 HTML 가져오기
-                        html_content = meal_service.get_meal_html(
-                            restaurant_code,
-                            current_date.year,
-                            current_date.month,
-                            current_date.day
-                        )
-                        
-                        # HTML 파싱
-                        meal_data = html_parser.parse_meal_html(html_content)
-                        
-                        # 각 식사 종류별로 저장
-                        day_saved = 0
-                        day_updated = 0
-                        
-                        for meal_type in ["조식", "중식", "석식"]:
-                            meals = meal_data.get(meal_type, [])
-                            
-                            if not meals:
-                                continue
-                            
-                            for meal_item in meals:
-                                try:
-                                    # 중복 체크
-                                    new_korean = (
-                                        meal_item["korean"] 
-                                        if isinstance(meal_item["korean"], list) 
-                                        else [meal_item["korean"]]
-                                    )
-                                    
-                                    existing = db.query(Meal).filter(
-                                        Meal.restaurant_id == restaurant.id,
-                                        Meal.date == current_date,
-                                        Meal.meal_type == meal_type,
-                                        Meal.korean_name == new_korean
-                                    ).first()
-                                    
-                                    # 중복이 없으면 새로운 메뉴 생성, 있으면 업데이트
-                                    if not existing:
-                                        crud_meal.create_meal(
-                                            db=db,
-                                            restaurant_id=restaurant.id,
-                                            date=current_date,
-                                            day_of_week=meal_data.get("day_of_week", ""),
-                                            meal_type=meal_type,
-                                            korean_name=meal_item["korean"],
-                                            tags=meal_item.get("tags", []),
-                                            price=meal_item.get("price", ""),
-                                            image_url=meal_item.get("image", "")
-                                        )
-                                        day_saved += 1
-                                        restaurant_saved += 1
-                                        stats["total_saved"] += 1
-                                    else:
-                                        # 기존 메뉴 정보 업데이트
-                                        existing.tags = meal_item.get("tags", [])
-                                        existing.price = meal_item.get("price", "")
-                                        existing.image_url = meal_item.get("image", "")
-                                        existing.day_of_week = meal_data.get("day_of_week", "")
-                                        db.commit()
-                                        day_updated += 1
-                                        restaurant_updated += 1
-                                        stats["total_updated"] += 1
-                                
-                                except Exception as e:
-                                    logger.error(f"   ❌ 메뉴 저장 실패: {e}")
-                                    logger.debug(f"   메뉴 데이터: {meal_item}")
-                                    restaurant_errors += 1
-                                    stats["total_errors"] += 1
-                        
-                        # 해당 날짜 처리 결과 출력
-                        if day_saved > 0 or day_updated > 0:
-                            logger.info(f"   ✓ 신규 {day_saved}개, 업데이트 {day_updated}개")
-                    
-                    except Exception as e:
-                        logger.error(f"   ❌ 날짜 {current_date} 처리 실패: {e}")
-                        restaurant_errors += 1
-                        stats["total_errors"] += 1
-                    
-                    current_date += timedelta(days=1)
-                
-                # 식당별 통계 저장
-                stats["restaurants"][restaurant_name] = {
-                    "saved": restaurant_saved,
-                    "updated": restaurant_updated,
-                    "errors": restaurant_errors
-                }
-                
-                logger.info(f"\n✅ [{restaurant_name}] 완료")
-                logger.info(f"   신규: {restaurant_saved}개")
-                logger.info(f"   업데이트: {restaurant_updated}개")
-                if restaurant_errors > 0:
-                    logger.warning(f"   오류: {restaurant_errors}개")
+                meal_data = future.result()
+                store_day(db, restaurant, current_date, meal_data, stats, restaurant_stats)
             
             except Exception as e:
-                logger.error(f"\n❌ [{restaurant_name}] 오류 발생: {e}")
+                db.rollback()
+                logger.error(f"   ❌ 날짜 {current_date} 처리 실패: {e}")
+                restaurant_stats["errors"] += 1
                 stats["total_errors"] += 1
-                import traceback
-                logger.debug(traceback.format_exc())
         
         # 최종 통계 출력
         logger.info("\n" + "=" * 70)
@@ -201,6 +260,8 @@ def fetch_meals_for_month(year: int, month: int) -> dict:
         logger.info(f"\n📊 전체 통계:")
         logger.info(f"   총 신규 저장: {stats['total_saved']}개")
         logger.info(f"   총 업데이트: {stats['total_updated']}개")
+        logger.info(f"   총 변경 없음: {stats['total_unchanged']}개")
+        logger.info(f"   총 삭제: {stats['total_deleted']}개")
         logger.info(f"   총 오류: {stats['total_errors']}개")
         
         if stats["restaurants"]:
@@ -209,6 +270,9 @@ def fetch_meals_for_month(year: int, month: int) -> dict:
                 logger.info(f"   [{restaurant_name}]")
                 logger.info(f"      신규: {restaurant_stats['saved']}개")
                 logger.info(f"      업데이트: {restaurant_stats['updated']}개")
+                logger.info(f"      변경 없음: {restaurant_stats['unchanged']}개")
+                if restaurant_stats['deleted'] > 0:
+                    logger.info(f"      삭제: {restaurant_stats['deleted']}개")
                 if restaurant_stats['errors'] > 0:
                     logger.info(f"      오류: {restaurant_stats['errors']}개")
         
@@ -247,25 +311,43 @@ def validate_arguments(year: int, month: int) -> bool:
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="특정 연도/월의 급식 데이터 수집")
+    parser.add_argument("year", nargs="?", help="연도 (예: 2025)")
+    parser.add_argument("month", nargs="?", help="월 (1-12)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="HTML 파싱 프로세스 수 (0이면 프로세스 풀 사용 안 함)"
+    )
+    parser.add_argument(
+        "--lock-wait",
+        type=float,
+        default=0,
+        help="서버 또는 다른 스크립트의 수집이 진행 중일 때 기다릴 시간 (초, 0이면 바로 종료)"
+    )
+    args = parser.parse_args()
+    
     # 사용법 출력
-    if len(sys.argv) != 3:
+    if args.year is None or args.month is None:
         logger.info("=" * 70)
         logger.info("📖 급식 데이터 수집 스크립트")
         logger.info("=" * 70)
         logger.info("\n사용법:")
-        logger.info("   python scripts/fetch_meals.py [연도] [월]")
+        logger.info("   python scripts/fetch_meals.py [연도] [월] [--workers N]")
         logger.info("\n예제:")
         logger.info("   python scripts/fetch_meals.py 2025 9")
         logger.info("   python scripts/fetch_meals.py 2024 12")
+        logger.info("   python scripts/fetch_meals.py 2025 9 --workers 4")
         logger.info("")
         sys.exit(1)
     
     # 인자 파싱
     try:
-        year = int(sys.argv[1])
-        month = int(sys.argv[2])
+        year = int(args.year)
+        month = int(args.month)
     except ValueError:
-        logger.error(f"❌ 잘못된 형식: {sys.argv[1]} {sys.argv[2]}")
+        logger.error(f"❌ 잘못된 형식: {args.year} {args.month}")
         logger.info("   연도와 월은 정수여야 합니다.")
         logger.info("   예: python scripts/fetch_meals.py 2025 9")
         sys.exit(1)
@@ -274,9 +356,18 @@ def main():
     if not validate_arguments(year, month):
         sys.exit(1)
     
+    # 수집 락 획득 (서버의 스케줄러/수집 작업, 다른 스크립트와 동시에 실행하지 않음)
+    if not meal_fetch_lease.acquire(timeout=args.lock_wait):
+        logger.error("❌ 다른 급식 정보 수집(서버 또는 다른 스크립트)이 진행 중입니다.")
+        logger.info("   잠시 후 다시 실행하거나 --lock-wait로 기다리세요.")
+        sys.exit(1)
+    
     # 데이터 수집 실행
     logger.info(f"\n🚀 {year}년 {month}월 데이터 수집을 시작합니다...\n")
-    stats = fetch_meals_for_month(year, month)
+    try:
+        stats = fetch_meals_for_month(year, month, workers=max(0, args.workers))
+    finally:
+        meal_fetch_lease.release()
     
     # 종료 코드 결정
     if stats["total_errors"] > 0:
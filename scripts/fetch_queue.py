@@ -0,0 +1,135 @@
+"""
+분산 수집 작업 큐 관리
+
+사용법:
+    python scripts/fetch_queue.py enqueue 2024 --restaurants re11 re12
+    python scripts/fetch_queue.py enqueue 2025-03-01:2025-03-07 --force
+    python scripts/fetch_queue.py work
+    python scripts/fetch_queue.py work --until-empty --concurrency 8 --rate 8
+    python scripts/fetch_queue.py stats
+
+설명:
+    enqueue: 기간(backfill_meals.py와 같은 START[:END] 형식)의 (식당, 날짜)를 fetch_tasks 큐에 등록합니다.
+             이미 대기 중인 작업은 그대로 두고, 끝난 작업은 다시 대기 상태로 돌립니다.
+    work:    이 프로세스를 큐 워커로 실행합니다. 여러 서버에서 동시에 실행하면 작업을 나눠 처리하며,
+             워커가 중간에 죽어도 가져간 작업은 FETCH_QUEUE_VISIBILITY_SECONDS 후 다른 워커가 다시 처리합니다.
+             --until-empty를 주면 다른 워커가 처리 중이거나 재시도를 기다리는 작업까지 모두 끝났을 때 종료합니다.
+    stats:   상태별 작업 수를 출력합니다.
+    
+    FETCH_QUEUE_ENABLED=true인 API 서버는 모든 프로세스가 워커를 실행하므로 work 없이 enqueue만 해도 처리됩니다.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+import logging
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from backfill_meals import expand_dates, parse_range
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="분산 수집 작업 큐 관리")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    enqueue = commands.add_parser("enqueue", help="기간의 (식당, 날짜)를 큐에 등록")
+    enqueue.add_argument("ranges", nargs="+", type=parse_range, help="수집 기간 START[:END] (YYYY, YYYY-MM, YYYY-MM-DD)")
+    enqueue.add_argument("--restaurants", nargs="+", help="식당 코드 (생략시 전체)")
+    enqueue.add_argument("--force", action="store_true", help="변경 여부와 관계없이 다시 파싱/저장")
+    
+    work = commands.add_parser("work", help="큐 워커 실행")
+    work.add_argument("--until-empty", action="store_true", help="큐가 비면 종료")
+    work.add_argument("--batch-size", type=int, help="한 번에 가져갈 작업 수 (생략시 FETCH_QUEUE_BATCH_SIZE)")
+    work.add_argument("--concurrency", type=int, help="동시 요청 수 (생략시 MEAL_FETCH_CONCURRENCY)")
+    work.add_argument("--rate", type=float, help="초당 최대 요청 수 (생략시 UPSTREAM_RATE_PER_SECOND)")
+    
+    commands.add_parser("stats", help="상태별 작업 수 출력")
+    return parser.parse_args()
+
+
+def configure_environment(args: argparse.Namespace):
+    """app 모듈을 import하기 전에 설정을 환경 변수로 덮어쓰기"""
+    if getattr(args, "concurrency", None):
+        os.environ["MEAL_FETCH_CONCURRENCY"] = str(args.concurrency)
+    if getattr(args, "rate", None):
+        os.environ["UPSTREAM_RATE_PER_SECOND"] = str(args.rate)
+        os.environ["UPSTREAM_RATE_BURST"] = str(max(1, int(args.rate)))
+
+
+def log_stats(db):
+    from app.crud import fetch_task as crud_fetch_task
+    
+    stats = crud_fetch_task.get_fetch_queue_stats(db)
+    logger.info(
+        f"📊 대기 {stats['pending']}, 처리 중 {stats['claimed']}, "
+        f"완료 {stats['done']}, 실패 {stats['failed']}"
+    )
+    if stats["oldest_pending_created_at"]:
+        logger.info(f"   가장 오래된 미완료 작업 등록 시간: {stats['oldest_pending_created_at']}")
+
+
+def main():
+    """메인 함수"""
+    args = parse_arguments()
+    configure_environment(args)
+    
+    from app.core.config import settings
+    from app.crud import fetch_task as crud_fetch_task
+    from app.db.base import Base
+    from app.db.session import SessionLocal, engine
+    from app.models import FetchTask  # noqa: F401
+    
+    Base.metadata.create_all(bind=engine, tables=[FetchTask.__table__])
+    db = SessionLocal()
+    
+    try:
+        if args.command == "enqueue":
+            unknown = [code for code in args.restaurants or [] if code not in settings.RESTAURANT_CODES]
+            if unknown:
+                logger.error(f"❌ 알 수 없는 식당 코드: {unknown} (사용 가능: {list(settings.RESTAURANT_CODES)})")
+                sys.exit(1)
+            
+            codes = args.restaurants or list(settings.RESTAURANT_CODES)
+            dates = expand_dates(args.ranges)
+            targets = [(code, target_date) for target_date in dates for code in codes]
+            counts = crud_fetch_task.enqueue_fetch_tasks(db, targets, force=args.force, source="cli")
+            logger.info(
+                f"✅ {len(targets)}개 등록: 신규 {counts['created']}, 재등록 {counts['requeued']}, "
+                f"이미 대기 중 {counts['already_queued']}"
+            )
+            log_stats(db)
+        
+        elif args.command == "work":
+            from app.services.fetch_queue import FetchQueueWorker
+            
+            worker = FetchQueueWorker(batch_size=args.batch_size)
+            logger.info(f"🚀 큐 워커 시작 (배치 {worker.batch_size}건, PID {os.getpid()})")
+            try:
+                worker.run(stop_when_empty=args.until_empty)
+            except KeyboardInterrupt:
+                logger.warning("⏸️  중단되었습니다. 처리 중이던 작업은 타임아웃 후 다른 워커가 다시 처리합니다.")
+                sys.exit(130)
+            logger.info(f"✅ 워커 종료: 완료 {worker.processed}건, 실패 {worker.failed}건")
+            log_stats(db)
+        
+        else:
+            log_stats(db)
+    
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+meals.content_hash 마이그레이션 스크립트
+
+사용법:
+    python scripts/migrate_meal_content_hash.py --dry-run
+    python scripts/migrate_meal_content_hash.py
+    python scripts/migrate_meal_content_hash.py --batch-size 5000
+
+설명:
+    메뉴 중복 판별을 JSON 컬럼(korean_name) 비교 대신 인덱스된 내용 해시로 하도록
+    기존 meals 테이블을 바꿉니다. 여러 번 실행해도 안전합니다.
+    
+    1. content_hash 컬럼 추가 (없으면)
+    2. 해시가 비어 있는 행 채우기 (batch-size개씩 커밋)
+    3. 같은 (식당, 날짜, 식사 종류, 해시) 중복 정리 (가장 최근 행만 남김, 평점/키워드 리뷰 포함 batch-size개씩 삭제)
+    4. 기존 unique_meal 제약 삭제, unique_meal_content 인덱스 생성
+    5. (MySQL) content_hash를 NOT NULL로 변경
+    
+    --dry-run을 주면 채울 행 수와 삭제될 중복 수만 출력합니다.
+    새로 만드는 DB(setup_db.py)는 이 스크립트가 필요 없습니다.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+import logging
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import Index, bindparam, func, inspect, select, text, update
+
+from app.db.session import SessionLocal, engine
+from app.crud import meal as crud_meal
+from app.models import Meal, Restaurant, Rating, Keyword, MealKeywordReview
+from app.utils.meal_content import meal_content_hash
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+OLD_CONSTRAINT = "unique_meal"
+NEW_CONSTRAINT = "unique_meal_content"
+
+
+def add_column():
+    """content_hash 컬럼 추가 (없으면)"""
+    columns = {column["name"] for column in inspect(engine).get_columns("meals")}
+    if "content_hash" in columns:
+        logger.info("✓ content_hash 컬럼이 이미 있습니다.")
+        return
+    
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE meals ADD COLUMN content_hash VARCHAR(64) NULL"))
+    logger.info("✅ content_hash 컬럼 추가")
+
+
+def backfill(db, batch_size: int, dry_run: bool) -> int:
+    """해시가 비어 있는 행 채우기"""
+    missing = db.query(func.count(Meal.id)).filter(Meal.content_hash.is_(None)).scalar()
+    if dry_run or not missing:
+        logger.info(f"📊 해시를 채울 행: {missing}개")
+        return missing
+    
+    table = Meal.__table__
+    stmt = update(table).where(table.c.id == bindparam("meal_id")).values(content_hash=bindparam("hash"))
+    filled = 0
+    
+    while True:
+        rows = db.execute(
+            select(table.c.id, table.c.korean_name, table.c.tags)
+            .where(table.c.content_hash.is_(None))
+            .order_by(table.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        
+        db.execute(stmt, [
+            {"meal_id": meal_id, "hash": meal_content_hash(korean_name, tags)}
+            for meal_id, korean_name, tags in rows
+        ])
+        db.commit()
+        filled += len(rows)
+        logger.info(f"   ✓ {filled}/{missing}개 채움")
+    
+    logger.info(f"✅ 해시 채우기 완료 ({filled}개)")
+    return filled
+
+
+def remove_duplicates(db, dry_run: bool, batch_size: int) -> int:
+    """같은 (식당, 날짜, 식사 종류, 해시) 중 가장 최근 행만 남김"""
+    duplicates = crud_meal.count_duplicate_meals(db)
+    
+    if dry_run or not duplicates["duplicates"]:
+        logger.info(f"📊 삭제할 중복 행: {duplicates['duplicates']}개 ({duplicates['groups']}개 메뉴)")
+        return duplicates["duplicates"]
+    
+    deleted = crud_meal.delete_duplicate_meals(db, chunk_size=batch_size)
+    logger.info(f"✅ 중복 {deleted}개 삭제 ({duplicates['groups']}개 메뉴)")
+    return deleted
+
+
+def replace_constraint():
+    """unique_meal(JSON 포함) 제약을 unique_meal_content 인덱스로 교체"""
+    inspector = inspect(engine)
+    names = {index["name"] for index in inspector.get_indexes("meals")}
+    names |= {constraint["name"] for constraint in inspector.get_unique_constraints("meals")}
+    
+    if OLD_CONSTRAINT in names:
+        if engine.dialect.name == "mysql":
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE meals DROP INDEX {OLD_CONSTRAINT}"))
+            logger.info(f"✅ {OLD_CONSTRAINT} 제약 삭제")
+        else:
+            logger.warning(f"⚠️  {engine.dialect.name}에서는 {OLD_CONSTRAINT} 제약을 직접 삭제해야 합니다.")
+    
+    if NEW_CONSTRAINT in names:
+        logger.info(f"✓ {NEW_CONSTRAINT} 인덱스가 이미 있습니다.")
+    else:
+        table = Meal.__table__
+        Index(
+            NEW_CONSTRAINT,
+            table.c.restaurant_id, table.c.date, table.c.meal_type, table.c.content_hash,
+            unique=True
+        ).create(bind=engine)
+        logger.info(f"✅ {NEW_CONSTRAINT} 인덱스 생성")
+    
+    if engine.dialect.name == "mysql":
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE meals MODIFY content_hash VARCHAR(64) NOT NULL "
+                "COMMENT '메뉴 내용 해시 (메뉴명 + 태그, 중복 판별용)'"
+            ))
+        logger.info("✅ content_hash NOT NULL 변경")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="meals.content_hash 마이그레이션")
+    parser.add_argument("--batch-size", type=int, default=1000, help="해시 채우기/중복 삭제 커밋 단위")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 대상 수만 출력")
+    args = parser.parse_args()
+    
+    logger.info("=" * 60)
+    logger.info(f"🔧 meals.content_hash 마이그레이션{' (dry-run)' if args.dry_run else ''}")
+    logger.info("=" * 60)
+    
+    if args.dry_run:
+        columns = {column["name"] for column in inspect(engine).get_columns("meals")}
+        if "content_hash" not in columns:
+            with engine.connect() as conn:
+                total = conn.execute(select(func.count()).select_from(Meal.__table__)).scalar()
+            logger.info(f"📊 content_hash 컬럼 없음, 해시를 채울 행: {total}개 (중복 수는 컬럼 추가 후 확인 가능)")
+            return
+    else:
+        add_column()
+    
+    db = SessionLocal()
+    try:
+        backfill(db, args.batch_size, args.dry_run)
+        if args.dry_run and db.query(Meal.id).filter(Meal.content_hash.is_(None)).first():
+            logger.info("📊 중복 수는 해시를 채운 뒤 확인할 수 있습니다.")
+            return
+        remove_duplicates(db, args.dry_run, args.batch_size)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ 마이그레이션 실패: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+    
+    if args.dry_run:
+        return
+    
+    try:
+        replace_constraint()
+    except Exception as e:
+        logger.error(f"❌ 제약 변경 실패: {e}")
+        sys.exit(1)
+    
+    logger.info("=" * 60)
+    logger.info("🎉 마이그레이션 완료")
+
+
+if __name__ == "__main__":
+    main()
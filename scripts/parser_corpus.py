@@ -0,0 +1,37 @@
+"""
+HTML 파서 비교/벤치마크용 페이지 모음
+
+scripts/fixtures 아래의 모든 HTML을 (이름, HTML)로 읽습니다.
+페이지는 한양대 페이지 구조를 따라 손으로 만든 것입니다 (실제 응답 녹화 아님).
+날짜 템플릿(fake_upstream.render_page의 자리표시자)은 고정 값으로 치환합니다.
+    
+    pages/{식당코드}.html               평일 (날짜 템플릿)
+    pages/{식당코드}/2025-10-06.html    추석 연휴
+    pages/{식당코드}/2025-09-12.html    안내 문구만 있는 날
+    pages/{식당코드}/2025-09-13.html    주말
+    parity/*.html                       파서 경계 사례
+"""
+
+from pathlib import Path
+from typing import Iterator, Tuple
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# 날짜 템플릿 고정 값
+TEMPLATE_VALUES = {
+    "__DATE__": "2025. 09. 15",
+    "__DAY_OF_WEEK__": "월요일",
+    "__AUTH_TOKEN__": "parity"
+}
+
+
+def fill_template(html: str) -> str:
+    for placeholder, value in TEMPLATE_VALUES.items():
+        html = html.replace(placeholder, value)
+    return html
+
+
+def iter_fixture_pages() -> Iterator[Tuple[str, str]]:
+    """(fixtures 기준 상대 경로, HTML) 목록 (경로순)"""
+    for path in sorted(FIXTURES_DIR.rglob("*.html")):
+        yield path.relative_to(FIXTURES_DIR).as_posix(), fill_template(path.read_text(encoding="utf-8"))
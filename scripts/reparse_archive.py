@@ -0,0 +1,87 @@
+"""
+보관된 원본 HTML로 급식 데이터 재구성 스크립트
+
+사용법:
+    python scripts/reparse_archive.py
+    python scripts/reparse_archive.py --start 2025-09-01 --end 2025-09-30
+    python scripts/reparse_archive.py --start 2025-01-01 --restaurants re11 re12
+
+설명:
+    수집 시 보관된 원본 HTML(MEAL_HTML_ARCHIVE_DIR)을 다시 파싱하여 meals 테이블에 반영합니다.
+    한양대 서버에 요청하지 않으므로 파서 수정 후 과거 데이터를 빠르게 재구성할 수 있습니다.
+"""
+
+import sys
+import argparse
+from datetime import date
+from pathlib import Path
+import logging
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db.session import SessionLocal
+from app.core.config import settings
+from app.services.meal_fetcher import meal_fetcher
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_arguments() -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="보관된 원본 HTML로 급식 데이터 재구성")
+    parser.add_argument("--start", type=date.fromisoformat, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="종료 날짜 (YYYY-MM-DD)")
+    parser.add_argument(
+        "--restaurants",
+        nargs="+",
+        choices=list(settings.RESTAURANT_CODES.keys()),
+        help="식당 코드 (생략시 전체)"
+    )
+    return parser.parse_args()
+
+
+def main():
+    """메인 함수"""
+    args = parse_arguments()
+    
+    if args.start and args.end and args.start > args.end:
+        logger.error(f"❌ 시작 날짜가 종료 날짜보다 늦습니다: {args.start} > {args.end}")
+        sys.exit(1)
+    
+    logger.info(f"\n🚀 보관 HTML 재파싱을 시작합니다... ({settings.MEAL_HTML_ARCHIVE_DIR})\n")
+    
+    db = SessionLocal()
+    try:
+        summary = meal_fetcher.reparse_from_archive(
+            db, args.start, args.end, args.restaurants
+        )
+    finally:
+        db.close()
+    
+    if summary["busy"]:
+        logger.error("❌ 다른 급식 정보 수집(서버 또는 다른 스크립트)이 진행 중입니다. 잠시 후 다시 실행하세요.")
+        sys.exit(1)
+    
+    logger.info(f"📊 재파싱 {summary['reparsed_days']}일, 저장 {summary['total_saved']}개, 실패 {summary['failed_days']}일")
+    logger.info(
+        f"   생성 {summary['inserted']}개, 갱신 {summary['updated']}개, "
+        f"변경 없음 {summary['unchanged']}개, 삭제 {summary['deleted']}개"
+    )
+    
+    if summary["failed_days"] > 0:
+        logger.warning(f"⚠️  경고: {summary['failed_days']}일 처리에 실패했습니다.")
+        sys.exit(1)
+    
+    logger.info("✅ 모든 작업이 성공적으로 완료되었습니다!")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,7 @@ sys.path.insert(0, str(project_root))
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from app.db.base import Base
-from app.models import Restaurant, Meal, Rating, Keyword, MealKeywordReview
+from app.models import Restaurant, Meal, Rating, Keyword, MealKeywordReview, MealFetchState, Lease, FetchTask
 from app.core.config import settings
 
 
@@ -145,7 +145,7 @@ def setup_env():
     
     # 급식 수집 설정
     meal_fetch_days = get_input("수집할 일수 (현재부터)", default="14")
-    meal_fetch_schedule = get_input("자동 수집 스케줄 (cron)", default="0 2 * * *")
+    meal_fetch_budget = get_input("자동 수집 하루 최대 요청 수", default="200")
     
     print()
     print("=" * 70)
@@ -156,7 +156,7 @@ def setup_env():
     for i, key in enumerate(api_keys, 1):
         print(f"  #{i}: {key}")
     print(f"수집 일수: {meal_fetch_days}일")
-    print(f"수집 스케줄: {meal_fetch_schedule}")
+    print(f"하루 최대 요청 수: {meal_fetch_budget}")
     print()
     
     if not get_yes_no("이 설정으로 .env 파일을 생성하시겠습니까?", default=True):
@@ -173,7 +173,7 @@ ADMIN_API_KEYS={','.join(api_keys)}
 
 # 급식 데이터 수집 설정
 MEAL_FETCH_DAYS_AHEAD={meal_fetch_days}
-MEAL_FETCH_SCHEDULE={meal_fetch_schedule}
+MEAL_FETCH_DAILY_BUDGET={meal_fetch_budget}
 
 # CORS 설정 (선택사항)
 # BACKEND_CORS_ORIGINS=["http://localhost:3000","https://yourdomain.com"]
@@ -0,0 +1,18 @@
+"""
+테스트 공통 설정
+
+실행:
+    python -m pytest tests
+"""
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 테스트는 실제 DB에 연결하지 않음 (설정 로드 전에 지정)
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+FIXTURES_DIR = PROJECT_ROOT / "scripts" / "fixtures" / "pages"
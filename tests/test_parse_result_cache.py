@@ -0,0 +1,62 @@
+"""
+파싱 결과 캐시 키 테스트
+
+한양대 페이지는 요청마다 스크립트/주석/링크의 인증 토큰이 바뀌므로,
+토큰만 다른 같은 페이지는 캐시를 공유해야 합니다.
+"""
+import asyncio
+from datetime import date
+
+from conftest import FIXTURES_DIR
+from app.services.html_parser import HTMLParser
+from app.services.parse_pool import ParsePool
+from app.services.parse_result_cache import ParseResultCache, parse_result_cache
+from app.utils.html_digest import compute_content_hash
+
+
+def _render(auth_token: str) -> str:
+    """fake_upstream과 같은 방식으로 fixture 템플릿에 토큰을 넣은 페이지"""
+    return (
+        (FIXTURES_DIR / "re11.html").read_text(encoding="utf-8")
+        .replace("__DATE__", date(2025, 3, 4).strftime("%Y. %m. %d"))
+        .replace("__DAY_OF_WEEK__", "화")
+        .replace("__AUTH_TOKEN__", auth_token)
+    )
+
+
+def test_token_only_difference_shares_key():
+    first = _render("a1b2c3d4")
+    second = _render("e5f6a7b8")
+    
+    assert first != second
+    assert compute_content_hash(first) == compute_content_hash(second)
+
+
+def test_get_or_parse_hits_for_token_only_difference():
+    cache = ParseResultCache(max_entries=8)
+    parser = HTMLParser()
+    
+    first = cache.get_or_parse(_render("a1b2c3d4"), parser.parse_meal_html)
+    second = cache.get_or_parse(_render("e5f6a7b8"), parser.parse_meal_html)
+    
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_parse_pool_hits_for_token_only_difference():
+    parse_result_cache.clear()
+    hits, misses = parse_result_cache.hits, parse_result_cache.misses
+    pool = ParsePool(max_workers=0)
+    
+    async def parse_twice():
+        await pool.parse(_render("a1b2c3d4"))
+        return await pool.parse(_render("e5f6a7b8"))
+    
+    try:
+        result = asyncio.run(parse_twice())
+    finally:
+        pool.shutdown()
+    
+    assert result["중식"]
+    assert parse_result_cache.hits - hits == 1
+    assert parse_result_cache.misses - misses == 1
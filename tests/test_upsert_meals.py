@@ -0,0 +1,86 @@
+"""
+메뉴 다중 행 upsert 테스트 (SQLite)
+
+방언별 upsert 문(ON CONFLICT)과 그 밖의 DB용 조회 후 갱신/삽입이 같은 결과를 내야 합니다.
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.models  # noqa: F401 (모든 모델을 메타데이터에 등록)
+from app.crud import meal as crud_meal
+from app.db.base import Base
+from app.models.meal import Meal
+from app.models.restaurant import Restaurant
+from app.utils.meal_content import meal_content_hash
+
+TARGET_DATE = date(2025, 3, 4)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add(Restaurant(id=1, code="re11", name="교직원식당"))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _row(korean_name, price, meal_id=None):
+    """upsert_meals에 넘기는 행 (_upsert_meals_generic은 upsert_meals가 채운 content_hash까지 받음)"""
+    return {
+        "id": meal_id,
+        "restaurant_id": 1,
+        "date": TARGET_DATE,
+        "meal_type": "중식",
+        "day_of_week": "화",
+        "korean_name": korean_name,
+        "tags": [],
+        "price": price,
+        "image_url": "",
+        "content_hash": meal_content_hash(korean_name, [])
+    }
+
+
+def _saved(db):
+    return sorted(
+        (meal.id, meal.korean_name[0], meal.price)
+        for meal in db.query(Meal).filter(Meal.date == TARGET_DATE)
+    )
+
+
+@pytest.mark.parametrize("upsert", [crud_meal.upsert_meals, crud_meal._upsert_meals_generic])
+def test_upsert_updates_by_id_and_inserts_new(db, upsert):
+    crud_meal.upsert_meals(db, [_row(["김치찌개"], "5,000원"), _row(["돈까스"], "6,000원")])
+    db.commit()
+    kimchi_id, pork_id = [meal_id for meal_id, _, _ in _saved(db)]
+    
+    upsert(db, [
+        _row(["김치찌개"], "5,500원", meal_id=kimchi_id),
+        _row(["돈까스"], "6,000원", meal_id=pork_id),
+        _row(["비빔밥"], "5,000원")
+    ])
+    db.commit()
+    
+    saved = _saved(db)
+    assert saved[:2] == [(kimchi_id, "김치찌개", "5,500원"), (pork_id, "돈까스", "6,000원")]
+    assert [name for _, name, _ in saved[2:]] == ["비빔밥"]
+
+
+def test_generic_upsert_matches_existing_content_without_id(db):
+    crud_meal.upsert_meals(db, [_row(["김치찌개"], "5,000원")])
+    db.commit()
+    [(kimchi_id, _, _)] = _saved(db)
+    
+    crud_meal._upsert_meals_generic(db, [_row(["김치찌개"], "5,500원")])
+    db.commit()
+    
+    assert _saved(db) == [(kimchi_id, "김치찌개", "5,500원")]
+
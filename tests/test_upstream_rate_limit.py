@@ -0,0 +1,78 @@
+"""
+속도 제한 대기 초과와 서킷 브레이커 테스트
+
+토큰 버킷이 바닥나 대기 시간이 초과된 것은 이 프로세스의 요청 과다이므로
+한양대 서버 서킷을 열거나 half-open 시험 요청을 소모하면 안 됩니다.
+"""
+import asyncio
+import time
+from urllib.parse import urlparse
+
+import pytest
+
+from app.core.config import settings
+from app.services import meal_service as meal_service_module
+from app.services.meal_service import MealService
+from app.utils.resilience import AdaptiveTokenBucket, CircuitBreaker, RateLimitWaitTimeout
+
+
+class _UnreachableTransport:
+    """토큰이 없으므로 요청이 나가면 안 됨"""
+    
+    def get(self, *args, **kwargs):
+        raise AssertionError("속도 제한 대기 중에 요청을 보냈습니다.")
+
+
+@pytest.fixture
+def starved_guard(monkeypatch):
+    """토큰이 없고 거의 채워지지 않는 속도 제한기와 새 서킷 브레이커"""
+    limiter = AdaptiveTokenBucket(rate=0.001, burst=1)
+    limiter.tokens = 0.0
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0)
+    
+    host = urlparse(settings.HANYANG_BASE_URL).netloc
+    monkeypatch.setitem(meal_service_module._host_guards, host, (limiter, breaker))
+    monkeypatch.setattr(settings, "UPSTREAM_RATE_WAIT_TIMEOUT", 0.01)
+    return breaker
+
+
+def test_rate_limit_timeout_keeps_circuit_closed(starved_guard):
+    service = MealService(transport=_UnreachableTransport())
+    
+    for _ in range(starved_guard.failure_threshold + 1):
+        with pytest.raises(RateLimitWaitTimeout):
+            service.get_meal_page("re11", 2025, 3, 4)
+    
+    snapshot = starved_guard.snapshot()
+    assert snapshot["state"] == CircuitBreaker.CLOSED
+    assert snapshot["consecutive_failures"] == 0
+    assert snapshot["total_failures"] == 0
+
+
+def test_rate_limit_timeout_releases_half_open_probe(starved_guard):
+    service = MealService(transport=_UnreachableTransport())
+    starved_guard.state = CircuitBreaker.OPEN
+    starved_guard.opened_at = time.monotonic() - starved_guard.reset_timeout
+    
+    # 첫 호출이 시험 요청을 가져가고, 반납했으면 다음 호출도 서킷에 막히지 않음
+    for _ in range(2):
+        with pytest.raises(RateLimitWaitTimeout):
+            service.get_meal_page("re11", 2025, 3, 4)
+    
+    assert starved_guard.state == CircuitBreaker.HALF_OPEN
+    assert starved_guard.total_failures == 0
+    assert starved_guard.total_rejected == 0
+
+
+def test_rate_limit_timeout_keeps_circuit_closed_async(starved_guard):
+    service = MealService(transport=_UnreachableTransport())
+    
+    async def fetch_repeatedly():
+        for _ in range(starved_guard.failure_threshold + 1):
+            with pytest.raises(RateLimitWaitTimeout):
+                await service.get_meal_html_async("re11", 2025, 3, 4)
+    
+    asyncio.run(fetch_repeatedly())
+    
+    assert starved_guard.state == CircuitBreaker.CLOSED
+    assert starved_guard.total_failures == 0